@@ -6,12 +6,13 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class ModelConfig:
-    """LLM configuration entry."""
+    """LLM configuration entry (immutable and hashable, so it can key caches)."""
 
     name: str
     use_rag: bool
@@ -42,8 +43,8 @@ MEDGEMMA_LARGE_API_MODE = os.getenv("CAM_MODEL_MEDGEMMA_LARGE_API_MODE")
 MEDGEMMA_LARGE_ENDPOINT = os.getenv("CAM_MODEL_MEDGEMMA_LARGE_ENDPOINT")
 MEDGEMMA_LARGE_AUTH_ENV_VAR = os.getenv("CAM_MODEL_MEDGEMMA_LARGE_AUTH_ENV_VAR")
 
-# Scenario identifiers aligned with stakeholder brief
-SCENARIOS = {
+# Scenario identifiers aligned with stakeholder brief (read-only; copy to customise)
+SCENARIOS: Mapping[str, ModelConfig] = MappingProxyType({
     "A": ModelConfig(name=GEMMA_BASE, use_rag=False),
     "B": ModelConfig(
         name=GEMMA_BASE, use_rag=True, embed_model="sentence-transformers/all-MiniLM-L6-v2"
@@ -78,6 +79,6 @@ SCENARIOS = {
         endpoint=MEDGEMMA_LARGE_ENDPOINT,
         auth_env_var=MEDGEMMA_LARGE_AUTH_ENV_VAR,
     ),
-}
+})
 
 __all__ = ["ModelConfig", "SCENARIOS"]
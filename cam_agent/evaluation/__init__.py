@@ -2,7 +2,7 @@
 Evaluation package exposing CAM scenario runners and utilities.
 """
 
-from .config import Scenario, default_scenarios
+from .config import Scenario, default_scenarios, load_questions
 from .judges import (
     BaseJudge,
     GeminiJudge,
@@ -26,4 +26,5 @@ __all__ = [
     "GeminiJudge",
     "build_default_judges",
     "default_scenarios",
+    "load_questions",
 ]
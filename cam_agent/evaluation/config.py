@@ -11,7 +11,7 @@ from typing import Dict, List, Optional
 from cam_agent.config.models import ModelConfig, SCENARIOS
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class Scenario:
     """Single evaluation scenario combining CAM and model settings."""
 
@@ -34,19 +34,28 @@ def default_scenarios(store_dir: Path) -> Dict[str, Scenario]:
     }
 
 
+_SCENARIO_LABELS = {
+    "A": "gemma3-4B (no RAG)",
+    "B": "gemma3-4B + RAG",
+    "C": "medgemma3-4B (no RAG)",
+    "D": "medgemma3-4B + RAG",
+    "E": "medgemma3-27B (no RAG)",
+    "F": "medgemma3-27B + RAG",
+}
+
+
 def describe_scenario(scenario_id: str, use_rag: bool) -> str:
-    label = {
-        "A": "gemma3-4B (no RAG)",
-        "B": "gemma3-4B + RAG",
-        "C": "medgemma3-4B (no RAG)",
-        "D": "medgemma3-4B + RAG",
-        "E": "medgemma3-27B (no RAG)",
-        "F": "medgemma3-27B + RAG",
-    }.get(scenario_id, scenario_id)
+    label = _SCENARIO_LABELS.get(scenario_id, scenario_id)
     if use_rag and "RAG" not in label:
         label += " + RAG"
     return label
 
 
-__all__ = ["Scenario", "default_scenarios"]
+def load_questions(path: Path) -> List[str]:
+    """Read one question per line, skipping blank lines, without materialising the whole file."""
+    with path.open("r", encoding="utf-8", buffering=1 << 20) as handle:
+        return [question for question in (line.strip() for line in handle) if question]
+
+
+__all__ = ["Scenario", "default_scenarios", "load_questions"]
 
@@ -237,6 +237,7 @@ class CAMSuiteRunner:
             store_dir=store_dir,
             audit_log_path=audit_log_path,
             scenarios={sid: sc.model_config for sid, sc in scenario_map.items()},
+            async_audit=True,
         )
         self.resume_cache = resume_cache or {}
         self.run_started_at = datetime.now(timezone.utc)
@@ -264,6 +265,24 @@ class CAMSuiteRunner:
                 "run_started_at": self.run_started_at.isoformat(),
             }
 
+            scenario_cache = self.resume_cache.get(scenario_id, {})
+            # Batch retrieval for every question that will reach the LLM in this scenario.
+            pending_questions = list(dict.fromkeys(q for q in self.questions if not scenario_cache.get(q)))
+            prefetch_charge_ms: Dict[str, float] = {}
+            prefetch_start = time.perf_counter()
+            try:
+                self.agent.get_executor(scenario_id).prefetch(pending_questions)
+            except Exception as exc:  # pragma: no cover - resilience
+                print(
+                    f"[scenario {scenario_id}] Batched retrieval failed ({exc}); retrieving per question",
+                    flush=True,
+                )
+            else:
+                if pending_questions:
+                    # Charge each question an equal share of the batch so latency_ms still covers retrieval.
+                    share_ms = (time.perf_counter() - prefetch_start) * 1000.0 / len(pending_questions)
+                    prefetch_charge_ms = dict.fromkeys(pending_questions, share_ms)
+
             for idx, question in enumerate(self.questions, start=1):
                 print(f"[scenario {scenario_id}] Question {idx}/{total_questions} …", flush=True)
 
@@ -329,6 +348,7 @@ class CAMSuiteRunner:
                     "run_started_at": self.run_started_at.isoformat(),
                 }
 
+                retrieval_share_ms = prefetch_charge_ms.pop(question, 0.0)
                 start = time.perf_counter()
                 try:
                     response = self.agent.handle_request(
@@ -337,7 +357,7 @@ class CAMSuiteRunner:
                         metadata=base_metadata,
                     )
                 except Exception as exc:  # pragma: no cover - resilience
-                    latency_ms = (time.perf_counter() - start) * 1000.0
+                    latency_ms = (time.perf_counter() - start) * 1000.0 + retrieval_share_ms
                     error_message = str(exc)
                     print(
                         f"[scenario {scenario_id}]  ↳ error: {error_message}",
@@ -367,7 +387,7 @@ class CAMSuiteRunner:
                     )
                     continue
 
-                latency_ms = (time.perf_counter() - start) * 1000.0
+                latency_ms = (time.perf_counter() - start) * 1000.0 + retrieval_share_ms
 
                 update_compliance_counts(metric, response.action)
                 record_latency(metric, latency_ms)
@@ -483,6 +503,7 @@ class CAMSuiteRunner:
                 print(f"[scenario {scenario_id}] Completed.", flush=True)
             metrics_summary[scenario_id] = metric.as_dict()
 
+        self.agent.audit_logger.flush()
         return {
             "runs": runs,
             "metrics": metrics_summary,
@@ -501,7 +522,7 @@ class CAMSuiteRunner:
         def _backup_existing(path: Optional[Path]) -> None:
             if not path or not path.exists():
                 return
-            timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+            timestamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
             backup = path.with_name(f"{path.stem}_{timestamp}{path.suffix}")
             path.replace(backup)
 
@@ -528,6 +549,8 @@ class CAMSuiteRunner:
                 "questions": self.questions,
                 "runs": json_runs,
             }
+            # Stdlib json on purpose: orjson would reformat floats (1e-05 -> 0.00001),
+            # write NaN scores as null and reject >64-bit ints in this results file.
             json_path.write_text(
                 json.dumps(json_payload, ensure_ascii=False, indent=2),
                 encoding="utf-8",
@@ -9,21 +9,29 @@ from .pipeline import (
     ChunkRecord,
     DigestResult,
     IngestionResult,
+    build_ann_index,
     build_faiss_index,
     build_store,
     chunk_documents,
+    digest_is_current,
     ensure_documents,
     generate_digest,
+    quantize_store,
+    refresh_store,
 )
 
 __all__ = [
     "ChunkRecord",
     "DigestResult",
     "IngestionResult",
+    "build_ann_index",
     "build_faiss_index",
     "build_store",
     "chunk_documents",
+    "digest_is_current",
     "ensure_documents",
     "generate_digest",
+    "quantize_store",
+    "refresh_store",
 ]
 
@@ -8,19 +8,31 @@ assemble a long-form digest suitable for judge prompts.
 
 from __future__ import annotations
 
-import json
+import hashlib
 import os
 import subprocess
 import textwrap
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import partial
+from itertools import chain
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 import faiss
 import numpy as np
 from sentence_transformers import SentenceTransformer
 
+from cam_agent.services.encoders import load_encoder
 from cam_agent.services.models import ensure_ollama_endpoint
+from cam_agent.services.retrieval import (
+    CHUNK_BIAS_FILENAME,
+    SCALAR_QUANTIZERS,
+    chunk_bias_flags,
+    quantize_flat_index,
+)
+from cam_agent.utils import jsonio
+from cam_agent.utils.checksum import compute_directory_checksums, verify_checksums
 from cam_agent.utils.sources import make_label, short_title
 
 try:
@@ -31,6 +43,11 @@ except ImportError:  # pragma: no cover - dependency hint
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 
+# Per-PDF checksums and build settings of the last store refresh.
+INGEST_CHECKSUMS_FILENAME = "ingest_checksums.json"
+# Bump when the digest prompt or layout changes so existing digests are regenerated.
+DIGEST_VERSION = 1
+
 
 @dataclass(slots=True)
 class IngestionResult:
@@ -121,10 +138,10 @@ def extract_pdf_text(pdf_path: Path) -> List[str]:
         reader = PdfReader(str(pdf_path))
     except Exception as exc:
         raise RuntimeError(f"Failed to read PDF {pdf_path.name}: {exc}") from exc
-    pages: List[str] = []
-    for page in reader.pages:
-        pages.append(page.extract_text() or "")
-    return pages
+    # Pages are extracted serially: pypdf is pure Python and holds the GIL, and
+    # PdfReader's shared stream is not thread-safe. Parallelism belongs at the
+    # document level (separate processes) instead.
+    return [page.extract_text() or "" for page in reader.pages]
 
 
 def clean_text(text: str) -> str:
@@ -173,46 +190,76 @@ def chunk_text(
     return chunks
 
 
+def _chunk_one(
+    doc: Path,
+    *,
+    chunk_size_words: int,
+    overlap_words: int,
+) -> Optional[List[ChunkRecord]]:
+    """Chunk a single PDF; returns None when its text cannot be extracted."""
+    print(f"[kb] Chunking {doc.name}", flush=True)
+    try:
+        pages = extract_pdf_text(doc)
+    except RuntimeError as exc:
+        print(f"[kb] Warning: skipping {doc.name} — {exc}", flush=True)
+        return None
+    paragraphs = []
+    for page in pages:
+        cleaned = clean_text(page)
+        if cleaned:
+            paragraphs.extend([p.strip() for p in cleaned.split("\n\n") if p.strip()])
+    chunks = chunk_text(paragraphs, chunk_size_words=chunk_size_words, overlap_words=overlap_words)
+    title = short_title(doc.name)
+    records: List[ChunkRecord] = []
+    for idx, (chunk, word_start, word_end) in enumerate(chunks, start=1):
+        label = make_label(title, chunk)
+        metadata = {
+            "source_title": title,
+            "label": label,
+            "word_start": word_start,
+            "word_end": word_end,
+        }
+        records.append(
+            ChunkRecord(
+                chunk_id=f"{doc.name}::chunk-{idx}",
+                path=str(doc),
+                text=chunk,
+                metadata=metadata,
+            )
+        )
+    return records
+
+
 def chunk_documents(
     documents: Iterable[Path],
     *,
     chunk_size_words: int = 280,
     overlap_words: int = 60,
+    max_workers: Optional[int] = None,
 ) -> List[ChunkRecord]:
-    """Convert PDFs into chunk records ready for embedding."""
+    """
+    Convert PDFs into chunk records ready for embedding.
+
+    Documents are parsed in a process pool (one task per PDF) unless there is
+    only one, `max_workers` is 1, or `CAM_CHUNK_PARALLEL=0`; records keep
+    document order either way.
+    """
+    documents = list(documents)
+    chunk_one = partial(_chunk_one, chunk_size_words=chunk_size_words, overlap_words=overlap_words)
+    workers = max_workers or min(len(documents), os.cpu_count() or 1)
+    if workers < 2 or os.getenv("CAM_CHUNK_PARALLEL", "1") == "0":
+        results = map(chunk_one, documents)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(chunk_one, documents))
+
     records: List[ChunkRecord] = []
     skipped: List[Path] = []
-    for doc in documents:
-        print(f"[kb] Chunking {doc.name}")
-        try:
-            pages = extract_pdf_text(doc)
-        except RuntimeError as exc:
-            print(f"[kb] Warning: skipping {doc.name} — {exc}")
+    for doc, doc_records in zip(documents, results):
+        if doc_records is None:
             skipped.append(doc)
-            continue
-        paragraphs = []
-        for i, page in enumerate(pages, start=1):
-            cleaned = clean_text(page)
-            if cleaned:
-                paragraphs.extend([p.strip() for p in cleaned.split("\n\n") if p.strip()])
-        chunks = chunk_text(paragraphs, chunk_size_words=chunk_size_words, overlap_words=overlap_words)
-        for idx, (chunk, word_start, word_end) in enumerate(chunks, start=1):
-            title = short_title(doc.name)
-            label = make_label(title, chunk)
-            metadata = {
-                "source_title": title,
-                "label": label,
-                "word_start": word_start,
-                "word_end": word_end,
-            }
-            records.append(
-                ChunkRecord(
-                    chunk_id=f"{doc.name}::chunk-{idx}",
-                    path=str(doc),
-                    text=chunk,
-                    metadata=metadata,
-                )
-            )
+        else:
+            records.extend(doc_records)
     if skipped:
         print("[kb] Skipped documents:")
         for doc in skipped:
@@ -220,20 +267,159 @@ def chunk_documents(
     return records
 
 
+def _load_passage_encoder(embed_model: str):
+    model = load_encoder(embed_model, SentenceTransformer)
+    device = getattr(model, "device", None)
+    if isinstance(model, SentenceTransformer) and getattr(device, "type", None) == "cuda":
+        # Normalised vectors are stored as float32 either way; fp16 doubles GPU throughput.
+        model.half()
+    return model
+
+
 def build_faiss_index(
     chunks: Sequence[ChunkRecord],
     *,
     embed_model: str = "sentence-transformers/all-MiniLM-L6-v2",
+    embeddings_path: Optional[Path] = None,
+    batch_size: Optional[int] = None,
+    index_type: str = "flat",
+    quantization: str = "none",
+    reuse: Optional[Mapping[str, np.ndarray]] = None,
 ) -> Tuple[faiss.Index, np.ndarray]:
-    """Embed chunks and return FAISS index along with embedding matrix."""
-    model = SentenceTransformer(embed_model)
+    """
+    Embed chunks and return FAISS index along with embedding matrix.
+
+    When `embeddings_path` is given, batches are written straight into a
+    `.npy` memmap at that path so the full matrix never has to be resident
+    alongside the copy FAISS keeps. `index_type` other than "flat" is passed
+    to `build_ann_index`; `quantization` ("none", "fp16", "int8") stores
+    scalar-quantised codes instead of float32 vectors. `reuse` maps chunk
+    text to an already-computed vector; only the remaining chunks are encoded.
+    `batch_size` (default `CAM_EMBED_BATCH` or 256) is the encoder batch; a
+    SentenceTransformer on CUDA runs in half precision.
+    """
     texts = [record.text for record in chunks]
-    embeddings = model.encode(texts, normalize_embeddings=True)
-    embeddings = embeddings.astype("float32")
+    if not texts:
+        raise ValueError("No chunks to embed.")
+    reuse = reuse or {}
+    pending = [row for row, text in enumerate(texts) if text not in reuse]
+    if reuse:
+        print(f"[kb] Reusing {len(texts) - len(pending)} stored embeddings; encoding {len(pending)} chunks")
+    batch_size = batch_size or int(os.getenv("CAM_EMBED_BATCH", "256"))
+    # Each encode call covers several batches so SentenceTransformer's length sorting cuts
+    # padding, while bounding how much is held at once for very large corpora.
+    window = batch_size * 16
+    # Skip loading the encoder entirely when every vector is reused.
+    model = _load_passage_encoder(embed_model) if pending else None
+    batches = (
+        (
+            rows,
+            np.asarray(
+                model.encode([texts[row] for row in rows], batch_size=batch_size, normalize_embeddings=True),
+                dtype="float32",
+            ),
+        )
+        for rows in (pending[start : start + window] for start in range(0, len(pending), window))
+    )
+    first = next(batches, None)
+    dim = first[1].shape[1] if first is not None else len(next(iter(reuse.values())))
+    if embeddings_path is None:
+        embeddings = np.empty((len(texts), dim), dtype="float32")
+    else:
+        embeddings_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write beside the target and swap in after the flush, so a reader that has
+        # embeddings.npy mapped never sees it truncated and a failed build leaves it intact.
+        tmp_embeddings_path = embeddings_path.with_name(embeddings_path.name + ".tmp")
+        embeddings = np.lib.format.open_memmap(
+            tmp_embeddings_path,
+            mode="w+",
+            dtype="float32",
+            shape=(len(texts), dim),
+        )
+    if reuse:
+        for row, text in enumerate(texts):
+            vector = reuse.get(text)
+            if vector is not None:
+                embeddings[row] = vector
+    if first is not None:
+        for rows, batch in chain([first], batches):
+            embeddings[rows] = batch
+    if embeddings_path is not None:
+        embeddings.flush()
+        os.replace(tmp_embeddings_path, embeddings_path)
+
+    if index_type != "flat":
+        return build_ann_index(embeddings, kind=index_type, quantization=quantization), embeddings
 
     index = faiss.IndexFlatIP(embeddings.shape[1])
     index.add(embeddings)
-    return index, embeddings
+    return quantize_flat_index(index, quantization), embeddings
+
+
+def build_ann_index(
+    embeddings: np.ndarray,
+    *,
+    kind: str = "auto",
+    hnsw_m: int = 32,
+    ef_construction: int = 200,
+    ef_search: int = 64,
+    ivfpq_threshold: int = 100_000,
+    ivf_nprobe: int = 16,
+    quantization: str = "none",
+) -> faiss.Index:
+    """
+    Build an approximate inner-product index over normalised embeddings.
+
+    `kind` is "hnsw", "ivf", "ivfpq", or "auto" (HNSW up to `ivfpq_threshold`
+    vectors, IVF-PQ beyond it where the HNSW graph's memory dominates).
+    "ivf" keeps exact vectors in ~4·sqrt(N) inverted lists and scans
+    `ivf_nprobe` of them per query. Search-time knobs (`efSearch`, `nprobe`)
+    are persisted with the index. `quantization` ("fp16", "int8") stores
+    HNSW/IVF vectors as scalar-quantised codes; IVF-PQ is already
+    product-quantised and ignores it.
+    """
+    if kind not in {"auto", "hnsw", "ivf", "ivfpq"}:
+        raise ValueError(f"Unsupported ANN index kind '{kind}'. Expected 'auto', 'hnsw', 'ivf', or 'ivfpq'.")
+    if quantization != "none" and quantization not in SCALAR_QUANTIZERS:
+        raise ValueError(f"Unsupported quantization '{quantization}'. Expected 'none', 'fp16', or 'int8'.")
+    vectors = np.ascontiguousarray(embeddings, dtype="float32")
+    count, dim = vectors.shape
+    if kind == "auto":
+        kind = "ivfpq" if count > ivfpq_threshold else "hnsw"
+
+    if kind == "hnsw" and quantization != "none":
+        index = faiss.IndexHNSWSQ(dim, SCALAR_QUANTIZERS[quantization], hnsw_m, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = ef_construction
+        index.hnsw.efSearch = ef_search
+        index.train(vectors)
+    elif kind == "hnsw":
+        index = faiss.IndexHNSWFlat(dim, hnsw_m, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = ef_construction
+        index.hnsw.efSearch = ef_search
+    elif kind == "ivf":
+        # FAISS wants ~39 training points per centroid; small corpora get fewer lists.
+        nlist = max(1, min(int(4 * np.sqrt(count)), count // 39))
+        quantizer = faiss.IndexFlatIP(dim)
+        if quantization != "none":
+            index = faiss.IndexIVFScalarQuantizer(
+                quantizer, dim, nlist, SCALAR_QUANTIZERS[quantization], faiss.METRIC_INNER_PRODUCT
+            )
+        else:
+            index = faiss.IndexIVFFlat(quantizer, dim, nlist, faiss.METRIC_INNER_PRODUCT)
+        index.train(vectors)
+        index.nprobe = min(nlist, ivf_nprobe)
+    else:
+        nlist = max(1, int(np.sqrt(count)))
+        subquantizers = max(1, dim // 4)
+        while dim % subquantizers:
+            subquantizers -= 1
+        quantizer = faiss.IndexFlatIP(dim)
+        index = faiss.IndexIVFPQ(quantizer, dim, nlist, subquantizers, 8, faiss.METRIC_INNER_PRODUCT)
+        index.train(vectors)
+        index.nprobe = max(1, nlist // 16)
+    index.add(vectors)
+    print(f"[kb] Built {kind} index over {count} vectors")
+    return index
 
 
 def build_store(
@@ -243,15 +429,141 @@ def build_store(
 ) -> None:
     """Persist FAISS index and chunk metadata to disk."""
     store_dir.mkdir(parents=True, exist_ok=True)
-    faiss.write_index(index, str(store_dir / "index.faiss"))
+    targets = [store_dir / name for name in ("index.faiss", "chunks.json", CHUNK_BIAS_FILENAME)]
+    index_tmp, chunks_tmp, bias_tmp = (path.with_name(path.name + ".tmp") for path in targets)
+    # Retrievers memory-map index.faiss, so rewriting it in place would fault live readers.
+    # Stage every file first, then swap them in back to back.
+    faiss.write_index(index, str(index_tmp))
     chunk_payload = [chunk.to_dict() for chunk in chunks]
-    (store_dir / "chunks.json").write_text(
-        json.dumps(chunk_payload, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    chunks_tmp.write_bytes(jsonio.dumps(chunk_payload, pretty=True, sort_keys=False))
+    # Rerank flags are query-independent, so compute them once here instead of at every load.
+    with bias_tmp.open("wb") as handle:
+        np.save(handle, chunk_bias_flags(chunk_payload))
+    for tmp_path, path in zip((index_tmp, chunks_tmp, bias_tmp), targets):
+        os.replace(tmp_path, path)
     print(f"[kb] Store written to {store_dir}")
 
 
+def quantize_store(store_dir: Path, quantization: str) -> faiss.Index:
+    """
+    Re-encode an existing flat store's `index.faiss` as fp16/int8 codes in place.
+
+    Saves re-embedding the corpus; `chunks.json` and `embeddings.npy` are left
+    untouched, so later incremental refreshes still reuse full-precision vectors.
+    """
+    index_path = store_dir / "index.faiss"
+    index = faiss.read_index(str(index_path))
+    if not isinstance(index, faiss.IndexFlat):
+        raise ValueError(f"{index_path} holds a {type(index).__name__}; only flat stores can be re-quantised in place.")
+    quantized = quantize_flat_index(index, quantization)
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    faiss.write_index(quantized, str(tmp_path))
+    os.replace(tmp_path, index_path)
+    print(f"[kb] Re-quantised {index.ntotal} vectors in {index_path} to {quantization}")
+    return quantized
+
+
+def document_checksums(documents: Sequence[Path]) -> Dict[str, str]:
+    """SHA-256 of each PDF keyed by file name, hashing each directory's files in parallel."""
+    checksums: Dict[str, str] = {}
+    for directory in dict.fromkeys(doc.parent for doc in documents):
+        checksums.update(compute_directory_checksums(directory, ("*.pdf",)))
+    return {doc.name: checksums[doc.name] for doc in documents}
+
+
+def refresh_store(
+    store_dir: Path,
+    documents: Sequence[Path],
+    *,
+    embed_model: str = "sentence-transformers/all-MiniLM-L6-v2",
+    chunk_size_words: int = 280,
+    overlap_words: int = 60,
+    index_type: str = "flat",
+    quantization: str = "none",
+    incremental: bool = True,
+) -> List[ChunkRecord]:
+    """
+    Rebuild the RAG store, re-chunking and re-embedding only PDFs that changed.
+
+    Unchanged documents (same checksum as recorded in `ingest_checksums.json`,
+    same embedding model and chunking settings) keep their chunks from
+    `chunks.json` and their vectors from `embeddings.npy`. The index itself is
+    always rebuilt from the full matrix.
+    """
+    documents = list(documents)
+    settings = {
+        "embed_model": embed_model,
+        "chunk_size_words": chunk_size_words,
+        "overlap_words": overlap_words,
+    }
+    checksums = document_checksums(documents)
+
+    reused_chunks, reused_vectors = (
+        _load_reusable_store(store_dir, checksums, settings) if incremental else ({}, {})
+    )
+    changed = [doc for doc in documents if doc.name not in reused_chunks]
+    print(f"[kb] {len(documents) - len(changed)} documents unchanged; chunking {len(changed)}")
+    fresh = chunk_documents(changed, chunk_size_words=chunk_size_words, overlap_words=overlap_words)
+    fresh_chunks: Dict[str, List[ChunkRecord]] = {}
+    for record in fresh:
+        fresh_chunks.setdefault(Path(record.path).name, []).append(record)
+    chunks = [
+        record
+        for doc in documents
+        for record in reused_chunks.get(doc.name, fresh_chunks.get(doc.name, []))
+    ]
+
+    print(f"[kb] Built {len(chunks)} chunks; embedding with {embed_model}")
+    index, _embeddings = build_faiss_index(
+        chunks,
+        embed_model=embed_model,
+        embeddings_path=store_dir / "embeddings.npy",
+        index_type=index_type,
+        quantization=quantization,
+        reuse=reused_vectors,
+    )
+    build_store(store_dir, chunks, index)
+    (store_dir / INGEST_CHECKSUMS_FILENAME).write_bytes(
+        jsonio.dumps({"settings": settings, "documents": checksums}, pretty=True)
+    )
+    return chunks
+
+
+def _load_reusable_store(
+    store_dir: Path,
+    checksums: Dict[str, str],
+    settings: Dict[str, object],
+) -> Tuple[Dict[str, List[ChunkRecord]], Dict[str, np.ndarray]]:
+    """Chunks (by document name) and vectors (by chunk text) of unchanged documents."""
+    manifest_path = store_dir / INGEST_CHECKSUMS_FILENAME
+    chunks_path = store_dir / "chunks.json"
+    embeddings_path = store_dir / "embeddings.npy"
+    if not (manifest_path.exists() and chunks_path.exists() and embeddings_path.exists()):
+        return {}, {}
+    try:
+        manifest = jsonio.loads(manifest_path.read_bytes())
+        stored = jsonio.loads(chunks_path.read_bytes())
+        matrix = np.load(embeddings_path, mmap_mode="r")
+    except (OSError, ValueError) as exc:
+        print(f"[kb] Warning: cannot reuse existing store ({exc}); rebuilding from scratch")
+        return {}, {}
+    if manifest.get("settings") != settings or matrix.shape[0] != len(stored):
+        return {}, {}
+
+    _, mismatches = verify_checksums(checksums, manifest.get("documents", {}))
+    unchanged = {name for name in checksums if name not in mismatches}
+    chunks: Dict[str, List[ChunkRecord]] = {name: [] for name in unchanged}
+    vectors: Dict[str, np.ndarray] = {}
+    for row, payload in enumerate(stored):
+        name = Path(payload["path"]).name
+        if name in unchanged:
+            chunks[name].append(ChunkRecord(**payload))
+            # Copy out of the map: build_faiss_index replaces embeddings.npy.
+            vectors[payload["text"]] = np.array(matrix[row])
+    del matrix
+    return chunks, vectors
+
+
 def make_summary_prompt(title: str, text: str) -> str:
     """Build summarisation prompt for LLM-based digest generation."""
     return textwrap.dedent(
@@ -324,6 +636,38 @@ def call_ollama(
     return payload.get("response", "")
 
 
+def _digest_meta_path(digest_path: Path) -> Path:
+    return digest_path.with_name(digest_path.name + ".meta.json")
+
+
+def _digest_fingerprint(documents: Sequence[Path], summariser_model: Optional[str], max_tokens: int) -> str:
+    payload = {
+        "documents": document_checksums(documents),
+        "summariser_model": summariser_model,
+        "max_tokens": max_tokens,
+        "version": DIGEST_VERSION,
+    }
+    return hashlib.sha256(jsonio.dumps(payload, pretty=True)).hexdigest()
+
+
+def digest_is_current(
+    documents: Iterable[Path],
+    *,
+    digest_path: Path,
+    summariser_model: Optional[str] = None,
+    max_tokens: int = 1_000_000,
+) -> bool:
+    """True when `digest_path` was generated from these exact PDFs and settings."""
+    meta_path = _digest_meta_path(digest_path)
+    if not (digest_path.exists() and meta_path.exists()):
+        return False
+    try:
+        recorded = jsonio.loads(meta_path.read_bytes()).get("hash")
+    except (OSError, ValueError, AttributeError):
+        return False
+    return recorded == _digest_fingerprint(list(documents), summariser_model, max_tokens)
+
+
 def generate_digest(
     documents: Iterable[Path],
     *,
@@ -335,11 +679,14 @@ def generate_digest(
     Produce a long-form digest across documents.
 
     If `summariser_model` is provided, uses Ollama to summarise each document.
-    Otherwise falls back to truncation.
+    Otherwise falls back to truncation. A `<digest>.meta.json` sidecar records
+    the inputs for `digest_is_current`, unless a summariser call failed.
     """
 
+    documents = list(documents)
     per_document: Dict[str, str] = {}
     token_budget = 0
+    complete = True
 
     for doc in documents:
         print(f"[kb] Summarising {doc.name}")
@@ -356,6 +703,7 @@ def generate_digest(
             except Exception as exc:  # pragma: no cover - best effort fallback
                 print(f"[kb] Warning: summariser failed for {doc.name}: {exc}")
                 summary = textwrap.shorten(text, width=2000, placeholder="…")
+                complete = False
         else:
             summary = textwrap.shorten(text, width=2000, placeholder="…")
         per_document[title] = summary
@@ -374,6 +722,12 @@ def generate_digest(
 
     digest_path.parent.mkdir(parents=True, exist_ok=True)
     digest_path.write_text(digest_text, encoding="utf-8")
+    meta_path = _digest_meta_path(digest_path)
+    if complete:
+        fingerprint = _digest_fingerprint(documents, summariser_model, max_tokens)
+        meta_path.write_bytes(jsonio.dumps({"hash": fingerprint}, pretty=True))
+    elif meta_path.exists():
+        meta_path.unlink()
     print(f"[kb] Digest written to {digest_path}")
     return DigestResult(digest_text=digest_text, per_document=per_document, output_path=digest_path)
 
@@ -386,6 +740,11 @@ __all__ = [
     "extract_pdf_text",
     "chunk_documents",
     "build_faiss_index",
+    "build_ann_index",
     "build_store",
+    "digest_is_current",
+    "document_checksums",
     "generate_digest",
+    "quantize_store",
+    "refresh_store",
 ]
@@ -13,6 +13,7 @@ from cam_agent.knowledge import (
     chunk_documents,
     ensure_documents,
     generate_digest,
+    quantize_store,
 )
 
 
@@ -63,12 +64,35 @@ def parse_args() -> argparse.Namespace:
         default=60,
         help="Approximate overlap between chunks (word count).",
     )
+    parser.add_argument(
+        "--index-type",
+        choices=("flat", "hnsw", "ivf", "ivfpq", "auto"),
+        default="flat",
+        help="FAISS index type: exact flat search or approximate HNSW/IVF/IVF-PQ (auto picks by corpus size).",
+    )
+    parser.add_argument(
+        "--quantization",
+        choices=("none", "fp16", "int8"),
+        default="none",
+        help="Store flat/HNSW vectors as fp16 or int8 scalar-quantised codes.",
+    )
+    parser.add_argument(
+        "--requantize",
+        action="store_true",
+        help="Only re-encode the existing flat index.faiss with --quantization, without re-embedding.",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
 
+    if args.requantize:
+        if args.quantization == "none":
+            raise SystemExit("--requantize needs --quantization fp16 or int8.")
+        quantize_store(args.store_dir, args.quantization)
+        return
+
     ingestion = ensure_documents(args.download_dir, force=args.force_download)
     chunks = chunk_documents(
         ingestion.documents,
@@ -76,7 +100,13 @@ def main() -> None:
         overlap_words=args.overlap_words,
     )
 
-    index, _embeddings = build_faiss_index(chunks, embed_model=args.embed_model)
+    index, _embeddings = build_faiss_index(
+        chunks,
+        embed_model=args.embed_model,
+        embeddings_path=args.store_dir / "embeddings.npy",
+        index_type=args.index_type,
+        quantization=args.quantization,
+    )
     build_store(args.store_dir, chunks, index)
 
     generate_digest(
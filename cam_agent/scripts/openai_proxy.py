@@ -8,9 +8,10 @@ requests to the existing `LLMClient` interface.
 from __future__ import annotations
 
 import argparse
+import os
 import time
 import uuid
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel, Field
@@ -19,15 +20,21 @@ import uvicorn
 from cam_agent.services import LLMClient
 
 
+_ROLE_LABELS = {"user": "USER", "assistant": "ASSISTANT", "system": "SYSTEM"}
+
+
+def _role_label(role: str) -> str:
+    return _ROLE_LABELS.get(role) or role.upper()
+
+
+def _render_turns(turns: Iterable[Tuple[str, str]]) -> str:
+    """Render `(role, content)` pairs as a labelled transcript ending with an open assistant turn."""
+    return "\n".join([*(f"{_role_label(role)}: {content}" for role, content in turns), "ASSISTANT:"])
+
+
 def build_prompt(messages: List[Dict[str, str]]) -> str:
     """Convert chat messages into a simple conversational prompt."""
-    lines = []
-    for msg in messages:
-        role = msg.get("role", "user")
-        content = msg.get("content", "")
-        lines.append(f"{role.upper()}: {content}")
-    lines.append("ASSISTANT:")
-    return "\n".join(lines)
+    return _render_turns((msg.get("role", "user"), msg.get("content", "")) for msg in messages)
 
 
 class ChatMessage(BaseModel):
@@ -35,6 +42,11 @@ class ChatMessage(BaseModel):
     content: str
 
 
+def build_prompt_from_models(messages: Sequence[ChatMessage]) -> str:
+    """Same as `build_prompt`, reading validated `ChatMessage` objects directly."""
+    return _render_turns((msg.role, msg.content) for msg in messages)
+
+
 class ChatCompletionRequest(BaseModel):
     model: str
     messages: List[ChatMessage]
@@ -59,7 +71,7 @@ def create_app(llm_client: Optional[LLMClient] = None) -> FastAPI:
     def chat_completions(request: ChatCompletionRequest):
         if request.stream:
             raise HTTPException(status_code=400, detail="Streaming not supported in proxy.")
-        prompt = build_prompt([msg.dict() for msg in request.messages])
+        prompt = build_prompt_from_models(request.messages)
         try:
             response = client.call(
                 request.model,
@@ -131,13 +143,27 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run OpenAI-compatible proxy for local LLM provider.")
     parser.add_argument("--host", default="0.0.0.0")
     parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=max(1, (os.cpu_count() or 2) // 2),
+        help="Number of uvicorn worker processes (default: half the CPU count).",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
-    app = create_app()
-    uvicorn.run(app, host=args.host, port=args.port)
+    # Handlers are sync, so FastAPI already runs each backend call on its threadpool;
+    # extra workers add process-level concurrency. loop="auto" picks uvloop when installed.
+    uvicorn.run(
+        "cam_agent.scripts.openai_proxy:create_app",
+        factory=True,
+        host=args.host,
+        port=args.port,
+        workers=max(1, args.workers),
+        loop="auto",
+    )
 
 
 if __name__ == "__main__":
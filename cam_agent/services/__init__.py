@@ -18,6 +18,7 @@ __all__ = [
     "ScenarioExecutor",
     "RetrievalManager",
     "RetrievalResult",
+    "load_encoder",
     "QueryRequest",
     "ModelOutput",
     "CAMResponse",
@@ -32,6 +33,7 @@ _MODULE_ATTRS: Dict[str, str] = {
     "ScenarioExecutor": "cam_agent.services.orchestrator",
     "RetrievalManager": "cam_agent.services.retrieval",
     "RetrievalResult": "cam_agent.services.retrieval",
+    "load_encoder": "cam_agent.services.encoders",
     "QueryRequest": "cam_agent.services.types",
     "ModelOutput": "cam_agent.services.types",
     "CAMResponse": "cam_agent.services.types",
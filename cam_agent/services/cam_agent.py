@@ -4,15 +4,18 @@ High-level CAM agent coordinating scenario execution and compliance controls.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import os
+import re
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 from cam_agent.compliance.rules import DISCLAIMER_HINT, evaluate_compliance
 from cam_agent.config.models import ModelConfig, SCENARIOS
 from cam_agent.services.orchestrator import ScenarioExecutor
+from cam_agent.services.rag_cache import ResponseCache, store_fingerprint
 from cam_agent.services.types import CAMResponse, ComplianceIssue, ModelOutput, QueryRequest
-from cam_agent.storage.audit import JsonlAuditLogger
+from cam_agent.storage.audit import AsyncJsonlAuditLogger, JsonlAuditLogger
 
 
 BLOCK_MESSAGE = (
@@ -38,6 +41,36 @@ CRISIS_KEYWORDS = (
     "panic attack",
 )
 
+CRISIS_MARKERS = (
+    "lifeline",
+    "000",
+    "13 11 14",
+    "beyond blue",
+    "seek immediate professional help",
+)
+
+# Single-pass alternations so each request scans the text once per check.
+_CRISIS_KEYWORD_PATTERN = re.compile("|".join(map(re.escape, CRISIS_KEYWORDS)), re.IGNORECASE)
+_CRISIS_MARKER_PATTERN = re.compile("|".join(map(re.escape, CRISIS_MARKERS)), re.IGNORECASE)
+
+
+def _response_cache_from_env(store_dir: Optional[Path]) -> Optional[ResponseCache]:
+    """Build the response cache named by CAM_RESPONSE_CACHE ("memory" or a JSONL path)."""
+    target = os.getenv("CAM_RESPONSE_CACHE", "").strip()
+    if not target:
+        return None
+    similarity = os.getenv("CAM_RESPONSE_CACHE_SIMILARITY", "").strip()
+    return ResponseCache(
+        fingerprint=store_fingerprint(store_dir),
+        semantic_threshold=float(similarity) if similarity else None,
+        path=None if target.lower() == "memory" else Path(target),
+    )
+
+
+def _mark_cached(output: ModelOutput, **marker: Any) -> ModelOutput:
+    """Copy of a cached output tagged so audit records show it was not freshly generated."""
+    return replace(output, metadata={**output.metadata, **marker})
+
 
 @dataclass(slots=True)
 class CAMAgent:
@@ -48,11 +81,16 @@ class CAMAgent:
     scenarios: Dict[str, ModelConfig] = field(default_factory=lambda: SCENARIOS.copy())
     min_sim: float = 0.20
     top_k: int = 12
+    async_audit: bool = False
+    response_cache: Optional[ResponseCache] = None
     audit_logger: JsonlAuditLogger = field(init=False)
     _executors: Dict[str, ScenarioExecutor] = field(init=False, default_factory=dict)
 
     def __post_init__(self) -> None:
-        self.audit_logger = JsonlAuditLogger(self.audit_log_path)
+        logger_cls = AsyncJsonlAuditLogger if self.async_audit else JsonlAuditLogger
+        self.audit_logger = logger_cls(self.audit_log_path)
+        if self.response_cache is None:
+            self.response_cache = _response_cache_from_env(self.store_dir)
 
     def get_executor(self, scenario_id: str) -> ScenarioExecutor:
         if scenario_id not in self.scenarios:
@@ -77,7 +115,7 @@ class CAMAgent:
         metadata: Optional[Dict[str, Any]] = None,
     ) -> CAMResponse:
         executor = self.get_executor(scenario_id)
-        model_output = executor.execute(request)
+        model_output = self._execute(scenario_id, executor, request)
         decision = evaluate_compliance(request, model_output)
         final_text = self._apply_decision(
             request,
@@ -95,9 +133,29 @@ class CAMAgent:
         combined_metadata: Dict[str, Any] = {"scenario_id": scenario_id}
         if metadata:
             combined_metadata.update(metadata)
-        self.audit_logger.log(request, response, metadata=combined_metadata)
+        record = self.audit_logger.log(request, response, metadata=combined_metadata)
+        if record is not None:
+            response.audit_records.append(record)
         return response
 
+    def _execute(self, scenario_id: str, executor: ScenarioExecutor, request: QueryRequest) -> ModelOutput:
+        cache = self.response_cache
+        if cache is None:
+            return executor.execute(request)
+        key = cache.key(scenario_id, executor.config.name, request.question)
+        cached = cache.get(key)
+        if cached is not None:
+            return _mark_cached(cached, response_cache="exact")
+        embedding = executor.embed_question(request.question) if cache.semantic_threshold is not None else None
+        if embedding is not None:
+            match = cache.match_similar(scenario_id, embedding)
+            if match is not None:
+                cached, similarity = match
+                return _mark_cached(cached, response_cache="semantic", response_cache_similarity=similarity)
+        output = executor.execute(request)
+        cache.put(key, scenario_id, output, embedding)
+        return output
+
     def _apply_decision(
         self,
         request: QueryRequest,
@@ -126,11 +184,9 @@ class CAMAgent:
         return text.strip()
 
     def _needs_crisis_template(self, question: str, text: str) -> bool:
-        combined = f"{question}\n{text}".lower()
-        if any(marker in combined for marker in ("lifeline", "000", "13 11 14", "beyond blue", "seek immediate professional help")):
+        if _CRISIS_MARKER_PATTERN.search(question) or _CRISIS_MARKER_PATTERN.search(text):
             return False
-        question_lower = question.lower()
-        return any(keyword in question_lower for keyword in CRISIS_KEYWORDS)
+        return _CRISIS_KEYWORD_PATTERN.search(question) is not None
 
     def _inject_crisis_guidance(self, text: str) -> str:
         if CRISIS_TEMPLATE.lower() in text.lower():
@@ -0,0 +1,184 @@
+"""
+Alternative query/passage encoders for CAM retrieval.
+
+`load_encoder` selects a backend from the `embed_model` string:
+`onnx:<dir>` runs an exported transformer with ONNX Runtime, a path ending in
+`.onnx` (e.g. an int8 `model.int8.onnx` from `quantize_onnx_model`) runs that
+file directly, `static:<dir>` mean-pools a precomputed token-embedding table,
+and anything else is handed to the default factory (SentenceTransformer).
+All backends expose the subset of `SentenceTransformer.encode` that CAM uses.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Callable, List, Optional, Protocol, Sequence
+
+import numpy as np
+
+try:  # pragma: no cover - optional dependency
+    import onnxruntime  # type: ignore
+except ImportError:  # pragma: no cover - handled at runtime
+    onnxruntime = None
+
+try:  # pragma: no cover - optional dependency
+    from tokenizers import Tokenizer  # type: ignore
+except ImportError:  # pragma: no cover - handled at runtime
+    Tokenizer = None  # type: ignore
+
+ONNX_PREFIX = "onnx:"
+STATIC_PREFIX = "static:"
+ONNX_MODEL_CANDIDATES = ("onnx/model_O4.onnx", "onnx/model.onnx", "model.onnx")
+
+
+class Encoder(Protocol):
+    def encode(
+        self,
+        sentences: Sequence[str],
+        *,
+        batch_size: int = 32,
+        normalize_embeddings: bool = False,
+    ) -> np.ndarray:
+        ...
+
+
+def load_encoder(embed_model: str, default_factory: Callable[[str], Encoder]) -> Encoder:
+    """Build the encoder named by `embed_model`, falling back to `default_factory`."""
+    if embed_model.startswith(ONNX_PREFIX):
+        return OnnxEncoder(Path(embed_model[len(ONNX_PREFIX) :]))
+    if embed_model.endswith(".onnx"):
+        model_path = Path(embed_model)
+        # Exports usually keep the model under `onnx/` next to tokenizer.json.
+        model_dir = model_path.parent
+        if not (model_dir / "tokenizer.json").exists() and model_dir.name == "onnx":
+            model_dir = model_dir.parent
+        return OnnxEncoder(model_dir, model_path=model_path)
+    if embed_model.startswith(STATIC_PREFIX):
+        return StaticEmbeddingEncoder(Path(embed_model[len(STATIC_PREFIX) :]))
+    return default_factory(embed_model)
+
+
+def quantize_onnx_model(source: Path, target: Optional[Path] = None) -> Path:
+    """
+    Write a dynamically int8-quantised copy of an ONNX encoder.
+
+    Weights become int8 (activations are quantised at run time), which lets
+    ONNX Runtime use VNNI/AVX-512 int8 kernels where the CPU has them.
+    Defaults to `<name>.int8.onnx` beside the source.
+    """
+    try:
+        from onnxruntime.quantization import QuantType, quantize_dynamic  # type: ignore
+    except ImportError as exc:  # pragma: no cover - dependency hint
+        raise RuntimeError("onnxruntime is required to quantise models. Install with `pip install onnxruntime`.") from exc
+    target = target or source.with_name(f"{source.stem}.int8.onnx")
+    quantize_dynamic(str(source), str(target), weight_type=QuantType.QInt8)
+    return target
+
+
+def _load_tokenizer(model_dir: Path, *, max_length: Optional[int]) -> "Tokenizer":
+    if Tokenizer is None:
+        raise RuntimeError("tokenizers is required for this encoder. Install with `pip install tokenizers`.")
+    tokenizer_path = model_dir / "tokenizer.json"
+    if not tokenizer_path.exists():
+        raise FileNotFoundError(f"tokenizer.json not found in {model_dir}")
+    tokenizer = Tokenizer.from_file(str(tokenizer_path))
+    if max_length is not None:
+        tokenizer.enable_truncation(max_length=max_length)
+    return tokenizer
+
+
+def _l2_normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+class OnnxEncoder:
+    """Mean-pooled transformer embeddings from an ONNX Runtime session."""
+
+    def __init__(
+        self,
+        model_dir: Path,
+        *,
+        model_path: Optional[Path] = None,
+        max_length: int = 256,
+        intra_op_num_threads: Optional[int] = None,
+    ):
+        if onnxruntime is None:
+            raise RuntimeError("onnxruntime is required for onnx: encoders. Install with `pip install onnxruntime`.")
+        if model_path is None:
+            model_path = next(
+                (model_dir / name for name in ONNX_MODEL_CANDIDATES if (model_dir / name).exists()),
+                None,
+            )
+        elif not model_path.exists():
+            raise FileNotFoundError(f"ONNX model not found at {model_path}")
+        if model_path is None:
+            raise FileNotFoundError(f"No ONNX model found in {model_dir} (tried {', '.join(ONNX_MODEL_CANDIDATES)})")
+
+        self.tokenizer = _load_tokenizer(model_dir, max_length=max_length)
+        self.tokenizer.enable_padding()
+
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        threads = intra_op_num_threads or int(os.getenv("CAM_ONNX_THREADS", "0"))
+        if threads:
+            options.intra_op_num_threads = threads
+        self.session = onnxruntime.InferenceSession(
+            str(model_path),
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+        self._input_names = {item.name for item in self.session.get_inputs()}
+
+    def encode(
+        self,
+        sentences: Sequence[str],
+        *,
+        batch_size: int = 32,
+        normalize_embeddings: bool = False,
+    ) -> np.ndarray:
+        batches: List[np.ndarray] = []
+        for start in range(0, len(sentences), batch_size):
+            encodings = self.tokenizer.encode_batch(list(sentences[start : start + batch_size]))
+            input_ids = np.asarray([enc.ids for enc in encodings], dtype=np.int64)
+            attention_mask = np.asarray([enc.attention_mask for enc in encodings], dtype=np.int64)
+            feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+            if "token_type_ids" in self._input_names:
+                feeds["token_type_ids"] = np.asarray([enc.type_ids for enc in encodings], dtype=np.int64)
+            token_states = self.session.run(None, feeds)[0]
+            mask = attention_mask[..., None].astype(np.float32)
+            pooled = (token_states * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+            batches.append(pooled.astype(np.float32))
+
+        embeddings = np.concatenate(batches) if batches else np.zeros((0, 0), dtype=np.float32)
+        return _l2_normalize(embeddings) if normalize_embeddings else embeddings
+
+
+class StaticEmbeddingEncoder:
+    """Mean-pooled static token embeddings (model2vec-style) computed in NumPy."""
+
+    def __init__(self, model_dir: Path, *, max_length: Optional[int] = 512):
+        table_path = model_dir / "embeddings.npy"
+        if not table_path.exists():
+            raise FileNotFoundError(f"Static embedding table not found at {table_path}")
+        self.tokenizer = _load_tokenizer(model_dir, max_length=max_length)
+        self.table = np.load(table_path, mmap_mode="r")
+
+    def encode(
+        self,
+        sentences: Sequence[str],
+        *,
+        batch_size: int = 32,
+        normalize_embeddings: bool = False,
+    ) -> np.ndarray:
+        embeddings = np.zeros((len(sentences), self.table.shape[1]), dtype=np.float32)
+        for start in range(0, len(sentences), batch_size):
+            encodings = self.tokenizer.encode_batch(list(sentences[start : start + batch_size]))
+            for offset, encoding in enumerate(encodings):
+                if encoding.ids:
+                    embeddings[start + offset] = self.table[encoding.ids].mean(axis=0)
+        return _l2_normalize(embeddings) if normalize_embeddings else embeddings
+
+
+__all__ = ["Encoder", "OnnxEncoder", "StaticEmbeddingEncoder", "load_encoder", "quantize_onnx_model"]
@@ -5,10 +5,17 @@ Response formatting helpers for CAM.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import re
-from typing import Dict, Iterable, List, Optional, Set
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
-from cam_agent.utils.rag import add_titles_to_cites, build_ctx_and_maps, build_legend
+from cam_agent.utils.rag import add_titles_to_cites, build_prompt_assets
+from cam_agent.utils.sources import make_label
+
+try:  # pragma: no cover - optional dependency
+    import re2  # type: ignore
+except ImportError:  # pragma: no cover - handled at runtime
+    re2 = None
 
 
 @dataclass(slots=True)
@@ -22,9 +29,20 @@ class RetrievalContext:
 
 
 def prepare_context(hits: Iterable[Dict]) -> RetrievalContext:
-    """Build context string and lookup tables from hits."""
-    ctx_block, id_to_title, id_to_passage = build_ctx_and_maps(hits)
-    legend = build_legend(hits)
+    """
+    Build context string and lookup tables from hits.
+
+    Results are memoised on the (path, text) of each hit, so scenarios that
+    retrieve the same passages share one instance; treat it as read-only.
+    """
+    key = tuple((str(hit["path"]), hit.get("text") or "") for hit in hits)
+    return _prepare_context_cached(key)
+
+
+@lru_cache(maxsize=64)
+def _prepare_context_cached(key: Tuple[Tuple[str, str], ...]) -> RetrievalContext:
+    hits = [{"path": path, "text": text} for path, text in key]
+    ctx_block, id_to_title, id_to_passage, legend = build_prompt_assets(hits)
     return RetrievalContext(
         ctx_block=ctx_block,
         legend=legend,
@@ -38,108 +56,195 @@ def enrich_citations(answer: str, context: RetrievalContext) -> str:
     return add_titles_to_cites(answer, context.id_to_title, context.id_to_passage)
 
 
-APP_PATTERN = re.compile(
-    r"\bAPP\s*(?P<major>\d{1,2})(?:\.(?P<minor>\d))?(?:\((?P<letter>[a-z])\))?",
-    re.IGNORECASE,
+def _compile_ref_pattern(pattern: str):
+    """Compile case-insensitively, preferring linear-time RE2 when installed."""
+    if re2 is not None:
+        options = re2.Options()
+        options.case_sensitive = False
+        return re2.compile(pattern, options)
+    return re.compile(pattern, re.IGNORECASE)
+
+
+APP_PATTERN = _compile_ref_pattern(
+    r"\bAPP\s*(?P<app_major>\d{1,2})(?:\.(?P<app_minor>\d))?(?:\((?P<app_letter>[a-z])\))?",
+)
+
+SECTION_PATTERN = _compile_ref_pattern(
+    r"\b(?:section|s)\s*(?P<sec_number>\d{1,3})(?P<sec_suffix>[A-Za-z]?)"
+    r"(?P<sec_subsection>(?:\([\w\d]+\))*)",
 )
 
-SECTION_PATTERN = re.compile(
-    r"\b(?:section|s)\s*(?P<number>\d{1,3})(?P<suffix>[A-Za-z]?)"
-    r"(?P<subsection>(?:\([\w\d]+\))*)",
-    re.IGNORECASE,
+# Single alternation so answers are rewritten in one pass; the outer group
+# that participated tells the callback which reference kind matched.
+LEGAL_REF_PATTERN = _compile_ref_pattern(
+    rf"(?P<app>{APP_PATTERN.pattern})|(?P<section>{SECTION_PATTERN.pattern})",
+)
+
+
+# Every citation marker and legal ref contains a digit, so answers without
+# one can skip the regex passes entirely.
+_DIGIT_PRESCAN = re.compile(r"\d")
+
+
+# Citation markers plus legal refs, so `postprocess_answer` rewrites an answer
+# in one pass. The cite branch stays case-sensitive like `add_titles_to_cites`.
+ANSWER_POSTPROCESS_PATTERN = _compile_ref_pattern(
+    rf"(?P<cite>(?-i:\(see\s*\[(?P<cite_idx>\d+)\]\)))|{LEGAL_REF_PATTERN.pattern}",
 )
 
 
+def postprocess_answer(
+    answer: str,
+    context: Optional[RetrievalContext],
+    retrieval_context: str,
+) -> str:
+    """
+    Fused `enrich_citations` + `sanitize_legal_references` over a single scan.
+
+    Inserted citation labels are sanitised as well, matching the output of
+    running the two helpers back to back.
+    """
+
+    if not _DIGIT_PRESCAN.search(answer):
+        return answer
+
+    context_refs = _extract_legal_refs(retrieval_context)
+
+    def _replace_ref(match: re.Match[str]) -> str:
+        if match.group("app") is not None:
+            return _replace_app(match, context_refs)
+        return _replace_section(match, context_refs)
+
+    def _replace(match: re.Match[str]) -> str:
+        if match.group("cite") is None:
+            return _replace_ref(match)
+        if context is None:
+            return match.group(0)
+        idx = int(match.group("cite_idx"))
+        title = context.id_to_title.get(idx)
+        if not title:
+            return match.group(0)
+        label = make_label(title, context.id_to_passage.get(idx, ""))
+        return f"({LEGAL_REF_PATTERN.sub(_replace_ref, label)}; see [{idx}])"
+
+    return ANSWER_POSTPROCESS_PATTERN.sub(_replace, answer)
+
+
+# Longer answers bypass the sanitiser cache so it cannot pin large strings.
+_SANITIZE_CACHE_MAX_CHARS = 32_000
+
+
 def sanitize_legal_references(answer: str, retrieval_context: str) -> str:
     """
     Ensure clause references align with retrieved material.
 
     If a cited APP or legal section is not present in the retrieval context,
-    fall back to the closest parent clause or drop it entirely.
+    fall back to the closest parent clause or drop it entirely. Repeated
+    (answer, context) pairs, e.g. from scenario replays, are served from an LRU.
     """
 
+    if not _DIGIT_PRESCAN.search(answer):
+        return answer
+    if len(answer) > _SANITIZE_CACHE_MAX_CHARS:
+        return _sanitize_impl(answer, retrieval_context)
+    return _sanitize_cached(answer, retrieval_context)
+
+
+def _sanitize_impl(answer: str, retrieval_context: str) -> str:
     if not answer.strip():
         return answer
 
     context_refs = _extract_legal_refs(retrieval_context)
 
-    def _replace_app(match: re.Match[str]) -> str:
-        major = match.group("major")
-        minor = match.group("minor")
-        letter = match.group("letter")
-        options = []
-        if letter and minor:
-            options.append((f"app{major}.{minor}({letter})", (major, minor, letter)))
-        if minor:
-            options.append((f"app{major}.{minor}", (major, minor, None)))
-        options.append((f"app{major}", (major, None, None)))
-
-        for key, fmt_args in options:
-            if _normalize_ref(key) in context_refs:
-                return _format_app_reference(*fmt_args)
-
-        if _normalize_ref(f"app{major}") in context_refs:
-            return f"APP {int(major)}"
-        return "APP"
-
-    def _replace_section(match: re.Match[str]) -> str:
-        number = match.group("number")
-        suffix = (match.group("suffix") or "").upper()
-        subsection = match.group("subsection") or ""
-        raw = f"section{number}{suffix}{subsection}"
-        norm = _normalize_ref(raw)
-
-        candidates = [norm]
-        if subsection:
-            candidates.append(_normalize_ref(f"section{number}{suffix}"))
-            if suffix:
-                candidates.append(_normalize_ref(f"section{number}"))
-        elif suffix:
-            candidates.append(_normalize_ref(f"section{number}"))
+    def _replace(match: re.Match[str]) -> str:
+        if match.group("app") is not None:
+            return _replace_app(match, context_refs)
+        return _replace_section(match, context_refs)
 
-        for candidate in candidates:
-            if candidate in context_refs:
-                return _format_section_reference(number, suffix, subsection)
+    return LEGAL_REF_PATTERN.sub(_replace, answer)
 
-        if _normalize_ref(f"section{number}") in context_refs:
-            return f"section {int(number)}"
 
-        return "section"
+_sanitize_cached = lru_cache(maxsize=256)(_sanitize_impl)
 
-    sanitized = APP_PATTERN.sub(_replace_app, answer)
-    sanitized = SECTION_PATTERN.sub(_replace_section, sanitized)
-    return sanitized
 
+# Legal refs are compared as tuples of the captured groups, lowercased. The
+# groups cannot contain whitespace or hyphens, so this matches the old
+# string normalisation while skipping the rebuild/translate per lookup.
+RefKey = Tuple[str, str, str, str]
 
-def _extract_legal_refs(text: str) -> Set[str]:
-    refs: Set[str] = set()
-    if not text:
-        return refs
-
-    for match in APP_PATTERN.finditer(text):
-        major = match.group("major")
-        minor = match.group("minor")
-        letter = match.group("letter")
-        refs.add(_normalize_ref(f"app{major}"))
-        if minor:
-            refs.add(_normalize_ref(f"app{major}.{minor}"))
-        if minor and letter:
-            refs.add(_normalize_ref(f"app{major}.{minor}({letter})"))
-
-    for match in SECTION_PATTERN.finditer(text):
-        number = match.group("number")
-        suffix = (match.group("suffix") or "").upper()
-        subsection = match.group("subsection") or ""
-        refs.add(_normalize_ref(f"section{number}{suffix}{subsection}"))
-        if subsection:
-            refs.add(_normalize_ref(f"section{number}{suffix}"))
+
+def _app_key(major: str, minor: Optional[str] = None, letter: Optional[str] = None) -> RefKey:
+    return ("app", major, minor or "", letter.lower() if letter else "")
+
+
+def _section_key(number: str, suffix: str = "", subsection: str = "") -> RefKey:
+    return ("section", number, suffix.lower(), subsection.lower())
+
+
+def _replace_app(match: re.Match[str], context_refs: FrozenSet[RefKey]) -> str:
+    major = match.group("app_major")
+    minor = match.group("app_minor")
+    letter = match.group("app_letter")
+    if letter and minor and _app_key(major, minor, letter) in context_refs:
+        return _format_app_reference(major, minor, letter)
+    if minor and _app_key(major, minor) in context_refs:
+        return _format_app_reference(major, minor, None)
+    if _app_key(major) in context_refs:
+        return f"APP {int(major)}"
+    return "APP"
+
+
+def _replace_section(match: re.Match[str], context_refs: FrozenSet[RefKey]) -> str:
+    number = match.group("sec_number")
+    suffix = match.group("sec_suffix") or ""
+    subsection = match.group("sec_subsection") or ""
+
+    candidates = [_section_key(number, suffix, subsection)]
+    if subsection:
+        candidates.append(_section_key(number, suffix))
         if suffix:
-            refs.add(_normalize_ref(f"section{number}"))
-    return refs
+            candidates.append(_section_key(number))
+    elif suffix:
+        candidates.append(_section_key(number))
+
+    for candidate in candidates:
+        if candidate in context_refs:
+            return _format_section_reference(number, suffix.upper(), subsection)
 
+    if _section_key(number) in context_refs:
+        return f"section {int(number)}"
 
-def _normalize_ref(value: str) -> str:
-    return re.sub(r"[\s\-]", "", value.strip().lower())
+    return "section"
+
+
+@lru_cache(maxsize=32)
+def _extract_legal_refs(text: str) -> FrozenSet[RefKey]:
+    """Collect APP/section ref keys in `text` (memoised per context block)."""
+    if not text:
+        return frozenset()
+    refs: Set[RefKey] = set()
+
+    for match in LEGAL_REF_PATTERN.finditer(text):
+        if match.group("app") is not None:
+            major = match.group("app_major")
+            minor = match.group("app_minor")
+            letter = match.group("app_letter")
+            refs.add(_app_key(major))
+            if minor:
+                refs.add(_app_key(major, minor))
+            if minor and letter:
+                refs.add(_app_key(major, minor, letter))
+            continue
+
+        number = match.group("sec_number")
+        suffix = match.group("sec_suffix") or ""
+        subsection = match.group("sec_subsection") or ""
+        refs.add(_section_key(number, suffix, subsection))
+        if subsection:
+            refs.add(_section_key(number, suffix))
+        if suffix:
+            refs.add(_section_key(number))
+    return frozenset(refs)
 
 
 def _format_app_reference(
@@ -147,12 +252,9 @@ def _format_app_reference(
     minor: Optional[str],
     letter: Optional[str],
 ) -> str:
-    result = f"APP {int(major)}"
-    if minor:
-        result += f".{minor}"
-    if letter:
-        result += f"({letter.lower()})"
-    return result
+    minor_part = f".{minor}" if minor else ""
+    letter_part = f"({letter.lower()})" if letter else ""
+    return f"APP {int(major)}{minor_part}{letter_part}"
 
 
 def _format_section_reference(
@@ -160,18 +262,13 @@ def _format_section_reference(
     suffix: str,
     subsection: str,
 ) -> str:
-    parts = ["section", str(int(number))]
-    if suffix:
-        parts[-1] += suffix.upper()
-    result = " ".join(parts)
-    if subsection:
-        result += subsection
-    return result
+    return f"section {int(number)}{suffix.upper()}{subsection}"
 
 
 __all__ = [
     "RetrievalContext",
     "prepare_context",
     "enrich_citations",
+    "postprocess_answer",
     "sanitize_legal_references",
 ]
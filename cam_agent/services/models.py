@@ -6,12 +6,17 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional
 from urllib.parse import urlparse, urlunparse
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from cam_agent.utils import jsonio
 
+
+@lru_cache(maxsize=32)
 def ensure_ollama_endpoint(endpoint: str, default_path: str) -> str:
     """
     Normalise a user-supplied Ollama endpoint.
@@ -24,7 +29,11 @@ def ensure_ollama_endpoint(endpoint: str, default_path: str) -> str:
         return endpoint
 
     target_suffix = "/" + default_path.strip("/")
-    parsed = urlparse(endpoint.strip())
+    stripped = endpoint.strip()
+    if stripped.endswith(target_suffix):
+        return stripped
+
+    parsed = urlparse(stripped)
     path = (parsed.path or "").rstrip("/")
 
     if not path:
@@ -40,16 +49,32 @@ def ensure_ollama_endpoint(endpoint: str, default_path: str) -> str:
     return urlunparse(normalised).rstrip("/")
 
 
+def _env_bool(value: Optional[str], default: bool = False) -> bool:
+    if value is None:
+        return default
+    return value.lower() in {"1", "true", "yes", "on"}
+
+
+def _pooled_session(*, pool_connections: int = 4, pool_maxsize: int = 16) -> requests.Session:
+    """Create a keep-alive session so repeated calls reuse TCP/TLS connections."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 def _ollama_request(
     *,
+    session: requests.Session,
     endpoint: str,
     payload: Dict[str, object],
-    headers: Dict[str, str],
     timeout: int,
     model: str,
 ) -> Dict[str, object]:
+    stream = bool(payload.get("stream"))
     try:
-        response = requests.post(endpoint, json=payload, headers=headers, timeout=timeout)
+        response = session.post(endpoint, data=jsonio.dumps(payload), timeout=timeout, stream=stream)
     except requests.RequestException as exc:
         raise RuntimeError(f"Ollama request failed for model '{model}' at {endpoint}: {exc}") from exc
 
@@ -64,8 +89,11 @@ def _ollama_request(
             f"Ollama HTTP {response.status_code} for model '{model}' at {endpoint}: {preview}"
         ) from exc
 
+    if stream:
+        return _collect_ollama_stream(response, endpoint=endpoint, model=model)
+
     try:
-        return response.json()
+        return jsonio.loads(response.content)
     except ValueError as exc:
         body = (response.text or "").strip()
         preview = body[:500]
@@ -76,6 +104,54 @@ def _ollama_request(
         ) from exc
 
 
+def _collect_ollama_stream(
+    response: requests.Response,
+    *,
+    endpoint: str,
+    model: str,
+) -> Dict[str, object]:
+    """Fold Ollama's NDJSON stream into the shape of a non-streamed reply."""
+    pieces: List[str] = []
+    final: Dict[str, object] = {}
+    with response:
+        for line in response.iter_lines():
+            if not line:
+                continue
+            try:
+                chunk = jsonio.loads(line)
+            except ValueError as exc:
+                preview = line[:500].decode("utf-8", errors="replace")
+                raise RuntimeError(
+                    f"Ollama returned non-JSON stream chunk for model '{model}' at {endpoint}: {preview}"
+                ) from exc
+            if chunk.get("error"):
+                raise RuntimeError(f"Ollama stream error for model '{model}' at {endpoint}: {chunk['error']}")
+            message = chunk.get("message") or {}
+            pieces.append(chunk.get("response") or message.get("content") or "")
+            final = chunk
+
+    text = "".join(pieces)
+    return {**final, "response": text, "message": {"role": "assistant", "content": text}}
+
+
+def _collect_openai_stream(response: requests.Response) -> str:
+    """Concatenate the content deltas of an OpenAI-style SSE stream."""
+    pieces: List[str] = []
+    with response:
+        for line in response.iter_lines():
+            if not line.startswith(b"data:"):
+                continue
+            data = line[len(b"data:") :].strip()
+            if data == b"[DONE]":
+                break
+            choices = jsonio.loads(data).get("choices") or []
+            if not choices:
+                continue
+            delta = choices[0].get("delta") or {}
+            pieces.append(delta.get("content") or choices[0].get("text") or "")
+    return "".join(pieces)
+
+
 @dataclass(slots=True)
 class LLMResponse:
     """Container for raw LLM output and metadata."""
@@ -97,6 +173,7 @@ class LLMClient:
         endpoint: Optional[str] = None,
         auth_token: Optional[str] = None,
         api_mode: Optional[str] = None,
+        stream: Optional[bool] = None,
     ):
         mode = api_mode or os.getenv("LLM_API_MODE", "ollama")
         self.api_mode = mode.lower()
@@ -118,6 +195,14 @@ class LLMClient:
             self.endpoint = ensure_ollama_endpoint(raw_endpoint, "api/generate")
             self.auth_token = auth_token or os.getenv("OLLAMA_BEARER")
 
+        # Streaming is opt-in: the bundled OpenAI proxy rejects `stream=True`.
+        self.stream = _env_bool(os.getenv("LLM_STREAM")) if stream is None else stream
+        self._session = _pooled_session()
+        self._session.headers["Content-Type"] = "application/json"
+        if self.auth_token:
+            self._session.headers["Authorization"] = f"Bearer {self.auth_token}"
+        self._options_cache: Dict[tuple, Dict[str, int | float]] = {}
+
     def call(
         self,
         model: str,
@@ -135,6 +220,25 @@ class LLMClient:
             return self._call_ollama_chat(model, prompt, temperature, num_ctx, num_predict, seed, timeout)
         return self._call_ollama(model, prompt, temperature, num_ctx, num_predict, seed, timeout)
 
+    def _ollama_options(
+        self,
+        temperature: float,
+        num_ctx: int,
+        num_predict: Optional[int],
+        seed: Optional[int],
+    ) -> Dict[str, int | float]:
+        """Return a shared (read-only) options dict for these sampling settings."""
+        key = (temperature, num_ctx, num_predict, seed)
+        options = self._options_cache.get(key)
+        if options is None:
+            options = {"temperature": temperature, "num_ctx": num_ctx}
+            if num_predict is not None:
+                options["num_predict"] = int(num_predict)
+            if seed is not None:
+                options["seed"] = int(seed)
+            self._options_cache[key] = options
+        return options
+
     def _call_ollama(
         self,
         model: str,
@@ -145,21 +249,12 @@ class LLMClient:
         seed: Optional[int],
         timeout: int,
     ) -> LLMResponse:
-        headers: Dict[str, str] = {}
-        if self.auth_token:
-            headers["Authorization"] = f"Bearer {self.auth_token}"
-        headers["Content-Type"] = "application/json"
-
-        options: Dict[str, int | float] = {"temperature": temperature, "num_ctx": num_ctx}
-        if num_predict is not None:
-            options["num_predict"] = int(num_predict)
-        if seed is not None:
-            options["seed"] = int(seed)
+        options = self._ollama_options(temperature, num_ctx, num_predict, seed)
 
         payload = _ollama_request(
+            session=self._session,
             endpoint=self.endpoint,
-            payload={"model": model, "prompt": prompt, "stream": False, "options": options},
-            headers=headers,
+            payload={"model": model, "prompt": prompt, "stream": self.stream, "options": options},
             timeout=timeout,
             model=model,
         )
@@ -184,26 +279,17 @@ class LLMClient:
         seed: Optional[int],
         timeout: int,
     ) -> LLMResponse:
-        headers: Dict[str, str] = {}
-        if self.auth_token:
-            headers["Authorization"] = f"Bearer {self.auth_token}"
-        headers["Content-Type"] = "application/json"
-
-        options: Dict[str, int | float] = {"temperature": temperature, "num_ctx": num_ctx}
-        if num_predict is not None:
-            options["num_predict"] = int(num_predict)
-        if seed is not None:
-            options["seed"] = int(seed)
+        options = self._ollama_options(temperature, num_ctx, num_predict, seed)
 
         payload = _ollama_request(
+            session=self._session,
             endpoint=self.endpoint,
             payload={
                 "model": model,
                 "messages": [{"role": "user", "content": prompt}],
-                "stream": False,
+                "stream": self.stream,
                 "options": options,
             },
-            headers=headers,
             timeout=timeout,
             model=model,
         )
@@ -230,10 +316,6 @@ class LLMClient:
         seed: Optional[int],
         timeout: int,
     ) -> LLMResponse:
-        headers: Dict[str, str] = {"Content-Type": "application/json"}
-        if self.auth_token:
-            headers["Authorization"] = f"Bearer {self.auth_token}"
-
         payload = {
             "model": model,
             "messages": [{"role": "user", "content": prompt}],
@@ -243,13 +325,15 @@ class LLMClient:
             payload["max_tokens"] = int(num_predict)
         if seed is not None:
             payload["seed"] = int(seed)
+        if self.stream:
+            payload["stream"] = True
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.endpoint,
-                json=payload,
-                headers=headers,
+                data=jsonio.dumps(payload),
                 timeout=timeout,
+                stream=self.stream,
             )
             response.raise_for_status()
         except requests.HTTPError as exc:
@@ -261,14 +345,17 @@ class LLMClient:
                 f"OpenAI-compatible request failed for model '{model}' at {self.endpoint}: {preview}"
             ) from exc
 
-        data = response.json()
-        choices = data.get("choices") or []
-        if not choices:
-            text = ""
+        if self.stream:
+            text = _collect_openai_stream(response)
         else:
-            choice = choices[0]
-            message = choice.get("message") or {}
-            text = message.get("content", "") or choice.get("text", "")
+            data = jsonio.loads(response.content)
+            choices = data.get("choices") or []
+            if not choices:
+                text = ""
+            else:
+                choice = choices[0]
+                message = choice.get("message") or {}
+                text = message.get("content", "") or choice.get("text", "")
 
         return LLMResponse(
             text=text,
@@ -5,19 +5,21 @@ Scenario executor orchestrating retrieval + LLM calls.
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
 
 from cam_agent.config.models import ModelConfig
 from cam_agent.services.formatter import (
     RetrievalContext,
-    enrich_citations,
+    postprocess_answer,
     prepare_context,
-    sanitize_legal_references,
 )
-from cam_agent.services.models import LLMClient
-from cam_agent.services.retrieval import RetrievalManager, RetrievalResult
+from cam_agent.services.models import LLMClient, LLMResponse
+from cam_agent.services.retrieval import RetrievalManager, RetrievalResult, shared_retrieval_manager
 from cam_agent.services.types import ModelOutput, QueryRequest
 from cam_agent.utils.rag import build_prompt
 
@@ -28,6 +30,15 @@ FALLBACK_MESSAGE = (
 )
 
 
+@dataclass(slots=True)
+class _PreparedPrompt:
+    """Prompt plus retrieval state awaiting an LLM response."""
+
+    prompt: str
+    hits_context: Optional[RetrievalContext]
+    retrieval_result: Optional[RetrievalResult]
+
+
 @dataclass(slots=True)
 class ScenarioExecutor:
     """Executes a CAM scenario end-to-end for a single request."""
@@ -38,8 +49,14 @@ class ScenarioExecutor:
     min_sim: float = 0.20
     top_k: int = 12
     _retrieval: Optional[RetrievalManager] = field(init=False, default=None)
+    _available_chars_base: int = field(init=False, default=0)
+    _prefetched: Dict[str, RetrievalResult] = field(init=False, default_factory=dict)
 
     def __post_init__(self) -> None:
+        # Approximate char budget from context window (fallback 8192 tokens, ~6 chars/token),
+        # less headroom for the instructions; the question length is subtracted per request.
+        num_ctx = self.config.num_ctx or 8192
+        self._available_chars_base = max(4000, int(num_ctx) * 6) - 2000
         if self.llm_client is None:
             client_kwargs = {}
             if self.config.api_mode:
@@ -52,26 +69,98 @@ class ScenarioExecutor:
             if auth_token:
                 client_kwargs["auth_token"] = auth_token
             self.llm_client = LLMClient(**client_kwargs)
-        if self.config.use_rag:
-            if not self.store_dir:
-                raise ValueError("store_dir is required for RAG-enabled scenarios.")
+        if self.config.use_rag and not self.store_dir:
+            raise ValueError("store_dir is required for RAG-enabled scenarios.")
+
+    def _retrieval_manager(self) -> RetrievalManager:
+        """Load the FAISS store and embedding model on first use (shared with other scenarios)."""
+        if self._retrieval is None:
             embed_model = self.config.embed_model or "sentence-transformers/all-MiniLM-L6-v2"
-            self._retrieval = RetrievalManager(
-                store_dir=Path(self.store_dir),
-                embed_model=embed_model,
-            )
+            self._retrieval = shared_retrieval_manager(Path(self.store_dir), embed_model)
+        return self._retrieval
+
+    def embed_question(self, question: str) -> Optional[np.ndarray]:
+        """Normalised query embedding for RAG scenarios (shared with the retrieval query cache)."""
+        if not self.config.use_rag:
+            return None
+        return self._retrieval_manager()._encode_query(question, True)[0]
+
+    def prefetch(self, questions: Sequence[str]) -> None:
+        """
+        Retrieve passages for upcoming questions with one batched search.
+
+        Each result is consumed by the next `execute` of the same question, so a
+        suite run pays one encoder pass and one FAISS call per scenario.
+        """
+        if not self.config.use_rag:
+            return
+        pending = list(dict.fromkeys(q for q in questions if q not in self._prefetched))
+        if not pending:
+            return
+        results = self._retrieval_manager().search_many(pending, top_k=self.top_k, min_sim=self.min_sim)
+        self._prefetched.update(zip(pending, results))
 
     def execute(self, request: QueryRequest) -> ModelOutput:
         """Produce an LLM answer (with retrieval if configured)."""
-        hits_context: RetrievalContext | None = None
-        retrieval_result: RetrievalResult | None = None
+        prepared = self._prepare(request)
+        if isinstance(prepared, ModelOutput):
+            return prepared
+        return self._finalise(prepared, self._call_llm(prepared.prompt))
 
-        if self.config.use_rag and self._retrieval:
-            retrieval_result = self._retrieval.search(
-                request.question,
+    def execute_many(
+        self,
+        requests: Sequence[QueryRequest],
+        *,
+        max_workers: Optional[int] = None,
+    ) -> List[ModelOutput]:
+        """
+        Answer several requests, overlapping the LLM HTTP calls.
+
+        Retrieval runs as one batched search and post-processing runs serially
+        on the calling thread; only the network-bound `llm_client.call` is fanned
+        out. Results keep input order.
+        """
+        if self.config.use_rag:
+            retrievals = self._retrieval_manager().search_many(
+                [request.question for request in requests],
                 top_k=self.top_k,
                 min_sim=self.min_sim,
             )
+        else:
+            retrievals = [None] * len(requests)
+        prepared = [self._prepare(request, retrieval) for request, retrieval in zip(requests, retrievals)]
+        pending = sum(1 for item in prepared if not isinstance(item, ModelOutput))
+        if not pending:
+            return list(prepared)
+
+        workers = max_workers or min(8, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=min(workers, pending)) as pool:
+            futures = [
+                None if isinstance(item, ModelOutput) else pool.submit(self._call_llm, item.prompt)
+                for item in prepared
+            ]
+            return [
+                item if future is None else self._finalise(item, future.result())
+                for item, future in zip(prepared, futures)
+            ]
+
+    def _prepare(
+        self,
+        request: QueryRequest,
+        retrieval_result: Optional[RetrievalResult] = None,
+    ) -> Union[ModelOutput, _PreparedPrompt]:
+        """Run retrieval (unless supplied) and build the prompt, or return the fallback output."""
+        hits_context: RetrievalContext | None = None
+
+        if self.config.use_rag:
+            if retrieval_result is None:
+                retrieval_result = self._prefetched.pop(request.question, None)
+            if retrieval_result is None:
+                retrieval_result = self._retrieval_manager().search(
+                    request.question,
+                    top_k=self.top_k,
+                    min_sim=self.min_sim,
+                )
             if retrieval_result.hits:
                 filtered_hits = self._truncate_hits_for_budget(request, retrieval_result.hits)
                 if len(filtered_hits) < len(retrieval_result.hits):
@@ -87,13 +176,9 @@ class ScenarioExecutor:
                 hits_context = prepare_context(retrieval_result.hits)
 
         prompt = request.question
-        retrieval_context_block = ""
-        legend = ""
 
         if self.config.use_rag:
             if hits_context:
-                retrieval_context_block = hits_context.ctx_block
-                legend = hits_context.legend
                 prompt = build_prompt(request.question, hits_context.ctx_block)
             else:
                 response_text = FALLBACK_MESSAGE
@@ -110,7 +195,14 @@ class ScenarioExecutor:
                     },
                 )
 
-        llm_response = self.llm_client.call(
+        return _PreparedPrompt(
+            prompt=prompt,
+            hits_context=hits_context,
+            retrieval_result=retrieval_result,
+        )
+
+    def _call_llm(self, prompt: str) -> LLMResponse:
+        return self.llm_client.call(
             self.config.name,
             prompt,
             temperature=self.config.temperature,
@@ -119,15 +211,18 @@ class ScenarioExecutor:
             seed=self.config.seed,
         )
 
-        answer_text = llm_response.text
-        if hits_context:
-            answer_text = enrich_citations(answer_text, hits_context)
-        answer_text = sanitize_legal_references(answer_text, retrieval_context_block)
+    def _finalise(self, prepared: _PreparedPrompt, llm_response: LLMResponse) -> ModelOutput:
+        hits_context = prepared.hits_context
+        retrieval_result = prepared.retrieval_result
+        retrieval_context_block = hits_context.ctx_block if hits_context else ""
+        legend = hits_context.legend if hits_context else ""
+
+        answer_text = postprocess_answer(llm_response.text, hits_context, retrieval_context_block)
 
         return ModelOutput(
             text=answer_text,
             model=self.config.name,
-            prompt=prompt,
+            prompt=prepared.prompt,
             retrieval_context=retrieval_context_block,
             legend=legend,
             retrieved_hits=retrieval_result.hits if retrieval_result else [],
@@ -143,27 +238,20 @@ class ScenarioExecutor:
         if not hits:
             return []
 
-        # Approximate char budget from context window (fallback 8192 tokens, ~6 chars/token)
-        num_ctx = self.config.num_ctx or 8192
-        max_chars = max(4000, int(num_ctx) * 6)
-        # Reserve headroom for instructions + question
-        reserved = 2000 + len(request.question)
-        available = max(2000, max_chars - reserved)
-
-        pruned: List[Dict[str, object]] = []
-        consumed = 0
-        for hit in hits:
-            passage = str(hit.get("text") or "").strip()
-            addition = len(passage)
-            if not passage:
-                pruned.append(hit)
-                continue
-            if consumed + addition > available and pruned:
-                break
-            pruned.append(hit)
-            consumed += addition
-            if consumed >= available:
-                break
-
-        return pruned if pruned else hits[:1]
+        available = max(2000, self._available_chars_base - len(request.question))
+
+        # Empty passages cost nothing, so they ride along until the budget stops us.
+        lengths = np.fromiter(
+            (len(str(hit.get("text") or "").strip()) for hit in hits),
+            dtype=np.int64,
+            count=len(hits),
+        )
+        consumed = lengths.cumsum()
+        # Stop before the first hit that overflows, or right after the one that
+        # exactly fills the budget; the first hit is always kept.
+        overflow = int(np.searchsorted(consumed, available, side="right"))
+        filled = int(np.searchsorted(consumed, available, side="left")) + 1
+        return hits[: max(1, min(overflow, filled))]
+
+
 __all__ = ["ScenarioExecutor", "FALLBACK_MESSAGE"]
@@ -0,0 +1,186 @@
+"""
+Response cache for repeated CAM questions.
+
+Caches the pre-compliance `ModelOutput` per (scenario, model, question, store
+fingerprint), so repeated questions skip retrieval and the LLM call while
+compliance checks and audit logging still run on every request. An optional
+semantic layer also serves near-duplicate questions whose query embedding
+clears a cosine threshold. Entries can be persisted to a JSONL file and are
+ignored once the RAG store they were built from changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from cam_agent.services.types import ModelOutput
+from cam_agent.utils import jsonio
+
+STORE_FINGERPRINT_PATTERNS = ("*.json", "*.faiss", "*.npy")
+
+
+def store_fingerprint(store_dir: Optional[Path]) -> str:
+    """Cheap identity for a RAG store built from file names, sizes and mtimes."""
+    if store_dir is None or not store_dir.exists():
+        return "no-store"
+    hasher = hashlib.blake2b(digest_size=16)
+    for pattern in STORE_FINGERPRINT_PATTERNS:
+        for path in sorted(store_dir.glob(pattern)):
+            stat = path.stat()
+            hasher.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns};".encode("utf-8"))
+    return hasher.hexdigest()
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    scenario_id: str
+    output: ModelOutput
+    created_at: float
+    embedding: Optional[np.ndarray] = None
+
+
+class ResponseCache:
+    """LRU (+ optional TTL) cache of model outputs with an optional semantic lookup."""
+
+    def __init__(
+        self,
+        *,
+        fingerprint: str = "",
+        max_entries: int = 1024,
+        ttl_seconds: Optional[float] = None,
+        semantic_threshold: Optional[float] = None,
+        path: Optional[Path] = None,
+    ):
+        self.fingerprint = fingerprint
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.semantic_threshold = semantic_threshold
+        self.path = path
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        if path is not None and path.exists():
+            self._load(path)
+
+    def key(self, scenario_id: str, model: str, question: str) -> str:
+        material = "\x1f".join((scenario_id, model, question.strip(), self.fingerprint))
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[ModelOutput]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self._expired(entry):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry.output
+
+    def get_similar(self, scenario_id: str, embedding: np.ndarray) -> Optional[ModelOutput]:
+        """Best cached output for the scenario whose query embedding clears the threshold."""
+        match = self.match_similar(scenario_id, embedding)
+        return None if match is None else match[0]
+
+    def match_similar(self, scenario_id: str, embedding: np.ndarray) -> Optional[Tuple[ModelOutput, float]]:
+        """Like `get_similar`, but also returns the cosine similarity of the match."""
+        if self.semantic_threshold is None:
+            return None
+        with self._lock:
+            candidates = [
+                (key, entry)
+                for key, entry in self._entries.items()
+                if entry.scenario_id == scenario_id and entry.embedding is not None and not self._expired(entry)
+            ]
+            if not candidates:
+                return None
+            # Embeddings are L2-normalised, so the inner product is the cosine similarity.
+            matrix = np.stack([entry.embedding for _, entry in candidates])
+            scores = matrix @ np.asarray(embedding, dtype=np.float32).ravel()
+            best = int(np.argmax(scores))
+            if float(scores[best]) < self.semantic_threshold:
+                return None
+            key, entry = candidates[best]
+            self._entries.move_to_end(key)
+            return entry.output, float(scores[best])
+
+    def put(
+        self,
+        key: str,
+        scenario_id: str,
+        output: ModelOutput,
+        embedding: Optional[np.ndarray] = None,
+    ) -> None:
+        vector = None if embedding is None else np.asarray(embedding, dtype=np.float32).ravel()
+        entry = _CacheEntry(scenario_id=scenario_id, output=output, created_at=time.time(), embedding=vector)
+        with self._lock:
+            self._insert(key, entry)
+        if self.path is not None:
+            self._append(key, entry)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _insert(self, key: str, entry: _CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _expired(self, entry: _CacheEntry) -> bool:
+        return self.ttl_seconds is not None and time.time() - entry.created_at > self.ttl_seconds
+
+    def _append(self, key: str, entry: _CacheEntry) -> None:
+        record: Dict[str, Any] = {
+            "key": key,
+            "fingerprint": self.fingerprint,
+            "scenario_id": entry.scenario_id,
+            "created_at": entry.created_at,
+            "embedding": None if entry.embedding is None else entry.embedding.tolist(),
+            "output": asdict(entry.output),
+        }
+        try:
+            line = jsonio.dumps(record) + b"\n"
+        except (TypeError, ValueError):  # pragma: no cover - non-JSON metadata stays in memory only
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("ab") as handle:
+            handle.write(line)
+
+    def _load(self, path: Path) -> None:
+        loaded: List[Tuple[str, _CacheEntry]] = []
+        with path.open("rb") as handle:
+            for line in handle:
+                try:
+                    record = jsonio.loads(line)
+                    if record.get("fingerprint") != self.fingerprint:
+                        continue
+                    embedding = record.get("embedding")
+                    entry = _CacheEntry(
+                        scenario_id=record["scenario_id"],
+                        output=ModelOutput(**record["output"]),
+                        created_at=float(record["created_at"]),
+                        embedding=None if embedding is None else np.asarray(embedding, dtype=np.float32),
+                    )
+                except (ValueError, KeyError, TypeError):
+                    continue
+                if not self._expired(entry):
+                    loaded.append((record["key"], entry))
+        for key, entry in loaded:
+            self._insert(key, entry)
+        if loaded:
+            print(f"[cache] Loaded {len(self._entries)} cached responses from {path}")
+
+
+__all__ = ["ResponseCache", "store_fingerprint"]
@@ -4,10 +4,13 @@ Retrieval manager providing FAISS-based lookups for CAM.
 
 from __future__ import annotations
 
-import json
+import os
+import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence
+from typing import Dict, List, Optional, Sequence, Tuple
 
 try:
     import faiss  # type: ignore
@@ -18,6 +21,84 @@ except ImportError as exc:  # pragma: no cover
 import numpy as np
 from sentence_transformers import SentenceTransformer
 
+from cam_agent.services.encoders import load_encoder
+from cam_agent.utils import jsonio
+
+# Map the stored flat index read-only instead of copying it into process memory.
+_INDEX_IO_FLAGS = getattr(faiss, "IO_FLAG_MMAP_IFC", faiss.IO_FLAG_MMAP) | getattr(faiss, "IO_FLAG_READ_ONLY", 0)
+
+# Optional store sidecar holding `chunk_bias_flags` for chunks.json.
+CHUNK_BIAS_FILENAME = "chunk_bias.npy"
+
+# Query vectors shared by every manager in the process (e.g. scenarios A–F on one store).
+QUERY_CACHE_SIZE = 4096
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Scalar quantizer codes by name; "none" keeps float32 vectors.
+SCALAR_QUANTIZERS = {
+    "fp16": faiss.ScalarQuantizer.QT_fp16,
+    "int8": faiss.ScalarQuantizer.QT_8bit,
+}
+
+
+def quantize_flat_index(index: faiss.Index, quantization: str) -> faiss.Index:
+    """Re-encode a flat inner-product index with an fp16/int8 scalar quantizer."""
+    if quantization == "none":
+        return index
+    if quantization not in SCALAR_QUANTIZERS:
+        raise ValueError(f"Unsupported quantization '{quantization}'. Expected 'none', 'fp16', or 'int8'.")
+    vectors = index.reconstruct_n(0, index.ntotal)
+    quantized = faiss.IndexScalarQuantizer(
+        index.d,
+        SCALAR_QUANTIZERS[quantization],
+        faiss.METRIC_INNER_PRODUCT,
+    )
+    quantized.train(vectors)
+    quantized.add(vectors)
+    return quantized
+
+
+def configure_threads(faiss_threads: Optional[int] = None, torch_threads: Optional[int] = None) -> None:
+    """
+    Pin FAISS (OpenMP) and PyTorch thread pools so they do not oversubscribe.
+
+    Unset values fall back to `CAM_FAISS_THREADS` / `CAM_TORCH_THREADS`; zero
+    leaves the library default. Both settings are process-wide.
+    """
+    faiss_threads = faiss_threads or int(os.getenv("CAM_FAISS_THREADS", "0"))
+    torch_threads = torch_threads or int(os.getenv("CAM_TORCH_THREADS", "0"))
+    if faiss_threads:
+        faiss.omp_set_num_threads(faiss_threads)
+    if torch_threads:
+        try:
+            import torch  # type: ignore
+        except ImportError:  # pragma: no cover - encoder may not use torch
+            return
+        torch.set_num_threads(torch_threads)
+
+
+def index_to_gpu(index: faiss.Index, *, device: int = 0, temp_memory: int = 64 * 1024 * 1024) -> faiss.Index:
+    """
+    Move an index onto a GPU when a GPU build of FAISS and a device are available.
+
+    Returns the CPU index unchanged otherwise, including for index types
+    without a GPU implementation (e.g. HNSW).
+    """
+    if not hasattr(faiss, "StandardGpuResources") or faiss.get_num_gpus() <= device:
+        print("[kb] Warning: no FAISS GPU available; searching on CPU.")
+        return index
+    resources = faiss.StandardGpuResources()
+    resources.setTempMemory(temp_memory)
+    resources.setDefaultNullStreamAllDevices()
+    try:
+        gpu_index = faiss.index_cpu_to_gpu(resources, device, index)
+    except RuntimeError as exc:
+        print(f"[kb] Warning: {type(index).__name__} cannot run on GPU ({exc}); searching on CPU.")
+        return index
+    # The GPU index does not own its resources; keep them alive alongside it.
+    gpu_index.referenced_objects = [resources]
+    return gpu_index
+
 
 @dataclass(slots=True)
 class RetrievalResult:
@@ -28,6 +109,42 @@ class RetrievalResult:
     query_embedding: Optional[np.ndarray] = None
 
 
+class _QueryEmbeddingCache:
+    """Thread-safe LRU of read-only query vectors keyed by (embed_model, normalize, query)."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._vectors: "OrderedDict[Tuple[str, bool, str], np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, bool, str]) -> Optional[np.ndarray]:
+        with self._lock:
+            vector = self._vectors.get(key)
+            if vector is not None:
+                self._vectors.move_to_end(key)
+            return vector
+
+    def put(self, key: Tuple[str, bool, str], vector: np.ndarray) -> None:
+        vector.flags.writeable = False
+        with self._lock:
+            self._vectors[key] = vector
+            self._vectors.move_to_end(key)
+            while len(self._vectors) > self.maxsize:
+                self._vectors.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._vectors.clear()
+
+
+_QUERY_EMBEDDINGS = _QueryEmbeddingCache(QUERY_CACHE_SIZE)
+
+
+def _canonical_query(query: str) -> str:
+    # Only whitespace is folded: case matters to cased encoders.
+    return _WHITESPACE_RE.sub(" ", query).strip()
+
+
 class RetrievalManager:
     """Loads sentence-transformer embeddings and performs FAISS searches."""
 
@@ -36,24 +153,61 @@ class RetrievalManager:
         store_dir: Path,
         *,
         embed_model: str = "sentence-transformers/all-MiniLM-L6-v2",
+        ef_search: Optional[int] = None,
+        nprobe: Optional[int] = None,
+        quantization: str = "none",
+        faiss_threads: Optional[int] = None,
+        torch_threads: Optional[int] = None,
+        use_gpu: Optional[bool] = None,
     ):
+        configure_threads(faiss_threads, torch_threads)
+        if use_gpu is None:
+            use_gpu = os.getenv("CAM_FAISS_GPU", "").lower() in {"1", "true", "yes", "on"}
+        self.use_gpu = use_gpu
         self.store_dir = store_dir
         self.embed_model = embed_model
+        self.ef_search = ef_search
+        self.nprobe = nprobe
+        self.quantization = quantization
         self.index = self._load_index()
         self.chunks = self._load_chunks()
-        self.encoder = SentenceTransformer(embed_model)
+        self._chunk_bias_bits = self._load_chunk_bias()
+        self.encoder = load_encoder(embed_model, SentenceTransformer)
 
     def _load_index(self) -> faiss.Index:
         index_path = self.store_dir / "index.faiss"
         if not index_path.exists():
             raise FileNotFoundError(f"FAISS index not found at {index_path}")
-        return faiss.read_index(str(index_path))
+        index = faiss.read_index(str(index_path), _INDEX_IO_FLAGS)
+        # ANN stores persist their search knobs; only override when asked to.
+        if self.ef_search is not None and hasattr(index, "hnsw"):
+            index.hnsw.efSearch = self.ef_search
+        if self.nprobe is not None and hasattr(index, "nprobe"):
+            index.nprobe = self.nprobe
+        # Flat stores can be shrunk in memory at load; ANN stores are quantised at build time.
+        if isinstance(index, faiss.IndexFlat):
+            index = quantize_flat_index(index, self.quantization)
+        if self.use_gpu:
+            # GPU indexes cannot be memory-mapped, so this copies the vectors to device memory.
+            index = index_to_gpu(index)
+        return index
 
-    def _load_chunks(self) -> List[Dict]:
+    def _load_chunks(self) -> Tuple[Dict, ...]:
         chunks_path = self.store_dir / "chunks.json"
         if not chunks_path.exists():
             raise FileNotFoundError(f"Chunk metadata not found at {chunks_path}")
-        return json.loads(chunks_path.read_text(encoding="utf-8"))
+        # Parse raw bytes (orjson when installed); chunks are read-only after load.
+        return tuple(jsonio.loads(chunks_path.read_bytes()))
+
+    def _load_chunk_bias(self) -> np.ndarray:
+        # Stores built by the pipeline carry precomputed flags; older stores are classified here.
+        bias_path = self.store_dir / CHUNK_BIAS_FILENAME
+        if bias_path.exists():
+            flags = np.load(bias_path)
+            if flags.shape == (len(self.chunks),):
+                return flags.astype(np.uint8, copy=False)
+            print(f"[kb] Warning: ignoring stale {bias_path} ({flags.shape[0]} flags for {len(self.chunks)} chunks)")
+        return chunk_bias_flags(self.chunks)
 
     def search(
         self,
@@ -62,58 +216,111 @@ class RetrievalManager:
         top_k: int = 12,
         min_sim: float = 0.2,
         normalize: bool = True,
+        return_embedding: bool = False,
     ) -> RetrievalResult:
         """Return best-matching passages for the query."""
-        embedding = self.encoder.encode([query], normalize_embeddings=normalize)
-        distances, indices = self.index.search(embedding.astype("float32"), top_k)
-
-        scores = distances[0].tolist() if len(distances) else []
-        hits: List[Dict] = []
-        for idx in indices[0]:
-            if idx == -1:
-                continue
-            hits.append(self.chunks[int(idx)])
-
-        filtered_hits = []
-        filtered_scores = []
-        for score, hit in zip(scores, hits):
-            if score >= min_sim:
-                filtered_hits.append(hit)
-                filtered_scores.append(float(score))
-
-        if filtered_hits:
-            filtered_hits, filtered_scores = self._rebalance_hits(
+        embedding = self._encode_query(query, normalize)
+        distances, indices = self.index.search(embedding, top_k)
+        # The cached (read-only) query vector is small, so no copy is needed here.
+        query_embedding = embedding[0] if return_embedding else None
+        return self._build_result(query, distances[0], indices[0], query_embedding, min_sim)
+
+    def search_many(
+        self,
+        queries: Sequence[str],
+        *,
+        top_k: int = 12,
+        min_sim: float = 0.2,
+        normalize: bool = True,
+        batch_size: int = 64,
+        return_embedding: bool = False,
+    ) -> List[RetrievalResult]:
+        """
+        Batch variant of `search`: one encoder pass and one FAISS call for all queries.
+
+        Large batches benefit from `faiss_threads=os.cpu_count()`; single-query
+        `search` gains nothing from extra FAISS threads.
+        """
+        if not queries:
+            return []
+        embeddings = self._encode_queries(queries, normalize, batch_size)
+        distances, indices = self.index.search(embeddings, top_k)
+        return [
+            self._build_result(
                 query,
-                filtered_hits,
-                filtered_scores,
+                distances[row],
+                indices[row],
+                # Copy so a kept result does not pin the whole batch buffer.
+                embeddings[row].copy() if return_embedding else None,
+                min_sim,
             )
+            for row, query in enumerate(queries)
+        ]
+
+    def _build_result(
+        self,
+        query: str,
+        distances: np.ndarray,
+        indices: np.ndarray,
+        embedding: Optional[np.ndarray],
+        min_sim: float,
+    ) -> RetrievalResult:
+        # Compare in float64 so the threshold is not rounded to float32.
+        scores = distances.astype(np.float64)
+        keep = (indices >= 0) & (scores >= min_sim)
+        filtered_ids: List[int] = indices[keep].tolist()
+        filtered_scores: List[float] = scores[keep].tolist()
+
+        # Most queries are not clinical; keep FAISS order without re-sorting.
+        if filtered_ids and _should_bias_clinical(query):
+            filtered_ids, filtered_scores = self._rebalance_hits(filtered_ids, filtered_scores)
 
         return RetrievalResult(
-            hits=filtered_hits,
+            hits=[self.chunks[chunk_id] for chunk_id in filtered_ids],
             scores=filtered_scores,
-            query_embedding=embedding[0],
+            query_embedding=embedding,
         )
 
+    def _encode_query(self, query: str, normalize: bool) -> np.ndarray:
+        """Read-only (1, dim) float32 vector for `query`, from the shared cache when seen before."""
+        key = (self.embed_model, normalize, _canonical_query(query))
+        embedding = _QUERY_EMBEDDINGS.get(key)
+        if embedding is None:
+            embedding = np.asarray(
+                self.encoder.encode([key[2]], normalize_embeddings=normalize),
+                dtype="float32",
+            )
+            _QUERY_EMBEDDINGS.put(key, embedding)
+        return embedding
+
+    def _encode_queries(self, queries: Sequence[str], normalize: bool, batch_size: int) -> np.ndarray:
+        """(n, dim) float32 matrix for `queries`; only uncached queries go through the encoder."""
+        keys = [(self.embed_model, normalize, _canonical_query(query)) for query in queries]
+        cached = [_QUERY_EMBEDDINGS.get(key) for key in keys]
+        missing = list(dict.fromkeys(key for key, vector in zip(keys, cached) if vector is None))
+        if missing:
+            encoded = np.asarray(
+                self.encoder.encode([key[2] for key in missing], batch_size=batch_size, normalize_embeddings=normalize),
+                dtype="float32",
+            )
+            fresh = {key: encoded[row : row + 1].copy() for row, key in enumerate(missing)}
+            for key, vector in fresh.items():
+                _QUERY_EMBEDDINGS.put(key, vector)
+            cached = [vector if vector is not None else fresh[key] for key, vector in zip(keys, cached)]
+        return np.concatenate(cached)
+
     def _rebalance_hits(
         self,
-        query: str,
-        hits: Sequence[Dict],
+        chunk_ids: Sequence[int],
         scores: Sequence[float],
-    ) -> tuple[List[Dict], List[float]]:
+    ) -> tuple[List[int], List[float]]:
         """Down-rank research-only chunks for clinical privacy questions."""
-
-        if not _should_bias_clinical(query):
-            return list(hits), list(scores)
-
-        reweighted: List[tuple[float, float, Dict]] = []
-        for hit, score in zip(hits, scores):
-            bonus = _score_adjustment(hit)
-            reweighted.append((score + bonus, float(score), hit))
-
-        reweighted.sort(key=lambda item: item[0], reverse=True)
-        sorted_hits = [item[2] for item in reweighted]
-        sorted_scores = [item[1] for item in reweighted]
-        return sorted_hits, sorted_scores
+        ids = np.asarray(chunk_ids, dtype=np.int64)
+        raw_scores = np.asarray(scores, dtype=np.float64)
+        bonus = _BONUS_BY_BITS[self._chunk_bias_bits[ids]]
+        # Stable descending order, matching `list.sort(reverse=True)` on ties.
+        order = np.argsort(-(raw_scores + bonus), kind="stable")
+        return ids[order].tolist(), raw_scores[order].tolist()
 
 
 CLINICAL_QUERY_TERMS = (
@@ -146,24 +353,109 @@ RESEARCH_SOURCE_HINTS = (
 )
 
 
+APP_TEXT_HINTS = ("app ", "app", "privacy principle")
+
+
+_SHARED_MANAGERS: "OrderedDict[Tuple[str, str, int, int], RetrievalManager]" = OrderedDict()
+_SHARED_MANAGERS_LOCK = threading.Lock()
+SHARED_MANAGER_LIMIT = 4
+
+
+def shared_retrieval_manager(store_dir: Path, embed_model: str) -> RetrievalManager:
+    """
+    Process-wide `RetrievalManager` per (store, embed model).
+
+    Scenarios that share a store reuse one loaded index, chunk list and encoder.
+    The key includes the index/chunk mtimes, so a rebuilt store is reloaded.
+    """
+    resolved = Path(store_dir).resolve()
+    try:
+        stamps = ((resolved / "index.faiss").stat().st_mtime_ns, (resolved / "chunks.json").stat().st_mtime_ns)
+    except OSError:
+        stamps = (0, 0)
+    key = (str(resolved), embed_model, *stamps)
+    with _SHARED_MANAGERS_LOCK:
+        manager = _SHARED_MANAGERS.get(key)
+        if manager is None:
+            manager = RetrievalManager(store_dir=resolved, embed_model=embed_model)
+            _SHARED_MANAGERS[key] = manager
+            while len(_SHARED_MANAGERS) > SHARED_MANAGER_LIMIT:
+                _SHARED_MANAGERS.popitem(last=False)
+        else:
+            _SHARED_MANAGERS.move_to_end(key)
+        return manager
+
+
+def _term_pattern(terms: Sequence[str]) -> re.Pattern[str]:
+    """One alternation per term table so each string is scanned once, in C."""
+    return re.compile("|".join(map(re.escape, terms)))
+
+
+_CLINICAL_QUERY_PATTERN = _term_pattern(CLINICAL_QUERY_TERMS)
+_CLINICAL_SOURCE_PATTERN = _term_pattern(CLINICAL_SOURCE_HINTS)
+_RESEARCH_SOURCE_PATTERN = _term_pattern(RESEARCH_SOURCE_HINTS)
+_APP_TEXT_PATTERN = _term_pattern(APP_TEXT_HINTS)
+
+
 def _should_bias_clinical(query: str) -> bool:
-    lowered = query.lower()
-    return any(term in lowered for term in CLINICAL_QUERY_TERMS)
+    return _CLINICAL_QUERY_PATTERN.search(query.lower()) is not None
 
 
-def _score_adjustment(hit: Dict) -> float:
+BIAS_CLINICAL_SOURCE = 1
+BIAS_APP_TEXT = 2
+BIAS_RESEARCH_SOURCE = 4
+
+
+def _bias_bits(hit: Dict) -> int:
+    """Classify a chunk's source/text into `BIAS_*` flags."""
     path = str(hit.get("path", "")).lower()
     label = str(hit.get("metadata", {}).get("label", "")).lower()
     text = str(hit.get("text", "")).lower()
+    # No hint contains a newline, so joining cannot create matches across fields.
+    source = f"{path}\n{label}"
+
+    bits = 0
+    if _CLINICAL_SOURCE_PATTERN.search(source):
+        bits |= BIAS_CLINICAL_SOURCE
+    if _APP_TEXT_PATTERN.search(text):
+        bits |= BIAS_APP_TEXT
+    if _RESEARCH_SOURCE_PATTERN.search(source):
+        bits |= BIAS_RESEARCH_SOURCE
+    return bits
 
+
+def _bonus_for_bits(bits: int) -> float:
     bonus = 0.0
-    if any(term in path or term in label for term in CLINICAL_SOURCE_HINTS):
+    if bits & BIAS_CLINICAL_SOURCE:
         bonus += 0.08
-    if any(term in text for term in ("app ", "app", "privacy principle")):
+    if bits & BIAS_APP_TEXT:
         bonus += 0.04
-    if any(term in path or term in label for term in RESEARCH_SOURCE_HINTS):
+    if bits & BIAS_RESEARCH_SOURCE:
         bonus -= 0.12
     return bonus
 
 
-__all__ = ["RetrievalManager", "RetrievalResult"]
+def chunk_bias_flags(chunks: Sequence[Dict]) -> np.ndarray:
+    """Per-chunk `BIAS_*` flags (uint8) used to rerank clinical queries."""
+    return np.fromiter((_bias_bits(chunk) for chunk in chunks), dtype=np.uint8, count=len(chunks))
+
+
+# Rerank bonus for every flag combination, indexed by `_bias_bits`.
+_BONUS_BY_BITS = np.array([_bonus_for_bits(bits) for bits in range(8)], dtype=np.float64)
+
+
+def _score_adjustment(hit: Dict) -> float:
+    return float(_BONUS_BY_BITS[_bias_bits(hit)])
+
+
+__all__ = [
+    "CHUNK_BIAS_FILENAME",
+    "RetrievalManager",
+    "RetrievalResult",
+    "SCALAR_QUANTIZERS",
+    "chunk_bias_flags",
+    "configure_threads",
+    "index_to_gpu",
+    "quantize_flat_index",
+    "shared_retrieval_manager",
+]
@@ -61,6 +61,7 @@ class CAMResponse:
     action: str
     issues: List[ComplianceIssue]
     raw_output: ModelOutput
+    audit_records: List[Dict[str, Any]] = field(default_factory=list)  # records logged for this response
 
 
 __all__ = [
@@ -4,18 +4,37 @@ Audit logging utilities for CAM.
 
 from __future__ import annotations
 
-import json
-from dataclasses import asdict, dataclass
-from datetime import datetime
+import atexit
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, BinaryIO, Dict, List
 
 from cam_agent.services.types import CAMResponse, QueryRequest
+from cam_agent.utils import jsonio
+
+
+_TS_CACHE: tuple[int, str] = (-1, "")
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as `YYYY-MM-DDTHH:MM:SS.ffffffZ`, reusing the formatted second."""
+    global _TS_CACHE
+    sec, rem = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _TS_CACHE
+    if sec != cached_sec:
+        prefix = datetime.fromtimestamp(sec, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        _TS_CACHE = (sec, prefix)
+    return f"{prefix}.{rem // 1000:06d}Z"
 
 
 @dataclass(slots=True)
 class AuditRecord:
-    """Structured log entry for a CAM interaction."""
+    """Field layout of the records written by `JsonlAuditLogger.log`."""
 
     timestamp: str
     user_id: str
@@ -35,13 +54,51 @@ class AuditRecord:
 
 
 class JsonlAuditLogger:
-    """Append-only JSONL logger for CAM interactions."""
+    """
+    Append-only JSONL logger for CAM interactions.
 
-    def __init__(self, path: Path):
+    The file handle stays open between records; each record is flushed as
+    soon as it is written so tailing readers (the UI) see it immediately.
+    Set `fsync_interval` to fsync every N records for crash durability.
+    """
+
+    def __init__(self, path: Path, *, fsync_interval: int = 0):
         self.path = path
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.fsync_interval = max(0, int(fsync_interval))
+        self._fh: BinaryIO | None = None
+        self._pending_sync = 0
+
+    def __enter__(self) -> "JsonlAuditLogger":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def flush(self) -> None:
+        if self._fh is not None:
+            self._fh.flush()
 
-    def log(self, request: QueryRequest, response: CAMResponse, metadata: Dict[str, Any] | None = None) -> None:
+    def close(self) -> None:
+        fh, self._fh = self._fh, None
+        if fh is not None:
+            fh.close()
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self._append(jsonio.dumps(record) + b"\n", 1)
+
+    def _append(self, data: bytes, count: int) -> None:
+        if self._fh is None:
+            self._fh = self.path.open("ab", buffering=1 << 16)
+        self._fh.write(data)
+        self._fh.flush()
+        if self.fsync_interval:
+            self._pending_sync += count
+            if self._pending_sync >= self.fsync_interval:
+                os.fsync(self._fh.fileno())
+                self._pending_sync = 0
+
+    def log(self, request: QueryRequest, response: CAMResponse, metadata: Dict[str, Any] | None = None) -> Dict[str, Any]:
         meta = dict(metadata or {})
         run_id = meta.get("run_id")
         scenario_id = meta.get("scenario_id")
@@ -49,33 +106,42 @@ class JsonlAuditLogger:
         exchange_id = meta.get("exchange_id")
         run_tags = meta.get("run_tags") if isinstance(meta.get("run_tags"), dict) else None
 
-        record = AuditRecord(
-            timestamp=datetime.utcnow().isoformat() + "Z",
-            user_id=request.user_id,
-            session_id=request.session_id,
-            channel=request.channel,
-            question=request.question,
-            action=response.action,
-            issues=[asdict(issue) for issue in response.issues],
-            raw_model={
-                "model": response.raw_output.model,
-                "prompt": response.raw_output.prompt,
-                "text": response.raw_output.text,
-                "retrieval_context": response.raw_output.retrieval_context,
-                "legend": response.raw_output.legend,
-                "retrieved_hits": response.raw_output.retrieved_hits,
-                "metadata": response.raw_output.metadata,
+        raw = response.raw_output
+        record: Dict[str, Any] = {
+            "timestamp": _utc_timestamp(),
+            "user_id": request.user_id,
+            "session_id": request.session_id,
+            "channel": request.channel,
+            "question": request.question,
+            "action": response.action,
+            "issues": [
+                {
+                    "severity": issue.severity,
+                    "message": issue.message,
+                    "rule_id": issue.rule_id,
+                    "references": list(issue.references),
+                }
+                for issue in response.issues
+            ],
+            "raw_model": {
+                "model": raw.model,
+                "prompt": raw.prompt,
+                "text": raw.text,
+                "retrieval_context": raw.retrieval_context,
+                "legend": raw.legend,
+                "retrieved_hits": raw.retrieved_hits,
+                "metadata": raw.metadata,
             },
-            final_text=response.final_text,
-            metadata=meta,
-            run_id=str(run_id) if run_id else None,
-            scenario_id=str(scenario_id) if scenario_id else None,
-            turn_index=int(turn_index) if isinstance(turn_index, (int, float)) else None,
-            exchange_id=str(exchange_id) if exchange_id else None,
-            run_tags=run_tags,
-        )
-        with self.path.open("a", encoding="utf-8") as fh:
-            fh.write(json.dumps(asdict(record), ensure_ascii=False) + "\n")
+            "final_text": response.final_text,
+            "metadata": meta,
+            "run_id": str(run_id) if run_id else None,
+            "scenario_id": str(scenario_id) if scenario_id else None,
+            "turn_index": int(turn_index) if isinstance(turn_index, (int, float)) else None,
+            "exchange_id": str(exchange_id) if exchange_id else None,
+            "run_tags": run_tags,
+        }
+        self._write(record)
+        return record
 
     def log_judge_results(
         self,
@@ -90,7 +156,7 @@ class JsonlAuditLogger:
 
         meta = dict(metadata or {})
         payload: Dict[str, Any] = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": _utc_timestamp(),
             "user_id": request.user_id,
             "session_id": request.session_id,
             "channel": request.channel,
@@ -113,8 +179,103 @@ class JsonlAuditLogger:
         run_tags = meta.get("run_tags")
         if isinstance(run_tags, dict):
             payload["run_tags"] = run_tags
-        with self.path.open("a", encoding="utf-8") as fh:
-            fh.write(json.dumps(payload, ensure_ascii=False) + "\n")
+        self._write(payload)
+
+
+_STOP = object()
+
+
+class AsyncJsonlAuditLogger(JsonlAuditLogger):
+    """
+    JSONL logger that writes records on a background thread.
+
+    `log` / `log_judge_results` serialise the record on the caller's thread
+    (so encoding errors reach the caller, as with the sync logger) and only
+    enqueue the bytes. The writer drains up to `batch_size` queued lines per
+    write call. `flush()` blocks until
+    everything queued so far is on disk (in the page cache), and `close()`
+    drains the queue and stops the thread. Records are written at exit too.
+    At most `max_pending` records wait in the queue; beyond that `log` blocks
+    until the writer catches up instead of growing memory without bound.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        fsync_interval: int = 0,
+        batch_size: int = 256,
+        max_pending: int = 1000,
+    ):
+        super().__init__(path, fsync_interval=fsync_interval)
+        self.batch_size = max(1, int(batch_size))
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, int(max_pending)))
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        # Encode now: callers may keep mutating the objects the record points at.
+        line = jsonio.dumps(record) + b"\n"
+        self._ensure_thread()
+        self._queue.put(line)
+
+    def flush(self) -> None:
+        done = threading.Event()
+        # Queue the marker under the lock so it cannot land behind close()'s _STOP.
+        with self._thread_lock:
+            if self._thread is None:
+                return
+            self._queue.put(done)
+        done.wait()
+
+    def close(self) -> None:
+        with self._thread_lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            atexit.unregister(self.close)
+            self._queue.put(_STOP)
+            thread.join()
+        super().close()
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="cam-audit-writer", daemon=True)
+                self._thread.start()
+                # Registered only while a writer is running; close() removes it again.
+                atexit.register(self.close)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            lines: List[bytes] = []
+            waiters: List[threading.Event] = []
+            stop = False
+            while True:
+                if item is _STOP:
+                    stop = True
+                    break
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    lines.append(item)
+                if len(lines) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if lines:
+                try:
+                    self._append(b"".join(lines), len(lines))
+                except OSError as exc:
+                    print(f"[audit] Failed to write {len(lines)} record(s) to {self.path}: {exc}")
+            for waiter in waiters:
+                waiter.set()
+            if stop:
+                return
 
 
-__all__ = ["JsonlAuditLogger"]
+__all__ = ["AsyncJsonlAuditLogger", "JsonlAuditLogger"]
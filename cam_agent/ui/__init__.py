@@ -20,6 +20,7 @@ from .schema import (
     get_timeline_event_schema,
     serialize_run_metadata,
     serialize_timeline_event,
+    serialize_timeline_event_bytes,
 )
 
 __all__ = [
@@ -34,5 +35,6 @@ __all__ = [
     "get_timeline_event_schema",
     "serialize_run_metadata",
     "serialize_timeline_event",
+    "serialize_timeline_event_bytes",
     "AuditLogHistoricalRunLoader",
 ]
@@ -10,20 +10,23 @@ pipeline for local demos or be deployed separately for the dashboard.
 from __future__ import annotations
 
 import asyncio
-import json
+import atexit
 import os
-from dataclasses import replace
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timezone, timedelta
 import logging
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 from uuid import uuid4
 
 from dotenv import load_dotenv
 from fastapi import Depends, FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict
 
 load_dotenv()
 
@@ -34,6 +37,7 @@ if not logging.getLogger().handlers:
 from cam_agent.evaluation.config import default_scenarios, describe_scenario
 from cam_agent.evaluation.judges import JudgeManager, build_default_judges, resolve_judge_llm_config
 from cam_agent.services import CAMAgent, QueryRequest
+from cam_agent.utils import jsonio
 from cam_agent.ui.events import (
     EventSource,
     JudgeVerdictEvent,
@@ -44,36 +48,163 @@ from cam_agent.ui.events import (
     build_timeline_event,
 )
 
-from .history import AuditLogHistoricalRunLoader
-from .schema import serialize_run_metadata, serialize_timeline_event
+from .history import AuditLogHistoricalRunLoader, run_id_needles
+from .schema import serialize_run_metadata, serialize_timeline_event, serialize_timeline_event_bytes
 
 DEFAULT_AUDIT_PATH = Path("project_bundle/cam_suite_audit.jsonl")
 DEFAULT_REVEAL_LOG_PATH = Path("project_bundle/cam_ui_reveals.jsonl")
 DEFAULT_STORE_DIR = Path("project_bundle/rag_store")
 DEFAULT_DIGEST_PATH = Path("project_bundle/regulatory_digest.md")
+_TAIL_READ_SIZE = 64 * 1024
+# SSE frames produced close together are sent as one chunk (bounded in size and delay).
+_SSE_BATCH_BYTES = 64 * 1024
+_SSE_COALESCE_SECONDS = 0.015
+
+
+@lru_cache(maxsize=64)
+def _sse_event_line(event: str) -> bytes:
+    return b"event: " + event.encode("utf-8") + b"\n"
+
+
+def _format_sse(event: str, data: bytes, event_id: Optional[int] = None) -> bytes:
+    """Encode one Server-Sent Events frame."""
+    frame = bytearray()
+    if event_id is not None:
+        frame += b"id: %d\n" % event_id
+    if event:
+        frame += _sse_event_line(event)
+    # Compact JSON never contains raw CR/LF, so it goes out as a single data line.
+    # Only CR/LF end an SSE line, so split bytes rather than text (str.splitlines also breaks on U+2028).
+    if b"\n" in data or b"\r" in data:
+        for line in data.splitlines():
+            frame += b"data: " + line + b"\n"
+    else:
+        frame += b"data: " + data + b"\n"
+    frame += b"\n"
+    return bytes(frame)
 
 
 def _normalize_event_timestamp(event: TimelineEvent) -> datetime:
     """Convert event timestamps to timezone-aware UTC for ordering."""
 
     created_at = event.created_at
+    if created_at.tzinfo is timezone.utc:
+        return created_at
     if created_at.tzinfo is None:
         return created_at.replace(tzinfo=timezone.utc)
     return created_at.astimezone(timezone.utc)
 
 
+def _is_pipeline_verdict(event: TimelineEvent) -> bool:
+    """True for judge verdicts emitted by the in-pipeline CAM judge."""
+    if event.event_type != "judge_verdict":
+        return False
+    source = event.payload.get("source")
+    return source is not None and source.get("provider") == "cam-agent"
+
+
+def _sort_events_chronologically(events: List[TimelineEvent]) -> List[TimelineEvent]:
+    """Stable sort by UTC timestamp, skipped when the events are already in order (the usual case)."""
+    keys = [_normalize_event_timestamp(event) for event in events]
+    if all(earlier <= later for earlier, later in zip(keys, keys[1:])):
+        return events
+    order = sorted(range(len(events)), key=keys.__getitem__)
+    return [events[index] for index in order]
+
+
+@dataclass(slots=True)
+class _EncodedReplay:
+    """JSON-encoded timeline payloads for one run at a given audit-log size."""
+
+    size: int
+    mtime_ns: int
+    run: Optional[RunMetadata]
+    frames: List[Tuple[str, bytes]]
+    next_turn_index: int
+
+
+class _ReplayCache:
+    """
+    Reuse encoded `/stream` replay payloads across clients of the same run.
+
+    Entries are rebuilt when the audit log changes size/mtime or when the
+    run metadata cached by the loader is replaced (e.g. by a console run).
+    """
+
+    def __init__(self, loader: AuditLogHistoricalRunLoader, max_runs: int = 32):
+        self.loader = loader
+        self.max_runs = max_runs
+        self._entries: "OrderedDict[str, _EncodedReplay]" = OrderedDict()
+        # Streams build entries from worker threads; one build at a time keeps the LRU consistent.
+        self._lock = threading.Lock()
+
+    def get(self, run_id: str) -> _EncodedReplay:
+        with self._lock:
+            return self._get_locked(run_id)
+
+    def _get_locked(self, run_id: str) -> _EncodedReplay:
+        stat = self.loader.path.stat()
+        entry = self._entries.get(run_id)
+        if (
+            entry is not None
+            and entry.size == stat.st_size
+            and entry.mtime_ns == stat.st_mtime_ns
+            and entry.run is self.loader._run_cache.get(run_id)
+        ):
+            self._entries.move_to_end(run_id)
+            return entry
+
+        frames: List[Tuple[str, bytes]] = []
+        next_turn_index = 0
+        # Bound the scan to the stat'd size so the tail can resume exactly there.
+        for event in self.loader.iter_timeline_events(run_id, end=stat.st_size):
+            frames.append((event.event_type, serialize_timeline_event_bytes(event)))
+            next_turn_index = max(next_turn_index, event.turn_index + 1)
+        entry = _EncodedReplay(
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            run=self.loader._run_cache.get(run_id),
+            frames=frames,
+            next_turn_index=next_turn_index,
+        )
+        self._entries[run_id] = entry
+        self._entries.move_to_end(run_id)
+        while len(self._entries) > self.max_runs:
+            self._entries.popitem(last=False)
+        return entry
+
+
+def _json_response(payload: Any, status_code: int = 200) -> Response:
+    """Encode an already-serialised payload directly, skipping response-model validation."""
+    return Response(content=jsonio.dumps(payload), status_code=status_code, media_type="application/json")
+
+
 class ConsoleOptionsResponse(BaseModel):
     scenarios: List[Dict[str, Any]]
     judges: List[Dict[str, Any]]
 
 
+class SubmitResponse(BaseModel):
+    status: str
+    run: Dict[str, Any]
+    events: List[Dict[str, Any]]
+
+
+class RevealResponse(BaseModel):
+    status: str
+
+
 class PromptRequest(BaseModel):
+    model_config = ConfigDict(defer_build=False)
+
     prompt: str
     scenario_id: str
     judge_id: str = "none"
 
 
 class RevealRequest(BaseModel):
+    model_config = ConfigDict(defer_build=False)
+
     run_id: str
     exchange_id: str
     field: str
@@ -90,8 +221,26 @@ class InteractiveQueryGateway:
         self.digest_path = Path(os.getenv("CAM_UI_DIGEST_PATH", str(DEFAULT_DIGEST_PATH)))
         self._scenario_map = default_scenarios(self.store_dir)
         self._agent: Optional[CAMAgent] = None
+        self._audit_fd: Optional[int] = None
+        self._audit_fd_lock = threading.Lock()
+        atexit.register(self.close)
+        # Options only depend on scenarios and env config, so build them once per process
+        # unless CAM_UI_DYNAMIC_OPTIONS asks for env changes to be picked up live.
+        self._dynamic_options = os.getenv("CAM_UI_DYNAMIC_OPTIONS", "").lower() in {"1", "true", "yes", "on"}
+        self._scenario_options = self._build_scenario_options()
+        self._judge_options = self._build_judge_options()
 
     def scenario_options(self) -> List[Dict[str, Any]]:
+        if self._dynamic_options:
+            return self._build_scenario_options()
+        return self._scenario_options
+
+    def judge_options(self) -> List[Dict[str, Any]]:
+        if self._dynamic_options:
+            return self._build_judge_options()
+        return self._judge_options
+
+    def _build_scenario_options(self) -> List[Dict[str, Any]]:
         options: List[Dict[str, Any]] = []
         for scenario_id, scenario in self._scenario_map.items():
             options.append(
@@ -104,7 +253,7 @@ class InteractiveQueryGateway:
             )
         return options
 
-    def judge_options(self) -> List[Dict[str, Any]]:
+    def _build_judge_options(self) -> List[Dict[str, Any]]:
         options: List[Dict[str, Any]] = [
             {
                 "id": "none",
@@ -200,7 +349,8 @@ class InteractiveQueryGateway:
         before_size = self.loader.path.stat().st_size if self.loader.path.exists() else 0
         response = agent.handle_request(scenario_id, request)
 
-        new_records = self._collect_new_records(before_size)
+        # In-process agents hand back the records they logged; re-read the file otherwise.
+        new_records = response.audit_records or self._collect_new_records(before_size)
         if not new_records:
             logger.error(
                 "Console submission produced no new audit records",
@@ -252,14 +402,7 @@ class InteractiveQueryGateway:
             retrieval_context=response.raw_output.retrieval_context,
         )
         if external_events:
-            timeline_events = [
-                event
-                for event in timeline_events
-                if not (
-                    event.event_type == "judge_verdict"
-                    and event.payload.get("source", {}).get("provider") == "cam-agent"
-                )
-            ]
+            timeline_events = [event for event in timeline_events if not _is_pipeline_verdict(event)]
             timeline_events.extend(external_events)
 
         augmented_run = RunMetadata(
@@ -270,7 +413,10 @@ class InteractiveQueryGateway:
         )
         self.loader._run_cache[augmented_run.run_id] = augmented_run
 
-        timeline_events = [replace(event, run=augmented_run) for event in timeline_events]
+        # The events were all built above for this request and are not shared yet, so
+        # re-point their run in place rather than copying every frozen instance.
+        for event in timeline_events:
+            object.__setattr__(event, "run", augmented_run)
 
         logger.info(
             "Console submission completed",
@@ -284,20 +430,45 @@ class InteractiveQueryGateway:
 
         return augmented_run, timeline_events
 
+    def close(self) -> None:
+        """Release the audit log descriptor held for console submissions."""
+        with self._audit_fd_lock:
+            fd, self._audit_fd = self._audit_fd, None
+        if fd is not None:
+            os.close(fd)
+
+    def _read_audit_from(self, offset: int) -> bytes:
+        """Read the audit log from `offset` to EOF with one positional read on a cached descriptor."""
+        with self._audit_fd_lock:
+            inode = self.loader.path.stat().st_ino
+            if self._audit_fd is not None and os.fstat(self._audit_fd).st_ino != inode:
+                # The log was rotated or replaced; follow the path to the new file.
+                os.close(self._audit_fd)
+                self._audit_fd = None
+            if self._audit_fd is None:
+                self._audit_fd = os.open(self.loader.path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+            fd = self._audit_fd
+        size = os.fstat(fd).st_size
+        if size <= offset:
+            return b""
+        return os.pread(fd, size - offset, offset)
+
     def _collect_new_records(self, offset: int) -> List[Dict[str, Any]]:
         if not self.loader.path.exists():
             return []
+        if hasattr(os, "pread"):
+            lines = self._read_audit_from(offset).split(b"\n")
+        else:  # pragma: no cover - Windows has no pread
+            lines = self.loader.iter_lines(offset)
         records: List[Dict[str, Any]] = []
-        with self.loader.path.open("r", encoding="utf-8") as handle:
-            handle.seek(offset)
-            for line in handle:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    records.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(jsonio.loads(line))
+            except ValueError:
+                continue
         return records
 
     def _build_external_judge_events(
@@ -332,6 +503,8 @@ class InteractiveQueryGateway:
             )
             return []
 
+        # One timestamp for the whole batch: the verdicts all landed when evaluate() returned.
+        now = datetime.now(timezone.utc)
         events: List[TimelineEvent] = []
         for result in results:
             verdict = self._score_to_verdict(result.compliance)
@@ -352,7 +525,7 @@ class InteractiveQueryGateway:
                     mode="judge",
                     metadata={"judge_id": result.judge_id},
                 ),
-                created_at=datetime.now(timezone.utc),
+                created_at=now,
                 verdict=verdict,
                 score=result.compliance,
                 rationale_redacted=result.reasoning,
@@ -366,7 +539,7 @@ class InteractiveQueryGateway:
                     turn_index=turn_index,
                     event_type="judge_verdict",
                     payload_obj=payload,
-                    created_at=datetime.now(timezone.utc),
+                    created_at=now,
                 )
             )
         logger.info(
@@ -467,13 +640,55 @@ def _resolve_reveal_log_path() -> Path:
     return path
 
 
-def _append_reveal_log(entry: Dict[str, str]) -> None:
-    """Append a JSONL entry describing a reveal action."""
-
-    path = _resolve_reveal_log_path()
-    with path.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(entry, ensure_ascii=False))
-        handle.write("\n")
+class _RevealLog:
+    """Append-only reveal audit log written through one long-lived O_APPEND descriptor."""
+
+    def __init__(self, *, fsync_seconds: float = 1.0):
+        self.fsync_seconds = fsync_seconds
+        self._fd: Optional[int] = None
+        self._sync_timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def append(self, entry: Dict[str, str]) -> None:
+        """Append one JSONL entry; the line goes out in a single write so concurrent writers never interleave."""
+        line = jsonio.dumps(entry) + b"\n"
+        # Written under the lock so close() cannot release (or recycle) the descriptor mid-write.
+        with self._lock:
+            if self._fd is None:
+                self._fd = os.open(
+                    _resolve_reveal_log_path(),
+                    os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0),
+                    0o644,
+                )
+                atexit.register(self.close)
+            os.write(self._fd, line)
+            if self._sync_timer is None:
+                self._sync_timer = threading.Timer(self.fsync_seconds, self._sync)
+                self._sync_timer.daemon = True
+                self._sync_timer.start()
+
+    def _sync(self) -> None:
+        # Runs on the timer thread; fsync a duplicate so writers are not held up and close() stays safe.
+        with self._lock:
+            self._sync_timer = None
+            if self._fd is None:
+                return
+            fd = os.dup(self._fd)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def close(self) -> None:
+        with self._lock:
+            fd, self._fd = self._fd, None
+            timer, self._sync_timer = self._sync_timer, None
+        if timer is not None:
+            timer.cancel()
+        if fd is not None:
+            atexit.unregister(self.close)
+            os.fsync(fd)
+            os.close(fd)
 
 
 def create_ui_api(loader: AuditLogHistoricalRunLoader | None = None) -> FastAPI:
@@ -489,6 +704,8 @@ def create_ui_api(loader: AuditLogHistoricalRunLoader | None = None) -> FastAPI:
 
     loader_instance = loader or _resolve_loader()
     interactive_gateway = InteractiveQueryGateway(loader_instance)
+    replay_cache = _ReplayCache(loader_instance)
+    reveal_log = _RevealLog()
 
     app = FastAPI(title="CAM UI Timeline API", version="0.1.0")
 
@@ -515,25 +732,31 @@ def create_ui_api(loader: AuditLogHistoricalRunLoader | None = None) -> FastAPI:
         offset: int = Query(0, ge=0),
         loader_dep: AuditLogHistoricalRunLoader = Depends(get_loader),
     ) -> List[dict]:
-        runs = list(loader_dep.iter_runs())
-        slice_runs = runs[offset : offset + limit]
-        return [serialize_run_metadata(run) for run in slice_runs]
+        return [serialize_run_metadata(run) for run in loader_dep.runs_page(offset, limit)]
 
     @app.get("/runs/{run_id}/timeline")
     def get_run_timeline(
         run_id: str,
         limit: Optional[int] = Query(None, ge=1, le=500),
         loader_dep: AuditLogHistoricalRunLoader = Depends(get_loader),
-    ) -> List[dict]:
-        events_iter = loader_dep.iter_timeline_events(run_id)
-        events = []
-        for event in events_iter:
-            events.append(serialize_timeline_event(event))
-            if limit and len(events) >= limit:
-                break
-        if not events:
+    ) -> StreamingResponse:
+        events_iter = iter(loader_dep.iter_timeline_events(run_id))
+        first = next(events_iter, None)
+        if first is None:
             raise HTTPException(status_code=404, detail=f"No timeline events for run '{run_id}'")
-        return events
+
+        def encode_events() -> Iterator[bytes]:
+            # Emit the JSON array item by item instead of materialising the whole list.
+            yield b"[" + serialize_timeline_event_bytes(first)
+            sent = 1
+            for event in events_iter:
+                if limit and sent >= limit:
+                    break
+                yield b"," + serialize_timeline_event_bytes(event)
+                sent += 1
+            yield b"]"
+
+        return StreamingResponse(encode_events(), media_type="application/json")
 
     @app.get("/stream")
     async def stream_run_timeline(
@@ -552,95 +775,123 @@ def create_ui_api(loader: AuditLogHistoricalRunLoader | None = None) -> FastAPI:
         if not run_id:
             raise HTTPException(status_code=400, detail="run_id is required for streaming")
 
-        def format_sse(event: str, data: str, event_id: Optional[int] = None) -> bytes:
-            parts = []
-            if event_id is not None:
-                parts.append(f"id: {event_id}")
-            if event:
-                parts.append(f"event: {event}")
-            for line in data.splitlines() or [""]:
-                parts.append(f"data: {line}")
-            parts.append("")
-            return ("\n".join(parts) + "\n").encode("utf-8")
-
         async def event_generator() -> AsyncIterator[bytes]:
             event_id = 0
             turn_counters: Dict[str, int] = {}
             heartbeat_interval = max(1.0, poll_interval * 6)
             idle_elapsed = 0.0
+            # Lines for other runs are dropped on a byte scan without being parsed.
+            needles = run_id_needles(run_id)
 
+            # File IO runs in worker threads so a slow disk never stalls the event loop.
+            outgoing = bytearray()
             if replay:
-                for event in loader_dep.iter_timeline_events(run_id):
+                cached = await asyncio.to_thread(replay_cache.get, run_id)
+                for event_type, data in cached.frames:
                     event_id += 1
-                    payload = serialize_timeline_event(event)
-                    turn_counters[run_id] = max(
-                        turn_counters.get(run_id, 0), event.turn_index + 1
-                    )
-                    yield format_sse(
-                        event=event.event_type,
-                        data=json.dumps(payload),
-                        event_id=event_id,
-                    )
-
-            tail_start = loader_dep.path.stat().st_size
+                    outgoing += _format_sse(event=event_type, data=data, event_id=event_id)
+                    if len(outgoing) >= _SSE_BATCH_BYTES:
+                        yield bytes(outgoing)
+                        outgoing.clear()
+                if outgoing:
+                    yield bytes(outgoing)
+                    outgoing.clear()
+                if cached.frames:
+                    turn_counters[run_id] = cached.next_turn_index
+                tail_start = cached.size
+            else:
+                tail_start = (await asyncio.to_thread(loader_dep.path.stat)).st_size
 
             try:
-                with loader_dep.path.open("r", encoding="utf-8") as handle:
+                # Unbuffered binary reads continue from the file position, so each poll is
+                # one read() syscall; partial lines wait in `pending` until their newline lands.
+                handle = await asyncio.to_thread(loader_dep.path.open, "rb", buffering=0)
+                with handle:
                     handle.seek(tail_start)
+                    pending = bytearray()
+                    loop = asyncio.get_running_loop()
+                    batch_started: Optional[float] = None
                     while True:
-                        position = handle.tell()
-                        line = handle.readline()
-                        if not line:
+                        chunk = await asyncio.to_thread(handle.read, _TAIL_READ_SIZE)
+                        if not chunk:
+                            if outgoing:
+                                # The burst is over; send what it produced before idling.
+                                yield bytes(outgoing)
+                                outgoing.clear()
+                                batch_started = None
+                                continue
                             await asyncio.sleep(poll_interval)
                             idle_elapsed += poll_interval
                             if idle_elapsed >= heartbeat_interval:
                                 idle_elapsed = 0.0
                                 event_id += 1
-                                yield format_sse("heartbeat", "{}", event_id=event_id)
-                            handle.seek(position)
+                                yield _format_sse("heartbeat", b"{}", event_id=event_id)
                             continue
 
                         idle_elapsed = 0.0
-                        line = line.strip()
-                        if not line:
-                            continue
-                        try:
-                            record = json.loads(line)
-                        except json.JSONDecodeError:
-                            continue
-
-                        record_run_id = loader_dep._extract_run_id(record)
-                        if record_run_id != run_id:
-                            continue
-
-                        fallback_index = turn_counters.get(record_run_id, 0)
-                        _, actual_index, events = loader_dep.build_events_from_raw_record(
-                            record=record,
-                            fallback_turn_index=fallback_index,
-                        )
-                        turn_counters[record_run_id] = actual_index + 1
-
-                        for event in events:
-                            event_id += 1
-                            yield format_sse(
-                                event=event.event_type,
-                                data=json.dumps(serialize_timeline_event(event)),
-                                event_id=event_id,
+                        pending += chunk
+                        line_start = 0
+                        while (line_end := pending.find(b"\n", line_start)) != -1:
+                            line = pending[line_start:line_end].strip()
+                            line_start = line_end + 1
+                            if not line:
+                                continue
+                            if needles is not None and not any(needle in line for needle in needles):
+                                continue
+                            try:
+                                record = jsonio.loads(line)
+                            except ValueError:
+                                continue
+
+                            record_run_id = loader_dep._extract_run_id(record)
+                            if record_run_id != run_id:
+                                continue
+
+                            fallback_index = turn_counters.get(record_run_id, 0)
+                            _, actual_index, events = loader_dep.build_events_from_raw_record(
+                                record=record,
+                                fallback_turn_index=fallback_index,
+                                run_id=record_run_id,
                             )
+                            turn_counters[record_run_id] = actual_index + 1
+
+                            for event in events:
+                                event_id += 1
+                                outgoing += _format_sse(
+                                    event=event.event_type,
+                                    data=serialize_timeline_event_bytes(event),
+                                    event_id=event_id,
+                                )
+                        del pending[:line_start]
+
+                        if outgoing:
+                            now = loop.time()
+                            if batch_started is None:
+                                batch_started = now
+                            waited = now - batch_started
+                            if len(outgoing) >= _SSE_BATCH_BYTES or waited >= _SSE_COALESCE_SECONDS:
+                                yield bytes(outgoing)
+                                outgoing.clear()
+                                batch_started = None
+                            else:
+                                # Give the rest of a burst (one turn writes several records) time to land.
+                                await asyncio.sleep(_SSE_COALESCE_SECONDS - waited)
             except asyncio.CancelledError:
                 raise
 
         return StreamingResponse(event_generator(), media_type="text/event-stream")
 
     @app.get("/console/options", response_model=ConsoleOptionsResponse)
-    def console_options() -> ConsoleOptionsResponse:
-        return ConsoleOptionsResponse(
-            scenarios=interactive_gateway.scenario_options(),
-            judges=interactive_gateway.judge_options(),
+    def console_options() -> Response:
+        return _json_response(
+            {
+                "scenarios": interactive_gateway.scenario_options(),
+                "judges": interactive_gateway.judge_options(),
+            }
         )
 
-    @app.post("/console", status_code=201)
-    def submit_prompt(payload: PromptRequest) -> dict:
+    @app.post("/console", status_code=201, response_model=SubmitResponse)
+    def submit_prompt(payload: PromptRequest) -> Response:
         """
         Execute an interactive CAM query and return timeline events.
         """
@@ -650,15 +901,18 @@ def create_ui_api(loader: AuditLogHistoricalRunLoader | None = None) -> FastAPI:
             scenario_id=payload.scenario_id,
             judge_id=payload.judge_id,
         )
-        sorted_events = sorted(events, key=_normalize_event_timestamp)
-        return {
-            "status": "ok",
-            "run": serialize_run_metadata(run_meta),
-            "events": [serialize_timeline_event(event) for event in sorted_events],
-        }
+        sorted_events = _sort_events_chronologically(events)
+        return _json_response(
+            {
+                "status": "ok",
+                "run": serialize_run_metadata(run_meta),
+                "events": [serialize_timeline_event(event) for event in sorted_events],
+            },
+            status_code=201,
+        )
 
-    @app.post("/reveal", status_code=202)
-    def log_reveal(payload: RevealRequest) -> dict:
+    @app.post("/reveal", status_code=202, response_model=RevealResponse)
+    def log_reveal(payload: RevealRequest) -> Response:
         """
         Record that a user has requested access to sensitive content.
 
@@ -675,8 +929,8 @@ def create_ui_api(loader: AuditLogHistoricalRunLoader | None = None) -> FastAPI:
         if payload.reason:
             entry["reason"] = payload.reason
 
-        _append_reveal_log(entry)
-        return {"status": "logged"}
+        reveal_log.append(entry)
+        return _json_response({"status": "logged"}, status_code=202)
 
     return app
 
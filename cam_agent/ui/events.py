@@ -12,10 +12,49 @@ from __future__ import annotations
 
 from dataclasses import asdict, dataclass, field, is_dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+_INTERN_MAX_ITEMS = 4
+_INTERN_MAX_SHAPES = 4096
+_INTERNED_DICTS: Dict[Tuple[Tuple[Any, ...], ...], Dict[Any, Any]] = {}
 
-@dataclass(frozen=True)
+
+class _ReadOnlyDict(dict):
+    """Dict shared between interned events; mutating it would change every event holding it."""
+
+    __slots__ = ()
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("interned event metadata is read-only; copy it with dict() first")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _read_only  # type: ignore[assignment]
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (type(self), (dict(self),))
+
+
+def _intern_small_dict(values: Dict[Any, Any]) -> Dict[Any, Any]:
+    """Share one read-only dict between events whose small metadata/tags mappings are equal."""
+    if not values or len(values) > _INTERN_MAX_ITEMS:
+        return values
+    # Types are part of the key: True, 1 and 1.0 compare equal but serialise differently.
+    key = tuple((type(k), k, type(v), v) for k, v in values.items())
+    try:
+        shared = _INTERNED_DICTS.get(key)
+    except TypeError:  # unhashable values
+        return values
+    if shared is not None:
+        return shared
+    if len(_INTERNED_DICTS) >= _INTERN_MAX_SHAPES:
+        return values
+    # Keep a private copy so later changes to the caller's dict cannot leak into other events.
+    shared = _ReadOnlyDict(values)
+    _INTERNED_DICTS[key] = shared
+    return shared
+
+
+@dataclass(frozen=True, slots=True)
 class EventSource:
     """Identifies the model/provider that produced an event payload."""
 
@@ -24,8 +63,11 @@ class EventSource:
     mode: Optional[str] = None  # e.g., "rag", "baseline", "judge"
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "metadata", _intern_small_dict(self.metadata))
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserPromptEvent:
     """Initial user submission captured prior to model responses."""
 
@@ -38,7 +80,7 @@ class UserPromptEvent:
     question_category: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunMetadata:
     """Describes a pipeline run shown in the UI."""
 
@@ -47,8 +89,11 @@ class RunMetadata:
     started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     tags: Dict[str, str] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "tags", _intern_small_dict(self.tags))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ViolationDetail:
     """Captured classification for compliance or policy violations."""
 
@@ -59,7 +104,7 @@ class ViolationDetail:
     description: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LLMResponseEvent:
     """Represents the base LLM answer recorded for an exchange."""
 
@@ -83,7 +128,7 @@ class LLMResponseEvent:
         return self.pii_redacted_text or self.pii_raw_text
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JudgeVerdictEvent:
     """Encapsulates the judge model assessment for an exchange."""
 
@@ -104,7 +149,7 @@ class JudgeVerdictEvent:
         return self.rationale_redacted or self.rationale_raw
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MetricSnapshot:
     """Aggregate metrics tied to a run or window of exchanges."""
 
@@ -116,7 +161,7 @@ class MetricSnapshot:
     breakdowns: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TimelineEvent:
     """Generic wrapper so the UI can render events chronologically."""
 
@@ -128,6 +173,82 @@ class TimelineEvent:
     created_at: datetime
 
 
+def _source_to_dict(source: EventSource) -> Dict[str, Any]:
+    return {
+        "model_id": source.model_id,
+        "provider": source.provider,
+        "mode": source.mode,
+        "metadata": dict(source.metadata),
+    }
+
+
+def _violation_to_dict(violation: Optional[ViolationDetail]) -> Optional[Dict[str, Any]]:
+    if violation is None:
+        return None
+    return {
+        "category": violation.category,
+        "severity": violation.severity,
+        "violation_type": violation.violation_type,
+        "clause_reference": violation.clause_reference,
+        "description": violation.description,
+    }
+
+
+def _user_prompt_to_dict(event: UserPromptEvent) -> Dict[str, Any]:
+    return {
+        "exchange_id": event.exchange_id,
+        "turn_index": event.turn_index,
+        "source": _source_to_dict(event.source),
+        "created_at": event.created_at,
+        "prompt_text": event.prompt_text,
+        "prompt_redacted": event.prompt_redacted,
+        "question_category": event.question_category,
+    }
+
+
+def _llm_response_to_dict(event: LLMResponseEvent) -> Dict[str, Any]:
+    return {
+        "exchange_id": event.exchange_id,
+        "turn_index": event.turn_index,
+        "source": _source_to_dict(event.source),
+        "created_at": event.created_at,
+        "prompt_chars": event.prompt_chars,
+        "completion_chars": event.completion_chars,
+        "latency_ms": event.latency_ms,
+        "token_usage": dict(event.token_usage),
+        "question_category": event.question_category,
+        "context_tokens": event.context_tokens,
+        "prompt_preview": event.prompt_preview,
+        "pii_redacted_text": event.pii_redacted_text,
+        "pii_raw_text": event.pii_raw_text,
+        "pii_fields": list(event.pii_fields),
+    }
+
+
+def _judge_verdict_to_dict(event: JudgeVerdictEvent) -> Dict[str, Any]:
+    return {
+        "exchange_id": event.exchange_id,
+        "turn_index": event.turn_index,
+        "source": _source_to_dict(event.source),
+        "created_at": event.created_at,
+        "verdict": event.verdict,
+        "score": event.score,
+        "rationale_redacted": event.rationale_redacted,
+        "rationale_raw": event.rationale_raw,
+        "violation": _violation_to_dict(event.violation),
+        "latency_ms": event.latency_ms,
+        "metadata": dict(event.metadata),
+    }
+
+
+# Field-by-field builders for the hot payload types; other dataclasses go through `asdict`.
+_PAYLOAD_BUILDERS = {
+    UserPromptEvent: _user_prompt_to_dict,
+    LLMResponseEvent: _llm_response_to_dict,
+    JudgeVerdictEvent: _judge_verdict_to_dict,
+}
+
+
 def build_timeline_event(
     run: RunMetadata,
     exchange_id: str,
@@ -151,7 +272,10 @@ def build_timeline_event(
         TimelineEvent: Normalised event ready for streaming or storage.
     """
 
-    if is_dataclass(payload_obj):
+    builder = _PAYLOAD_BUILDERS.get(type(payload_obj))
+    if builder is not None:
+        payload = builder(payload_obj)
+    elif is_dataclass(payload_obj):
         payload = asdict(payload_obj)
     elif isinstance(payload_obj, dict):
         payload = payload_obj
@@ -10,11 +10,17 @@ door open for database-backed loaders in future iterations.
 
 from __future__ import annotations
 
-import json
+import mmap
+import os
+import re
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from cam_agent.utils import jsonio
 
 from .events import (
     EventSource,
@@ -31,6 +37,13 @@ def _parse_timestamp(value: Optional[str]) -> datetime:
     """Parse ISO 8601 timestamps emitted by the pipeline."""
     if not value:
         return datetime.now(timezone.utc)
+    parsed = _parse_iso_timestamp(value)
+    return parsed if parsed is not None else datetime.now(timezone.utc)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_timestamp(value: str) -> Optional[datetime]:
+    """Cached UTC parse of one timestamp string; None when it is not valid ISO 8601."""
     try:
         if value.endswith("Z"):
             value = value[:-1] + "+00:00"
@@ -39,7 +52,7 @@ def _parse_timestamp(value: Optional[str]) -> datetime:
             return parsed.replace(tzinfo=timezone.utc)
         return parsed.astimezone(timezone.utc)
     except ValueError:
-        return datetime.now(timezone.utc)
+        return None
 
 
 def _truncate_preview(text: str, limit: int = 400) -> str:
@@ -50,6 +63,48 @@ def _truncate_preview(text: str, limit: int = 400) -> str:
     return f"{trimmed}…"
 
 
+_JUDGE_SEVERITIES = frozenset({"info", "warn", "block"})
+
+UNKNOWN_RUN_ID = "unknown-run"
+_PLAIN_RUN_ID = re.compile(r"[A-Za-z0-9_.:@-]+")
+
+
+def _maybe_non_string(piece: str) -> bool:
+    """True when `str(value)` of a non-string JSON value (number/bool) could yield `piece`."""
+    if piece in {"True", "False"}:
+        return True
+    try:
+        float(piece)
+    except ValueError:
+        return False
+    return True
+
+
+def run_id_needles(run_id: str) -> Optional[Tuple[bytes, ...]]:
+    """
+    Quoted byte strings, at least one of which appears in any raw audit line
+    that `_extract_run_id` resolves to `run_id`.
+
+    Covers an explicit `run_id` as well as the session/user fallbacks
+    (including the `{user_id}-{session_id}` composite, split at every dash).
+    Returns None when no safe byte test exists (the unknown-run fallback, ids
+    needing JSON escapes, or ids that could come from numeric/boolean values),
+    meaning "parse every line".
+    """
+    if run_id == UNKNOWN_RUN_ID or not _PLAIN_RUN_ID.fullmatch(run_id) or _maybe_non_string(run_id):
+        return None
+    pieces = {run_id}
+    for index, char in enumerate(run_id):
+        if char != "-":
+            continue
+        # A composite match needs both halves; a half that may be unquoted cannot serve as a needle.
+        halves = [half for half in (run_id[:index], run_id[index + 1 :]) if half and not _maybe_non_string(half)]
+        if not halves:
+            return None
+        pieces.update(halves)
+    return tuple(f'"{piece}"'.encode("ascii") for piece in pieces)
+
+
 @dataclass
 class AuditLogHistoricalRunLoader:
     """
@@ -63,79 +118,136 @@ class AuditLogHistoricalRunLoader:
 
     path: Path
     _run_cache: Dict[str, RunMetadata] = field(default_factory=dict, init=False, repr=False)
-
-    def iter_timeline_events(self, run_id: str) -> Iterator[TimelineEvent]:
+    # Runs in discovery order, extended incrementally as the log grows.
+    _runs_index: List[RunMetadata] = field(default_factory=list, init=False, repr=False)
+    _runs_seen: set = field(default_factory=set, init=False, repr=False)
+    _index_offset: int = field(default=0, init=False, repr=False)
+    _index_inode: Optional[int] = field(default=None, init=False, repr=False)
+    _index_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def iter_timeline_events(self, run_id: str, *, end: Optional[int] = None) -> Iterator[TimelineEvent]:
         """
         Stream timeline events for the requested run.
 
         Args:
             run_id: Identifier as captured in the audit log.
+            end: Optional byte offset to stop reading at.
 
         Yields:
             TimelineEvent objects ready for serialisation.
         """
 
+        needles = run_id_needles(run_id)
         turn_counter = 0
-        with self.path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                line = line.strip()
-                if not line:
-                    continue
-                record = json.loads(line)
-                record_run_id = self._extract_run_id(record)
-                if record_run_id != run_id:
-                    continue
-                _, actual_turn, events = self.build_events_from_raw_record(
-                    record=record,
-                    fallback_turn_index=turn_counter,
-                )
-                for event in events:
-                    yield event
-                turn_counter = actual_turn + 1
+        for line in self.iter_lines(end=end):
+            # Lines that cannot resolve to this run are skipped before paying for a JSON parse.
+            if needles is not None and not any(needle in line for needle in needles):
+                continue
+            record = jsonio.loads(line)
+            record_run_id = self._extract_run_id(record)
+            if record_run_id != run_id:
+                continue
+            _, actual_turn, events = self.build_events_from_raw_record(
+                record=record,
+                fallback_turn_index=turn_counter,
+                run_id=record_run_id,
+            )
+            for event in events:
+                yield event
+            turn_counter = actual_turn + 1
+
+    def iter_lines(self, offset: int = 0, *, end: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Yield the non-empty raw lines of the audit log between `offset` and `end`.
+
+        The file is memory-mapped for the duration of the scan so replay is
+        served from the page cache without per-line read calls. A fresh map
+        is taken per call, so a log that grows or is rotated between calls
+        is always seen at its current size.
+        """
+
+        with self.path.open("rb") as handle:
+            size = os.fstat(handle.fileno()).st_size
+            if end is not None:
+                size = min(size, end)
+            if size <= offset:
+                return
+            with mmap.mmap(handle.fileno(), size, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                position = offset
+                while position < size:
+                    line_end = mapped.find(b"\n", position)
+                    if line_end == -1:
+                        line_end = size
+                    line = mapped[position:line_end].strip()
+                    position = line_end + 1
+                    if line:
+                        yield line
 
     def iter_runs(self) -> Iterable[RunMetadata]:
         """
         Iterate through unique run metadata found in the audit log.
 
+        Only bytes appended since the previous call are scanned; the index is
+        rebuilt from scratch when the log shrinks or is replaced.
+
         Returns:
             Iterable of RunMetadata entries in discovery order.
         """
 
-        seen = set()
-        with self.path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                line = line.strip()
-                if not line:
-                    continue
-                record = json.loads(line)
-                run_id = self._extract_run_id(record)
-                if not run_id or run_id in seen:
-                    continue
-                seen.add(run_id)
-
-                started_at = _parse_timestamp(record.get("timestamp"))
-                scenario_id = record.get("scenario_id")
-                tags = record.get("run_tags") or {}
-
-                meta = RunMetadata(
-                    run_id=str(run_id),
-                    scenario_id=scenario_id,
-                    started_at=started_at,
-                    tags=tags if isinstance(tags, dict) else {},
-                )
-                self._run_cache[meta.run_id] = meta
-                yield meta
+        with self._index_lock:
+            self._refresh_runs_index()
+            return list(self._runs_index)
+
+    def runs_page(self, offset: int, limit: int) -> List[RunMetadata]:
+        """Return `limit` runs starting at `offset`, in discovery order."""
+
+        with self._index_lock:
+            self._refresh_runs_index()
+            return self._runs_index[offset : offset + limit]
+
+    def _refresh_runs_index(self) -> None:
+        stat = self.path.stat()
+        if stat.st_ino != self._index_inode or stat.st_size < self._index_offset:
+            self._runs_index.clear()
+            self._runs_seen.clear()
+            self._index_offset = 0
+            self._index_inode = stat.st_ino
+        # Stop at the last complete line so a record still being written is picked up next time.
+        end = self._complete_lines_end(self._index_offset, stat.st_size)
+        if end <= self._index_offset:
+            return
+        for line in self.iter_lines(self._index_offset, end=end):
+            record = jsonio.loads(line)
+            run_id = self._extract_run_id(record)
+            if not run_id or run_id in self._runs_seen:
+                continue
+            self._runs_seen.add(run_id)
+
+            started_at = _parse_timestamp(record.get("timestamp"))
+            scenario_id = record.get("scenario_id")
+            tags = record.get("run_tags") or {}
+
+            meta = RunMetadata(
+                run_id=str(run_id),
+                scenario_id=scenario_id,
+                started_at=started_at,
+                tags=tags if isinstance(tags, dict) else {},
+            )
+            self._run_cache[meta.run_id] = meta
+            self._runs_index.append(meta)
+        self._index_offset = end
 
-    def _build_run_metadata(self, run_id: str) -> Optional[RunMetadata]:
-        """Locate the first record for a run to seed metadata."""
-        cached = self._run_cache.get(run_id)
-        if cached:
-            return cached
-        for meta in self.iter_runs():
-            if meta.run_id == run_id:
-                self._run_cache[run_id] = meta
-                return meta
-        return None
+    def _complete_lines_end(self, offset: int, size: int) -> int:
+        """Byte offset just past the last newline in `[offset, size)`, or `offset` if none."""
+
+        if size <= offset:
+            return offset
+        with self.path.open("rb") as handle:
+            with mmap.mmap(handle.fileno(), size, access=mmap.ACCESS_READ) as mapped:
+                last_newline = mapped.rfind(b"\n", offset, size)
+        return offset if last_newline == -1 else last_newline + 1
 
     def _resolve_run_metadata_from_record(
         self,
@@ -165,15 +277,19 @@ class AuditLogHistoricalRunLoader:
         self,
         record: dict,
         fallback_turn_index: int = 0,
+        run_id: Optional[str] = None,
     ) -> tuple[str, int, List[TimelineEvent]]:
         """
         Convert a raw audit record into timeline events.
 
+        `run_id` may be passed when the caller has already extracted it.
+
         Returns:
             Tuple containing (run_id, turn_index_used, [TimelineEvent, ...]).
         """
 
-        run_id = self._extract_run_id(record)
+        if run_id is None:
+            run_id = self._extract_run_id(record)
         timestamp = _parse_timestamp(record.get("timestamp"))
         exchange_id = (
             record.get("exchange_id")
@@ -220,11 +336,7 @@ class AuditLogHistoricalRunLoader:
         session_id = record.get("session_id") or record.get("session")
         if user_id and session_id:
             return f"{user_id}-{session_id}"
-        if session_id:
-            return str(session_id)
-        if user_id:
-            return str(user_id)
-        return "unknown-run"
+        return str(session_id or user_id or UNKNOWN_RUN_ID)
 
     def _events_from_record(
         self,
@@ -249,7 +361,7 @@ class AuditLogHistoricalRunLoader:
         if llm_event:
             events.append(llm_event)
 
-        judge_events = list(
+        events.extend(
             self._build_judge_events(
                 run=run,
                 exchange_id=exchange_id,
@@ -258,7 +370,6 @@ class AuditLogHistoricalRunLoader:
                 created_at=created_at,
             )
         )
-        events.extend(judge_events)
 
         if events:
             return events
@@ -351,22 +462,23 @@ class AuditLogHistoricalRunLoader:
         turn_index: int,
         record: dict,
         created_at: datetime,
-    ) -> Iterable[TimelineEvent]:
-        """Yield judge verdict events based on compliance issues in the record."""
+    ) -> List[TimelineEvent]:
+        """Build judge verdict events based on compliance issues in the record."""
 
         issues = record.get("issues") or []
         if not isinstance(issues, list) or not issues:
-            return
+            return []
 
         verdict = str(record.get("action") or "allow").lower()
         judge_model = record.get("judge_model") or record.get("judge") or "cam.compliance"
         judge_provider = record.get("judge_provider") or "cam-agent"
 
+        events: List[TimelineEvent] = []
         for index, issue in enumerate(issues):
             severity = str(issue.get("severity") or "warn").lower()
             if severity == "error":
                 severity = "block"
-            if severity not in {"info", "warn", "block"}:
+            if severity not in _JUDGE_SEVERITIES:
                 severity = "warn"
 
             violation = ViolationDetail(
@@ -399,11 +511,14 @@ class AuditLogHistoricalRunLoader:
                 },
             )
 
-            yield build_timeline_event(
-                run=run,
-                exchange_id=exchange_id,
-                turn_index=turn_index,
-                event_type="judge_verdict",
-                payload_obj=payload,
-                created_at=created_at,
+            events.append(
+                build_timeline_event(
+                    run=run,
+                    exchange_id=exchange_id,
+                    turn_index=turn_index,
+                    event_type="judge_verdict",
+                    payload_obj=payload,
+                    created_at=created_at,
+                )
             )
+        return events
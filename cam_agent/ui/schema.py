@@ -11,9 +11,15 @@ WebSocket payloads.
 
 from __future__ import annotations
 
-from dataclasses import is_dataclass
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
+
+from cam_agent.utils import jsonio
+
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - handled at runtime
+    orjson = None
 
 from .events import (
     EventSource,
@@ -34,6 +40,21 @@ def _to_isoformat(value: datetime) -> str:
     return value.isoformat() + "Z"
 
 
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+# Field names per dataclass type (None for non-dataclasses), filled on first sight.
+_FIELDS_CACHE: Dict[type, Optional[Tuple[str, ...]]] = {}
+
+
+def _dataclass_fields(cls: type) -> Optional[Tuple[str, ...]]:
+    try:
+        return _FIELDS_CACHE[cls]
+    except KeyError:
+        fields = getattr(cls, "__dataclass_fields__", None)
+        names = tuple(fields) if fields is not None else None
+        _FIELDS_CACHE[cls] = names
+        return names
+
+
 def _serialize(obj: Any) -> Any:
     """
     Recursively serialise dataclasses, converting datetimes to strings.
@@ -41,10 +62,14 @@ def _serialize(obj: Any) -> Any:
     This keeps payloads JSON-compatible without requiring frontend
     consumers to understand Python-specific types.
     """
+    cls = type(obj)
+    if cls in _SCALAR_TYPES:
+        return obj
     if isinstance(obj, datetime):
         return _to_isoformat(obj)
-    if is_dataclass(obj):
-        return {key: _serialize(getattr(obj, key)) for key in obj.__dataclass_fields__}
+    names = _dataclass_fields(cls)
+    if names is not None:
+        return {key: _serialize(getattr(obj, key)) for key in names}
     if isinstance(obj, dict):
         return {key: _serialize(value) for key, value in obj.items()}
     if isinstance(obj, (list, tuple)):
@@ -66,6 +91,26 @@ def serialize_timeline_event(event: TimelineEvent) -> Dict[str, Any]:
     return _serialize(event)
 
 
+def _encode_default(obj: Any) -> Any:
+    if isinstance(obj, datetime):
+        return _to_isoformat(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def serialize_timeline_event_bytes(event: TimelineEvent) -> bytes:
+    """Encode a TimelineEvent straight to compact JSON bytes (orjson when installed)."""
+
+    if orjson is not None:
+        # orjson walks the (slotted) dataclasses natively; only datetimes come back to
+        # Python so they keep the `_to_isoformat` rendering used by the dict path.
+        return orjson.dumps(
+            event,
+            default=_encode_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+    return jsonio.dumps(_serialize(event))
+
+
 def serialize_run_metadata(run: RunMetadata) -> Dict[str, Any]:
     """Serialise RunMetadata to primitive dict."""
 
@@ -144,6 +189,7 @@ def get_timeline_event_schema() -> Dict[str, Any]:
 
 __all__ = [
     "serialize_timeline_event",
+    "serialize_timeline_event_bytes",
     "serialize_run_metadata",
     "get_timeline_event_schema",
     # Re-export dataclasses for callers that only import schema helpers.
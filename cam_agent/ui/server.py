@@ -9,6 +9,8 @@ Environment variables:
     CAM_UI_API_HOST    Host interface to bind (default: 127.0.0.1).
     CAM_UI_API_PORT    Port for the service (default: 8000).
     CAM_UI_API_RELOAD  Set to "1" to enable autoreload (development only).
+    CAM_UI_DYNAMIC_OPTIONS  Set to "1" to rebuild console scenario/judge options
+                       per request instead of once at startup.
 """
 
 from __future__ import annotations
@@ -16,10 +18,6 @@ from __future__ import annotations
 import os
 from typing import Optional
 
-import uvicorn
-
-from .api import create_ui_api
-
 
 def _env_bool(value: Optional[str], default: bool = False) -> bool:
     if value is None:
@@ -30,6 +28,10 @@ def _env_bool(value: Optional[str], default: bool = False) -> bool:
 def main() -> None:
     """Boot the FastAPI application with configurable host/port."""
 
+    # Imported here so loading this module does not pull in the server stack;
+    # uvicorn imports the app itself from the "module:attr" string below.
+    import uvicorn
+
     host = os.getenv("CAM_UI_API_HOST", "127.0.0.1")
     port = int(os.getenv("CAM_UI_API_PORT", "8000"))
     reload_flag = _env_bool(os.getenv("CAM_UI_API_RELOAD"), default=False)
@@ -1,5 +1,5 @@
 """Helper utilities shared across CAM components."""
 
-from .checksum import compute_directory_checksums, verify_checksums
+from .checksum import compute_directory_checksums, verify_checksums, verify_directory_checksums
 
-__all__ = ["compute_directory_checksums", "verify_checksums"]
+__all__ = ["compute_directory_checksums", "verify_checksums", "verify_directory_checksums"]
@@ -2,29 +2,139 @@
 
 from __future__ import annotations
 
+import fnmatch
 import hashlib
-import json
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, Iterable, Tuple
+from typing import Any, Callable, Dict, Iterable, Tuple
 
+from cam_agent.utils import jsonio
 
-def compute_directory_checksums(path: Path, patterns: Iterable[str] = ("*.json", "*.faiss")) -> Dict[str, str]:
-    """Compute SHA256 checksums for matching files in a directory."""
-    checksums: Dict[str, str] = {}
+try:  # pragma: no cover - optional dependency
+    import blake3  # type: ignore
+except ImportError:  # pragma: no cover - handled at runtime
+    blake3 = None
+
+DEFAULT_ALGORITHM = "sha256"
+DEFAULT_PATTERNS = ("*.json", "*.faiss")
+
+
+def compute_directory_checksums(
+    path: Path,
+    patterns: Iterable[str] = DEFAULT_PATTERNS,
+    *,
+    algorithm: str = DEFAULT_ALGORITHM,
+) -> Dict[str, str]:
+    """
+    Compute checksums for matching files in a directory.
+
+    SHA-256 digests are stored bare (the historical snapshot format); other
+    algorithms (`blake2b`, or `blake3` when installed) are prefixed with
+    `"<algorithm>:"` so `verify_directory_checksums` can recompute alike.
+    """
+    digest = partial(file_checksum, algorithm=algorithm)
+    files = _match_files(path, tuple(patterns))
+    # BLAKE3 already spreads one file across its own threads; nesting pools only oversubscribes.
+    if len(files) <= 1 or algorithm == "blake3":
+        return {name: digest(file_path) for name, file_path in files.items()}
+    # hashlib releases the GIL while digesting, so threads hash files in parallel.
+    with ThreadPoolExecutor(max_workers=min(8, len(files), os.cpu_count() or 1)) as pool:
+        digests = pool.map(digest, files.values())
+        return dict(zip(files, digests))
+
+
+def verify_directory_checksums(
+    path: Path,
+    expected: Dict[str, str],
+    patterns: Iterable[str] = DEFAULT_PATTERNS,
+) -> Tuple[bool, Dict[str, Tuple[str, str]]]:
+    """Recompute `path` with the algorithm recorded in `expected` and compare."""
+    algorithm = checksum_algorithm(next(iter(expected.values()), ""))
+    return verify_checksums(compute_directory_checksums(path, patterns, algorithm=algorithm), expected)
+
+
+def checksum_algorithm(digest: str) -> str:
+    """Algorithm named by a stored digest's prefix; bare digests are SHA-256."""
+    prefix, separator, _ = digest.partition(":")
+    return prefix if separator else DEFAULT_ALGORITHM
+
+
+def _match_files(path: Path, patterns: Tuple[str, ...]) -> Dict[str, Path]:
+    """Name -> path for entries matching `patterns`, in pattern order then sorted name order."""
+    files: Dict[str, Path] = {}
+    if any("/" in pattern or os.sep in pattern or "**" in pattern for pattern in patterns):
+        for pattern in patterns:
+            for file_path in sorted(path.glob(pattern)):
+                files[file_path.name] = file_path
+        return files
+    # Flat patterns: read the directory once and match names in memory.
+    with os.scandir(path) as entries:
+        names = sorted(entry.name for entry in entries)
     for pattern in patterns:
-        for file_path in sorted(path.glob(pattern)):
-            checksums[file_path.name] = sha256_of_file(file_path)
-    return checksums
+        for name in names:
+            if fnmatch.fnmatch(name, pattern):
+                files.setdefault(name, path / name)
+    return files
 
 
-def sha256_of_file(path: Path) -> str:
-    hasher = hashlib.sha256()
+_READ_SIZE = 1 << 20
+# Above this size the file is hashed straight from a read-only map instead of copied in.
+_MMAP_THRESHOLD = 4 << 20
+
+
+def _digest_file(path: Path, factory: Callable[[], Any]) -> str:
     with path.open("rb") as fh:
-        for chunk in iter(lambda: fh.read(8192), b""):
+        if os.fstat(fh.fileno()).st_size > _MMAP_THRESHOLD:
+            hasher = factory()
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                hasher.update(mapped)
+            return hasher.hexdigest()
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+: C-level loop over a reused buffer
+            return hashlib.file_digest(fh, factory).hexdigest()
+        hasher = factory()
+        for chunk in iter(lambda: fh.read(_READ_SIZE), b""):
             hasher.update(chunk)
     return hasher.hexdigest()
 
 
+def sha256_of_file(path: Path) -> str:
+    return _digest_file(path, hashlib.sha256)
+
+
+def blake2b_of_file(path: Path) -> str:
+    """128-bit BLAKE2b digest, for change detection where SHA-256 strength is not needed."""
+    return _digest_file(path, lambda: hashlib.blake2b(digest_size=16))
+
+
+def blake3_of_file(path: Path) -> str:
+    """BLAKE3 digest computed from a memory map with the hasher's own thread pool."""
+    if blake3 is None:
+        raise RuntimeError("blake3 is required for blake3 checksums. Install with `pip install blake3`.")
+    hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+    hasher.update_mmap(str(path))
+    return hasher.hexdigest()
+
+
+_FILE_HASHERS: Dict[str, Callable[[Path], str]] = {
+    "sha256": sha256_of_file,
+    "blake2b": blake2b_of_file,
+    "blake3": blake3_of_file,
+}
+
+
+def file_checksum(path: Path, algorithm: str = DEFAULT_ALGORITHM) -> str:
+    """Stored-form digest of `path`: bare for SHA-256, `"<algorithm>:<hex>"` otherwise."""
+    try:
+        hasher = _FILE_HASHERS[algorithm]
+    except KeyError:
+        raise ValueError(f"Unknown checksum algorithm '{algorithm}' (expected one of {', '.join(_FILE_HASHERS)})") from None
+    digest = hasher(path)
+    return digest if algorithm == DEFAULT_ALGORITHM else f"{algorithm}:{digest}"
+
+
 def verify_checksums(actual: Dict[str, str], expected: Dict[str, str]) -> Tuple[bool, Dict[str, Tuple[str, str]]]:
     """Compare computed checksums with expected mapping."""
     mismatches: Dict[str, Tuple[str, str]] = {}
@@ -42,9 +152,10 @@ def verify_checksums(actual: Dict[str, str], expected: Dict[str, str]) -> Tuple[
 
 
 def load_checksums(path: Path) -> Dict[str, str]:
-    return json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+    return jsonio.loads(path.read_bytes()) if path.exists() else {}
 
 
 def save_checksums(path: Path, data: Dict[str, str]) -> None:
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    # Sorted keys keep the manifest stable across runs for git diffs.
+    path.write_bytes(jsonio.dumps(data, pretty=True))
 
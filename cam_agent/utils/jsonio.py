@@ -0,0 +1,42 @@
+"""JSON encode/decode helpers that prefer orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Optional, Union
+
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - handled at runtime
+    orjson = None
+
+
+def dumps(obj: Any, *, pretty: bool = False, sort_keys: Optional[bool] = None) -> bytes:
+    """
+    Serialise `obj` to compact UTF-8 JSON bytes, or 2-space indented if `pretty`.
+
+    Keys are sorted when `sort_keys` is true; it defaults to `pretty`.
+    """
+    if sort_keys is None:
+        sort_keys = pretty
+    if orjson is not None:
+        # Match json.dumps, which coerces int/float dict keys to strings.
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2, sort_keys=sort_keys).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys).encode("utf-8")
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Parse JSON from bytes or text; raises `ValueError` on malformed input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+__all__ = ["dumps", "loads"]
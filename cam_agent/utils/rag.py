@@ -9,6 +9,8 @@ from typing import Dict, Iterable, List, Tuple
 
 from cam_agent.utils.sources import make_label, short_title
 
+_CITE_RE = re.compile(r"\(see\s*\[(\d+)\]\)")
+
 
 def add_titles_to_cites(
     answer: str,
@@ -26,38 +28,39 @@ def add_titles_to_cites(
         label = make_label(title, passage)
         return f"({label}; see [{idx}])"
 
-    return re.sub(r"\(see\s*\[(\d+)\]\)", repl, answer)
+    return _CITE_RE.sub(repl, answer)
 
 
-def build_ctx_and_maps(hits: Iterable[Dict]) -> Tuple[str, Dict[int, str], Dict[int, str]]:
-    """Create context block plus lookup maps from retrieved hits."""
+def build_prompt_assets(hits: Iterable[Dict]) -> Tuple[str, Dict[int, str], Dict[int, str], str]:
+    """Build the context block, lookup maps and legend in a single pass over `hits`."""
     lines: List[str] = []
+    items: List[str] = []
     id_to_title: Dict[int, str] = {}
     id_to_passage: Dict[int, str] = {}
     for idx, chunk in enumerate(hits, start=1):
         title = short_title(chunk["path"])
-        passage = (chunk.get("text") or "").strip()
+        text = chunk.get("text") or ""
+        passage = text.strip()
         id_to_title[idx] = title
         id_to_passage[idx] = passage
         lines.append(f"[{idx}] SOURCE: {title}\n{passage}\n")
-    return "\n".join(lines), id_to_title, id_to_passage
+        items.append(f"[{idx}] {make_label(title, text)}")
+    return "\n".join(lines), id_to_title, id_to_passage, " | ".join(items) if items else ""
+
+
+def build_ctx_and_maps(hits: Iterable[Dict]) -> Tuple[str, Dict[int, str], Dict[int, str]]:
+    """Create context block plus lookup maps from retrieved hits."""
+    ctx_block, id_to_title, id_to_passage, _ = build_prompt_assets(hits)
+    return ctx_block, id_to_title, id_to_passage
 
 
 def build_legend(hits: Iterable[Dict]) -> str:
     """Human-friendly legend showing retrieved sources and clause labels."""
-    items: List[str] = []
-    for idx, chunk in enumerate(hits, start=1):
-        title = short_title(chunk["path"])
-        passage = chunk.get("text") or ""
-        label = make_label(title, passage)
-        items.append(f"[{idx}] {label}")
-    return " | ".join(items) if items else ""
+    return build_prompt_assets(hits)[3]
 
 
-def build_prompt(question: str, ctx_block: str) -> str:
-    """Construct the retrieval-augmented prompt with explicit instructions."""
-    return f"""
-You are a registered-psychologist style assistant answering a client's question in AUSTRALIA.
+# The instructions are fixed; only the question and context vary per request.
+_PROMPT_HEAD = """You are a registered-psychologist style assistant answering a client's question in AUSTRALIA.
 
 USE ONLY the Context. If the Context is insufficient, say you’re unsure and what would help.
 
@@ -75,14 +78,20 @@ PRIORITIES:
 3) Be clear, client-friendly, and concise.
 
 Question:
-{question}
+"""
+_PROMPT_MID = """
 
 Context (numbered sources — each begins with SOURCE: <title>):
-{ctx_block}
+"""
+_PROMPT_TAIL = """
+
+Answer:"""
+
 
-Answer:
-""".strip()
+def build_prompt(question: str, ctx_block: str) -> str:
+    """Construct the retrieval-augmented prompt with explicit instructions."""
+    return "".join((_PROMPT_HEAD, question, _PROMPT_MID, ctx_block, _PROMPT_TAIL))
 
 
-__all__ = ["add_titles_to_cites", "build_ctx_and_maps", "build_legend", "build_prompt"]
+__all__ = ["add_titles_to_cites", "build_ctx_and_maps", "build_legend", "build_prompt", "build_prompt_assets"]
 
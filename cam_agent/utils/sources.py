@@ -5,8 +5,15 @@ Source and citation helpers shared across CAM components.
 from __future__ import annotations
 
 import re
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set
+
+try:  # pragma: no cover - optional dependency
+    import hyperscan  # type: ignore
+except ImportError:  # pragma: no cover - handled at runtime
+    hyperscan = None
 
 SECTION_PATTERNS = (
     r"(A\.\d+(?:\.\d+)?)",  # APS Code: A.5.2 etc.
@@ -14,34 +21,93 @@ SECTION_PATTERNS = (
     r"(s\s*\d+[A-Za-z]?)",  # s 150
     r"(section\s*\d+[A-Za-z]?)",  # section 150
 )
+# Kept as separate patterns tried in priority order; a single alternation would return
+# the leftmost marker of any kind instead of the highest-priority one.
+_SECTION_REGEXES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in SECTION_PATTERNS)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _build_section_database():
+    """One Hyperscan database over SECTION_PATTERNS, or None when hyperscan is unavailable."""
+    if hyperscan is None:
+        return None
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH
+    database = hyperscan.Database()
+    try:
+        database.compile(
+            expressions=[pattern.encode("utf-8") for pattern in SECTION_PATTERNS],
+            ids=list(range(len(SECTION_PATTERNS))),
+            elements=len(SECTION_PATTERNS),
+            flags=flags,
+        )
+    except hyperscan.error as exc:  # pragma: no cover - depends on the hyperscan build
+        print(f"[kb] Warning: hyperscan could not compile section patterns ({exc}); using re.")
+        return None
+    return database
+
+
+_SECTION_DB = _build_section_database()
+# A database holds one scratch space, which concurrent scans must not share.
+_SECTION_DB_LOCK = threading.Lock()
+_TITLE_MAPPING = {
+    "APS Code of Ethics": "APS Code of Ethics",
+    "Ahpra and National Boards  Regulatory guide a full guide": "Ahpra/National Boards Regulatory Guide (Jul 2024)",
+    "The Act  2009 045": "Health Practitioner Regulation National Law Act 2009",
+    "The australian privacy principles": "Privacy Act 1988 (Cth) — Australian Privacy Principles (APPs)",
+}
+_NORMALIZED_TITLES = tuple((_WHITESPACE_RE.sub(" ", key.lower()), value) for key, value in _TITLE_MAPPING.items())
 
 
+@lru_cache(maxsize=512)
 def short_title(path: str) -> str:
     """Normalise file stems into readable source titles."""
     stem_raw = Path(path).stem.replace("_", " ").replace("-", " ").strip()
-    stem = re.sub(r"\s+", " ", stem_raw)
-    mapping = {
-        "APS Code of Ethics": "APS Code of Ethics",
-        "Ahpra and National Boards  Regulatory guide a full guide": "Ahpra/National Boards Regulatory Guide (Jul 2024)",
-        "The Act  2009 045": "Health Practitioner Regulation National Law Act 2009",
-        "The australian privacy principles": "Privacy Act 1988 (Cth) — Australian Privacy Principles (APPs)",
-    }
-    for key, value in mapping.items():
-        normalized_key = re.sub(r"\s+", " ", key.lower())
-        if normalized_key in stem.lower():
+    stem = _WHITESPACE_RE.sub(" ", stem_raw)
+    stem_lower = stem.lower()
+    for normalized_key, value in _NORMALIZED_TITLES:
+        if normalized_key in stem_lower:
             return value
     return stem
 
 
+@lru_cache(maxsize=2048)
 def extract_section(text: str) -> Optional[str]:
     """Extract the first clause/section marker from supplied text."""
-    for pattern in SECTION_PATTERNS:
-        match = re.search(pattern, text, flags=re.IGNORECASE)
+    candidates = _matching_section_ids(text)
+    for pattern_id, regex in enumerate(_SECTION_REGEXES):
+        if candidates is not None and pattern_id not in candidates:
+            continue
+        match = regex.search(text)
         if match:
             return match.group(1).strip()
     return None
 
 
+def _matching_section_ids(text: str) -> Optional[Set[int]]:
+    """
+    Ids of SECTION_PATTERNS occurring in `text`, from one Hyperscan pass.
+
+    Only used to skip patterns that cannot match; `re` still picks the span.
+    Returns None (try every pattern) without hyperscan, and for text holding
+    U+017F, which `re` folds to "s" but Hyperscan's caseless mode does not,
+    or lone surrogates, which are not valid UTF-8.
+    """
+    if _SECTION_DB is None or "\u017f" in text:
+        return None
+    try:
+        data = text.encode("utf-8")
+    except UnicodeEncodeError:
+        return None
+    found: Set[int] = set()
+
+    def on_match(pattern_id: int, start: int, end: int, flags: int, context: object) -> None:
+        found.add(pattern_id)
+
+    with _SECTION_DB_LOCK:
+        _SECTION_DB.scan(data, match_event_handler=on_match)
+    return found
+
+
 def make_label(title: str, passage: str) -> str:
     """Combine source title with clause annotation when available."""
     section = extract_section(passage or "")
@@ -18,15 +18,10 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+from cam_agent.evaluation.config import load_questions
 from cam_agent.evaluation.judges import JudgeManager, build_default_judges
 from cam_agent.evaluation.runner import CAMSuiteRunner
-from cam_agent.knowledge import (
-    build_faiss_index,
-    build_store,
-    chunk_documents,
-    ensure_documents,
-    generate_digest,
-)
+from cam_agent.knowledge import digest_is_current, ensure_documents, generate_digest, refresh_store
 
 
 def parse_args() -> argparse.Namespace:
@@ -40,11 +35,28 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--json_out", type=Path, default=Path("project_bundle") / "cam_suite_report.json")
     parser.add_argument("--scenarios", default=None, help="Comma-separated scenario IDs (default: A-F)")
     parser.add_argument("--refresh-store", action="store_true", help="Rebuild FAISS index and chunks.json")
+    parser.add_argument(
+        "--full-refresh",
+        action="store_true",
+        help="With --refresh-store, re-chunk and re-embed every PDF instead of only changed ones",
+    )
     parser.add_argument("--force-download", action="store_true", help="Re-download PDFs even if present")
     parser.add_argument("--summariser-model", default=None, help="Optional Ollama model for digest summaries")
     parser.add_argument("--embed-model", default="sentence-transformers/all-MiniLM-L6-v2")
     parser.add_argument("--chunk-size-words", type=int, default=280)
     parser.add_argument("--overlap-words", type=int, default=60)
+    parser.add_argument(
+        "--index-type",
+        choices=("flat", "hnsw", "ivf", "ivfpq", "auto"),
+        default="flat",
+        help="FAISS index type used when refreshing the store",
+    )
+    parser.add_argument(
+        "--quantization",
+        choices=("none", "fp16", "int8"),
+        default="none",
+        help="Scalar-quantise stored vectors when refreshing the store",
+    )
     parser.add_argument("--enable-med-judge", action="store_true", help="Include medgemma3-27B judge")
     parser.add_argument("--enable-gemini-judge", action="store_true", help="Include Gemini Flash judge")
     parser.add_argument("--no-judges", action="store_true", help="Skip all judge evaluations")
@@ -94,11 +106,7 @@ def run_pipeline() -> None:
         print_step(f"Judge mode override: {args.judge_mode}")
 
     try:
-        questions = [
-            line.strip()
-            for line in args.questions_file.read_text(encoding="utf-8").splitlines()
-            if line.strip()
-        ]
+        questions = load_questions(args.questions_file)
     except FileNotFoundError:
         print_step(f"ERROR: questions file not found at {args.questions_file}")
         sys.exit(1)
@@ -119,15 +127,17 @@ def run_pipeline() -> None:
 
     if args.refresh_store:
         try:
-            print_step("Chunking regulatory PDFs …")
-            chunks = chunk_documents(
+            print_step("Refreshing RAG store from regulatory PDFs …")
+            refresh_store(
+                args.store_dir,
                 ingestion.documents,
+                embed_model=args.embed_model,
                 chunk_size_words=args.chunk_size_words,
                 overlap_words=args.overlap_words,
+                index_type=args.index_type,
+                quantization=args.quantization,
+                incremental=not args.full_refresh,
             )
-            print_step(f"Built {len(chunks)} chunks; embedding with {args.embed_model}")
-            index, _embeddings = build_faiss_index(chunks, embed_model=args.embed_model)
-            build_store(args.store_dir, chunks, index)
         except Exception as exc:
             print_step(f"ERROR: failed to refresh RAG store: {exc}")
             sys.exit(1)
@@ -135,7 +145,13 @@ def run_pipeline() -> None:
         print_step("Using existing RAG store (refresh-store flag not set)")
 
     try:
-        if args.refresh_store or not args.digest_path.exists():
+        if args.refresh_store and digest_is_current(
+            ingestion.documents,
+            digest_path=args.digest_path,
+            summariser_model=args.summariser_model,
+        ):
+            print_step(f"Digest at {args.digest_path} is up to date (documents and summariser unchanged)")
+        elif args.refresh_store or not args.digest_path.exists():
             print_step("Generating regulatory digest …")
             generate_digest(
                 ingestion.documents,
@@ -7,6 +7,7 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
+from cam_agent.evaluation.config import load_questions
 from cam_agent.evaluation.judges import JudgeManager, build_default_judges
 from cam_agent.evaluation.runner import CAMSuiteRunner
 
@@ -32,11 +33,7 @@ def parse_args() -> argparse.Namespace:
 def main() -> None:
     args = parse_args()
 
-    questions = [
-        line.strip()
-        for line in args.questions_file.read_text(encoding="utf-8").splitlines()
-        if line.strip()
-    ]
+    questions = load_questions(args.questions_file)
 
     scenario_ids = (
         [token.strip() for token in args.scenarios.split(",") if token.strip()]
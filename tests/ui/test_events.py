@@ -0,0 +1,88 @@
+import json
+from dataclasses import asdict
+from datetime import datetime, timezone
+
+import pytest
+
+from cam_agent.ui.events import (
+    EventSource,
+    JudgeVerdictEvent,
+    LLMResponseEvent,
+    RunMetadata,
+    UserPromptEvent,
+    ViolationDetail,
+    build_timeline_event,
+)
+from cam_agent.ui.schema import serialize_timeline_event, serialize_timeline_event_bytes
+
+
+def test_payload_builders_match_asdict():
+    created = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    source = EventSource(model_id="m", provider="pipeline", mode="rag", metadata={"scenario": "A"})
+    payloads = [
+        UserPromptEvent(exchange_id="x", turn_index=0, source=source, created_at=created, prompt_text="hi"),
+        LLMResponseEvent(
+            exchange_id="x",
+            turn_index=0,
+            source=source,
+            created_at=created,
+            prompt_chars=2,
+            completion_chars=5,
+            token_usage={"prompt": 2},
+            pii_fields=["name"],
+        ),
+        JudgeVerdictEvent(
+            exchange_id="x",
+            turn_index=0,
+            source=source,
+            created_at=created,
+            verdict="warn",
+            violation=ViolationDetail(category="APP6", severity="warn"),
+            metadata={"references": ["APP 6"]},
+        ),
+    ]
+    run = RunMetadata(run_id="run-1")
+
+    for payload in payloads:
+        event = build_timeline_event(run, "x", 0, "event", payload, created_at=created)
+        assert event.payload == asdict(payload)
+        assert list(event.payload) == list(asdict(payload))
+
+
+def test_small_metadata_dicts_are_shared_between_events():
+    first = EventSource(model_id="m", provider="pipeline", metadata={"scenario": "A"})
+    second = EventSource(model_id="m", provider="pipeline", metadata={"scenario": "A"})
+    assert first.metadata is second.metadata
+    assert RunMetadata(run_id="a", tags={"ui_live": "true"}).tags is RunMetadata(run_id="b", tags={"ui_live": "true"}).tags
+    assert not hasattr(first, "__dict__")
+
+
+def test_serialize_timeline_event_bytes_matches_dict_serialiser():
+    created = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    source = EventSource(model_id="m", provider="pipeline", metadata={"turn": 1})
+    payload = JudgeVerdictEvent(
+        exchange_id="x",
+        turn_index=0,
+        source=source,
+        created_at=created,
+        verdict="warn",
+        violation=ViolationDetail(category="APP6", severity="warn"),
+        metadata={"references": ("APP 6",)},
+    )
+    event = build_timeline_event(RunMetadata(run_id="run-1", started_at=created), "x", 0, "judge_verdict", payload)
+
+    assert json.loads(serialize_timeline_event_bytes(event)) == serialize_timeline_event(event)
+
+
+def test_interned_metadata_keeps_value_types_and_ignores_caller_mutation():
+    assert EventSource(model_id="m", provider="p", metadata={"live": 1}).metadata == {"live": 1}
+    flag = EventSource(model_id="m", provider="p", metadata={"live": True}).metadata
+    assert flag["live"] is True
+
+    tags = {"ui_live": "yes"}
+    run = RunMetadata(run_id="a", tags=tags)
+    tags["x"] = "y"
+    assert run.tags == {"ui_live": "yes"}
+    assert RunMetadata(run_id="b", tags={"ui_live": "yes"}).tags == {"ui_live": "yes"}
+    with pytest.raises(TypeError):
+        run.tags["x"] = "y"
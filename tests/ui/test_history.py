@@ -0,0 +1,42 @@
+import json
+
+from cam_agent.ui.history import AuditLogHistoricalRunLoader, run_id_needles
+
+
+def test_run_id_needles_cover_fallback_run_ids():
+    records = [
+        {"run_id": "cam-eval-1a-A"},
+        {"user_id": "demo", "session_id": "session-1"},
+        {"user_id": 7, "session_id": "abc"},
+        {"session": "s-9"},
+    ]
+    for record in records:
+        run_id = AuditLogHistoricalRunLoader._extract_run_id(record)
+        line = json.dumps(record).encode("utf-8")
+        needles = run_id_needles(run_id)
+        assert needles is not None
+        assert any(needle in line for needle in needles)
+
+    other = json.dumps({"run_id": "cam-eval-2b-B", "user_id": "ui"}).encode("utf-8")
+    assert not any(needle in other for needle in run_id_needles("demo-session-1"))
+
+
+def test_run_id_needles_disabled_for_numeric_ids():
+    assert run_id_needles("42") is None
+    assert run_id_needles("1-2") is None
+    assert run_id_needles("unknown-run") is None
+
+
+def test_iter_timeline_events_skips_other_runs_before_parsing(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    lines = [
+        json.dumps({"run_id": "run-a", "timestamp": "2025-01-01T00:00:00Z", "final_text": "a"}),
+        "{not json but mentions run-b",
+        json.dumps({"run_id": "run-b", "timestamp": "2025-01-01T00:00:01Z", "final_text": "b"}),
+    ]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    events = list(AuditLogHistoricalRunLoader(path=path).iter_timeline_events("run-a"))
+
+    assert events
+    assert {event.run.run_id for event in events} == {"run-a"}
@@ -0,0 +1,70 @@
+import json
+
+import pytest
+
+from cam_agent.storage.audit import AsyncJsonlAuditLogger, JsonlAuditLogger
+from cam_agent.services.types import QueryRequest
+
+
+def test_judge_records_are_visible_before_close(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    request = QueryRequest(user_id="u1", question="What does APP 6 allow?")
+
+    with JsonlAuditLogger(path) as logger:
+        logger.log_judge_results(
+            request,
+            scenario_id="A",
+            cam_action="allow",
+            judge_results={"judge": {"status": "ok"}},
+            metadata={"run_id": "run-1", "turn_index": 0},
+        )
+        records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+    assert len(records) == 1
+    assert records[0]["event_type"] == "external_judge"
+    assert records[0]["run_id"] == "run-1"
+    assert records[0]["turn_index"] == 0
+
+
+def test_async_logger_flush_writes_queued_records_in_order(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    request = QueryRequest(user_id="u1", question="q")
+    logger = AsyncJsonlAuditLogger(path, batch_size=4)
+
+    for idx in range(10):
+        logger.log_judge_results(request, scenario_id="A", cam_action="allow", judge_results={"idx": idx})
+    logger.flush()
+    written = [json.loads(line)["judge_results"]["idx"] for line in path.read_text(encoding="utf-8").splitlines()]
+    logger.close()
+
+    assert written == list(range(10))
+
+
+def test_async_logger_bounded_queue_applies_backpressure(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    request = QueryRequest(user_id="u1", question="q")
+    logger = AsyncJsonlAuditLogger(path, batch_size=2, max_pending=2)
+
+    for idx in range(50):
+        logger.log_judge_results(request, scenario_id="A", cam_action="allow", judge_results={"idx": idx})
+    logger.close()
+
+    written = [json.loads(line)["judge_results"]["idx"] for line in path.read_text(encoding="utf-8").splitlines()]
+    assert written == list(range(50))
+
+
+def test_async_logger_serialises_on_caller_thread(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    request = QueryRequest(user_id="u1", question="q")
+    logger = AsyncJsonlAuditLogger(path)
+    results = {"idx": 0}
+
+    logger.log_judge_results(request, scenario_id="A", cam_action="allow", judge_results=results)
+    results["idx"] = 1
+    with pytest.raises(TypeError):
+        logger.log_judge_results(request, scenario_id="A", cam_action="allow", judge_results={"bad": object()})
+    logger.close()
+    logger.flush()
+
+    written = [json.loads(line)["judge_results"] for line in path.read_text(encoding="utf-8").splitlines()]
+    assert written == [{"idx": 0}]
@@ -1,6 +1,12 @@
 from pathlib import Path
 
-from cam_agent.utils.checksum import compute_directory_checksums, verify_checksums, save_checksums, load_checksums
+from cam_agent.utils.checksum import (
+    compute_directory_checksums,
+    load_checksums,
+    save_checksums,
+    verify_checksums,
+    verify_directory_checksums,
+)
 
 
 def test_compute_and_verify_checksums(tmp_path):
@@ -29,3 +35,19 @@ def test_save_and_load_checksums(tmp_path):
     save_checksums(path, payload)
     loaded = load_checksums(path)
     assert loaded == payload
+
+
+def test_prefixed_checksums_verify_with_their_algorithm(tmp_path):
+    (tmp_path / "index.faiss").write_bytes(b"vectors" * 1000)
+    (tmp_path / "chunks.json").write_text("[]", encoding="utf-8")
+
+    legacy = compute_directory_checksums(tmp_path)
+    fast = compute_directory_checksums(tmp_path, algorithm="blake2b")
+    assert all(":" not in digest for digest in legacy.values())
+    assert all(digest.startswith("blake2b:") for digest in fast.values())
+
+    assert verify_directory_checksums(tmp_path, legacy) == (True, {})
+    assert verify_directory_checksums(tmp_path, fast) == (True, {})
+    (tmp_path / "index.faiss").write_bytes(b"changed")
+    ok, mismatches = verify_directory_checksums(tmp_path, fast)
+    assert not ok and list(mismatches) == ["index.faiss"]
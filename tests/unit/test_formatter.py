@@ -0,0 +1,35 @@
+from cam_agent.services.formatter import (
+    enrich_citations,
+    postprocess_answer,
+    prepare_context,
+    sanitize_legal_references,
+)
+
+
+CONTEXT = "APP 6.2(b) permits disclosure. Privacy Act s 16A(1) applies."
+
+
+def test_sanitize_keeps_references_present_in_context():
+    answer = "Under APP 6.2(b) and section 16A(1), disclosure is permitted."
+    assert sanitize_legal_references(answer, CONTEXT) == (
+        "Under APP 6.2(b) and section 16A(1), disclosure is permitted."
+    )
+
+
+def test_sanitize_falls_back_to_parent_clause():
+    answer = "See APP 6.1 and s 16A(3)."
+    assert sanitize_legal_references(answer, CONTEXT) == "See APP 6 and section 16A(3)."
+
+
+def test_sanitize_drops_unknown_references():
+    answer = "APP 11 and section 150 apply."
+    assert sanitize_legal_references(answer, CONTEXT) == "APP and section apply."
+
+
+def test_postprocess_matches_enrich_then_sanitize():
+    hits = [{"path": "docs/The-Act-2009-045.pdf", "text": "Under s 150 the Board may act."}]
+    context = prepare_context(hits)
+    answer = "The Board may act under s 150 (see [1]) but not APP 6 (see [2])."
+    expected = sanitize_legal_references(enrich_citations(answer, context), context.ctx_block)
+    assert postprocess_answer(answer, context, context.ctx_block) == expected
+    assert "(Health Practitioner Regulation National Law Act 2009 — section 150; see [1])" in expected
@@ -0,0 +1,114 @@
+import threading
+import time
+
+from cam_agent.evaluation.judges import BaseJudge, JudgeManager, JudgeResult, OllamaJudge
+from cam_agent.services.models import LLMResponse
+
+
+class _SlowJudge(BaseJudge):
+    def __init__(self, judge_id, *, fail=False):
+        self.judge_id = judge_id
+        self.fail = fail
+        self.thread = None
+
+    def evaluate(self, *, question, final_text, raw_text, retrieval_context, digest_text):
+        self.thread = threading.get_ident()
+        time.sleep(0.05)
+        if self.fail:
+            return None
+        return JudgeResult(
+            judge_id=self.judge_id,
+            helpfulness=4.0,
+            compliance=5.0,
+            reasoning=question,
+            raw_text="{}",
+            model="m",
+        )
+
+
+def test_evaluate_runs_judges_concurrently_in_order():
+    judges = [_SlowJudge("a"), _SlowJudge("b", fail=True), _SlowJudge("c")]
+    manager = JudgeManager(judges, max_concurrency=3)
+
+    results = manager.evaluate(question="q", final_text="f", raw_text="r", retrieval_context="")
+
+    assert [result.judge_id for result in results] == ["a", "c"]
+    assert all(result.latency_ms >= 40 for result in results)
+    assert list(manager.failure_stats) == ["b"]
+    assert len({judge.thread for judge in judges}) == 3
+
+
+class _JsonClient:
+    api_mode = "ollama"
+    endpoint = "http://judge"
+
+    def __init__(self, text):
+        self.text = text
+        self.prompts = []
+
+    def call(self, model, prompt, **kwargs):
+        self.prompts.append(prompt)
+        return LLMResponse(
+            text=self.text, model=model, prompt=prompt, temperature=0.0, num_ctx=0, num_predict=None, seed=None
+        )
+
+
+def test_same_backend_judges_share_one_call():
+    client = _JsonClient(
+        '{"strict": {"helpfulness": 3, "compliance": 1, "reasoning": "s"},'
+        ' "lenient": {"helpfulness": 5, "compliance": 4.5, "reasoning": "l"}}'
+    )
+    judges = [
+        OllamaJudge("m", judge_id="strict", llm_client=client),
+        OllamaJudge("m", judge_id="lenient", llm_client=client),
+    ]
+    manager = JudgeManager(judges, fuse=True)
+
+    results = manager.evaluate(question="q", final_text="f", raw_text="r", retrieval_context="")
+
+    assert len(client.prompts) == 1
+    assert '"strict"' in client.prompts[0] and '"lenient"' in client.prompts[0]
+    assert [(r.judge_id, r.compliance, r.verdict) for r in results] == [
+        ("strict", 1.0, "block"),
+        ("lenient", 4.5, "allow"),
+    ]
+
+
+def test_fused_reply_that_is_not_an_object_falls_back_per_judge():
+    client = _JsonClient('[{"helpfulness": 4, "compliance": 4, "reasoning": "x"}]')
+    judges = [
+        OllamaJudge("m", judge_id="strict", llm_client=client),
+        OllamaJudge("m", judge_id="lenient", llm_client=client),
+    ]
+    manager = JudgeManager(judges, fuse=True)
+
+    results = manager.evaluate(question="q", final_text="f", raw_text="r", retrieval_context="")
+
+    assert results == []
+    assert len(client.prompts) == 3
+    assert list(manager.failure_stats) == ["strict", "lenient"]
+
+
+def test_fusing_is_opt_in_and_latency_is_per_judge(monkeypatch):
+    monkeypatch.delenv("CAM_JUDGE_FUSE", raising=False)
+    client = _JsonClient('{"strict": {"helpfulness": 3, "compliance": 1, "reasoning": "s"}}')
+    judges = [
+        OllamaJudge("m", judge_id="strict", llm_client=client),
+        OllamaJudge("m", judge_id="lenient", llm_client=client),
+    ]
+    assert JudgeManager(judges).fuse is False
+
+    original_call = client.call
+
+    def slow_single_call(model, prompt, **kwargs):
+        if '"strict"' not in prompt:
+            time.sleep(0.05)
+        return original_call(model, prompt, **kwargs)
+
+    client.call = slow_single_call
+    manager = JudgeManager(judges, fuse=True)
+    results = manager.evaluate(question="q", final_text="f", raw_text="r", retrieval_context="")
+
+    assert len(client.prompts) == 2
+    latencies = {result.judge_id: result.latency_ms for result in results}
+    assert latencies["strict"] < 40 <= latencies["lenient"]
@@ -0,0 +1,36 @@
+import numpy as np
+
+from cam_agent.knowledge import pipeline
+
+
+class _CountingEncoder:
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, texts, normalize_embeddings=True, batch_size=32):
+        self.encoded.extend(texts)
+        vectors = np.array([[len(text), text.count("a") + 1.0] for text in texts], dtype="float32")
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def test_refresh_store_reembeds_only_changed_documents(tmp_path, monkeypatch):
+    encoder = _CountingEncoder()
+    monkeypatch.setattr(pipeline, "load_encoder", lambda model, factory: encoder)
+    monkeypatch.setattr(pipeline, "extract_pdf_text", lambda doc: [doc.read_text(encoding="utf-8")])
+    monkeypatch.setenv("CAM_CHUNK_PARALLEL", "0")
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    for name, text in (("a.pdf", "alpha clause"), ("b.pdf", "beta clause")):
+        (docs_dir / name).write_text(text, encoding="utf-8")
+    documents = sorted(docs_dir.glob("*.pdf"))
+    store = tmp_path / "store"
+
+    pipeline.refresh_store(store, documents)
+    (docs_dir / "b.pdf").write_text("beta clause amended", encoding="utf-8")
+    encoder.encoded.clear()
+    chunks = pipeline.refresh_store(store, documents)
+
+    assert encoder.encoded == ["beta clause amended"]
+    assert [chunk.text for chunk in chunks] == ["alpha clause", "beta clause amended"]
+    embeddings = np.load(store / "embeddings.npy")
+    np.testing.assert_allclose(embeddings, encoder.encode([chunk.text for chunk in chunks]))
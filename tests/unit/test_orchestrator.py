@@ -0,0 +1,69 @@
+import threading
+
+from cam_agent.config.models import ModelConfig
+from cam_agent.services.models import LLMResponse
+from cam_agent.services.orchestrator import ScenarioExecutor
+from cam_agent.services.retrieval import RetrievalResult
+from cam_agent.services.types import QueryRequest
+
+
+class _RecordingClient:
+    def __init__(self):
+        self.threads = set()
+
+    def call(self, model, prompt, **kwargs):
+        self.threads.add(threading.get_ident())
+        return LLMResponse(
+            text=f"answer to {prompt}",
+            model=model,
+            prompt=prompt,
+            temperature=kwargs.get("temperature", 0.0),
+            num_ctx=kwargs.get("num_ctx", 0),
+            num_predict=kwargs.get("num_predict"),
+            seed=kwargs.get("seed"),
+        )
+
+
+def test_execute_many_preserves_request_order():
+    client = _RecordingClient()
+    executor = ScenarioExecutor(config=ModelConfig(name="m", use_rag=False), llm_client=client)
+    requests = [QueryRequest(user_id="u1", question=f"q{i}") for i in range(6)]
+
+    outputs = executor.execute_many(requests, max_workers=3)
+
+    assert [output.text for output in outputs] == [f"answer to q{i}" for i in range(6)]
+    assert threading.get_ident() not in client.threads
+    assert outputs[0].text == executor.execute(requests[0]).text
+
+
+class _CountingRetrieval:
+    def __init__(self):
+        self.batches = []
+        self.single = 0
+
+    def search_many(self, queries, *, top_k, min_sim):
+        self.batches.append(list(queries))
+        return [RetrievalResult(hits=[{"path": "doc.pdf", "text": f"passage for {q}"}], scores=[0.9]) for q in queries]
+
+    def search(self, query, *, top_k, min_sim):
+        self.single += 1
+        return RetrievalResult(hits=[], scores=[])
+
+
+def test_prefetch_batches_retrieval_for_later_executes():
+    retrieval = _CountingRetrieval()
+    executor = ScenarioExecutor(
+        config=ModelConfig(name="m", use_rag=True),
+        store_dir="unused",
+        llm_client=_RecordingClient(),
+    )
+    executor._retrieval = retrieval
+
+    executor.prefetch(["q1", "q2", "q1"])
+    outputs = [executor.execute(QueryRequest(user_id="u1", question=q)) for q in ("q1", "q2")]
+
+    assert retrieval.batches == [["q1", "q2"]]
+    assert retrieval.single == 0
+    assert all(output.retrieved_hits for output in outputs)
+    executor.execute(QueryRequest(user_id="u1", question="q1"))
+    assert retrieval.single == 1
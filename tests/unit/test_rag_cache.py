@@ -0,0 +1,82 @@
+import numpy as np
+
+from cam_agent.config.models import ModelConfig
+from cam_agent.services.cam_agent import CAMAgent
+from cam_agent.services.rag_cache import ResponseCache
+from cam_agent.services.types import ModelOutput, QueryRequest
+
+
+def _output(text):
+    return ModelOutput(
+        text=text,
+        model="m",
+        prompt="p",
+        retrieval_context="ctx",
+        legend="",
+        retrieved_hits=[{"path": "doc.pdf", "text": "t"}],
+    )
+
+
+def _unit(*values):
+    vector = np.asarray(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def test_exact_and_semantic_hits_round_trip_through_file(tmp_path):
+    path = tmp_path / "cache.jsonl"
+    cache = ResponseCache(fingerprint="store-1", semantic_threshold=0.95, path=path)
+    key = cache.key("A", "m", "What is APP 6?")
+    cache.put(key, "A", _output("answer"), _unit(1.0, 0.0))
+
+    assert cache.get(key).text == "answer"
+    assert cache.get_similar("A", _unit(1.0, 0.1)).text == "answer"
+    assert cache.get_similar("A", _unit(0.0, 1.0)) is None
+    assert cache.get_similar("B", _unit(1.0, 0.0)) is None
+
+    reloaded = ResponseCache(fingerprint="store-1", path=path)
+    assert reloaded.get(key).retrieved_hits == [{"path": "doc.pdf", "text": "t"}]
+
+    rebuilt_store = ResponseCache(fingerprint="store-2", path=path)
+    assert len(rebuilt_store) == 0
+
+
+def test_lru_eviction():
+    cache = ResponseCache(max_entries=2)
+    keys = [cache.key("A", "m", f"q{i}") for i in range(3)]
+    for index, key in enumerate(keys):
+        cache.put(key, "A", _output(str(index)))
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[2]).text == "2"
+
+
+class _StubExecutor:
+    def __init__(self):
+        self.config = ModelConfig(name="m", use_rag=True)
+        self.calls = 0
+
+    def execute(self, request):
+        self.calls += 1
+        return _output(f"answer to {request.question}")
+
+    def embed_question(self, question):
+        return _unit(1.0, 0.0) if "APP 6" in question else _unit(0.0, 1.0)
+
+
+def test_cache_hits_are_marked_in_output_metadata(tmp_path):
+    agent = CAMAgent(
+        store_dir=None,
+        audit_log_path=tmp_path / "audit.jsonl",
+        response_cache=ResponseCache(semantic_threshold=0.95),
+    )
+    executor = _StubExecutor()
+
+    fresh = agent._execute("A", executor, QueryRequest(user_id="u", question="What is APP 6?"))
+    exact = agent._execute("A", executor, QueryRequest(user_id="u", question="What is APP 6?"))
+    similar = agent._execute("A", executor, QueryRequest(user_id="u", question="Explain APP 6"))
+
+    assert executor.calls == 1
+    assert "response_cache" not in fresh.metadata
+    assert exact.metadata == {"response_cache": "exact"}
+    assert similar.metadata["response_cache"] == "semantic"
+    assert similar.metadata["response_cache_similarity"] >= 0.95
+    assert exact is not fresh and exact.metadata is not similar.metadata
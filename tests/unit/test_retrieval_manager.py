@@ -51,3 +51,38 @@ def test_retrieval_manager_filters_low_similarity(mock_store, monkeypatch):
     result = rm.search("irrelevant", top_k=2, min_sim=0.5)
     assert result.hits == []
     assert result.scores == []
+
+
+def test_query_embeddings_are_shared_between_managers(mock_store, monkeypatch):
+    from cam_agent.services import retrieval
+
+    calls = []
+
+    def fake_encode(self, texts, normalize_embeddings=True, batch_size=32):
+        calls.append(list(texts))
+        return np.array([[1.0, 0.0]] * len(texts))
+
+    monkeypatch.setattr("cam_agent.services.retrieval.SentenceTransformer.encode", fake_encode)
+    retrieval._QUERY_EMBEDDINGS.clear()
+
+    first = RetrievalManager(mock_store, embed_model="dummy-model")
+    second = RetrievalManager(mock_store, embed_model="dummy-model")
+    first.search("shared  question ", top_k=2, min_sim=0.1)
+    results = second.search_many(["shared question", "new question"], top_k=2, min_sim=0.1)
+
+    assert calls == [["shared question"], ["new question"]]
+    assert [len(result.hits) for result in results] == [1, 1]
+
+
+def test_shared_retrieval_manager_reuses_until_store_changes(mock_store):
+    import os
+
+    from cam_agent.services.retrieval import shared_retrieval_manager
+
+    first = shared_retrieval_manager(mock_store, "dummy-model")
+    assert shared_retrieval_manager(mock_store, "dummy-model") is first
+
+    index_path = mock_store / "index.faiss"
+    stat = index_path.stat()
+    os.utime(index_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert shared_retrieval_manager(mock_store, "dummy-model") is not first
@@ -0,0 +1,32 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def _loaded_modules_after(snippet: str) -> set[str]:
+    code = f"import sys\n{snippet}\nprint('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=str(ROOT),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+def test_services_package_import_is_lazy():
+    loaded = _loaded_modules_after("import cam_agent.services")
+    assert "cam_agent.services.cam_agent" not in loaded
+    assert "cam_agent.services.retrieval" not in loaded
+    assert "sentence_transformers" not in loaded
+    assert "faiss" not in loaded
+
+
+def test_services_attribute_access_imports_only_owner_module():
+    loaded = _loaded_modules_after("from cam_agent.services import LLMClient")
+    assert "cam_agent.services.models" in loaded
+    assert "cam_agent.services.retrieval" not in loaded
+    assert "sentence_transformers" not in loaded